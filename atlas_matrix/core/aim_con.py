@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+""" DEP class to use constraint aim matrix inside Maya
+
+This module provides the `AimCon` class, which allows matrix-based aim constraint
+over objects using a single aimMatrix node per driver. It inherits from Matrix class.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# ---------- IMPORT ----------
+
+
+from typing import Optional, List, Tuple
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from atlas_matrix.core.matrix import Matrix
+from atlas_matrix.core.parent_con import AxisWeights
+from atlas_matrix.core import index
+from atlas_matrix.core.utils import naming, transform
+from atlas_matrix.core.utils.handles import HoldMatrixHandle, MultMatrixHandle
+
+
+# ---------- CONSTANTS ----------
+
+
+# aimMatrix.primaryMode enum values
+PRIMARY_MODES = {
+    "lock": 0,
+    "aim": 1,
+    "align": 2,
+}
+
+# aimMatrix.secondaryMode enum values
+SECONDARY_MODES = {
+    "none": 0,
+    "aim": 1,
+    "align": 2,
+}
+
+WORLD_UP_TYPES = ("constrained", "object", "none")
+
+
+# ---------- MAIN CLASS ----------
+
+
+class AimCon(Matrix):
+    """
+    Class to create a matrix-based aim constraint in Maya.
+
+    Each driver is aimed by a single aimMatrix node. The driven rest position is
+    fed into every aimMatrix, optionally stored in a holdMatrix, and multiple
+    drivers are blended by a blendMatrix exactly like ParentCon.
+    """
+    def __init__(
+            self,
+            driven: Optional[str] = None,
+            drivers: Optional[List[str]] = None,
+            *,
+            offset: bool = False,
+            keep_hold: bool = False,
+            envelope: bool = False,
+            primary_mode: str = "aim",
+            aim_vector: Tuple[float, float, float] = (1.0, 0.0, 0.0),
+            primary_target_vector: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+            secondary_mode: str = "align",
+            up_vector: Tuple[float, float, float] = (0.0, 1.0, 0.0),
+            secondary_target_vector: Tuple[float, float, float] = (0.0, 1.0, 0.0),
+            world_up_type: str = "none",
+            world_up_object: Optional[str] = None,
+            weights: AxisWeights = AxisWeights(),
+            **kwargs
+    ):
+        """
+        Initialize the AimCon constraint setup.
+
+        Args:
+            driven (Optional[str]): The name of the driven object.
+            drivers (Optional[List[str]]): A list of driver object names.
+            offset (bool): Keep the current orientation of the driven.
+            keep_hold (bool): Store the driven rest matrix inside a holdMatrix.
+            envelope (bool): Create the blend even with a single driver.
+            primary_mode (str): "aim", "lock" or "align".
+            aim_vector (Tuple[float, float, float]): The driven axis aiming at the driver.
+            primary_target_vector (Tuple[float, float, float]): The target vector used in "align" mode.
+            secondary_mode (str): "align", "aim" or "none".
+            up_vector (Tuple[float, float, float]): The driven axis used as up.
+            secondary_target_vector (Tuple[float, float, float]): The world up vector.
+            world_up_type (str): "none" (world space vector), "object" (world up object space)
+                or "constrained" (driven parent space).
+            world_up_object (Optional[str]): The world up object for "object" world up type.
+            weights (AxisWeights): The weights applied on the blend.
+            **kwargs: Matrix options (ancestry, weight_array).
+
+        Raises:
+            ValueError: If a mode or world up type is unknown.
+        """
+        super().__init__(driven, drivers, **kwargs)
+        self.constraint_type = "aim"
+        self.offset = offset
+        self.keep_hold = keep_hold
+        self.envelope = envelope
+
+        if primary_mode not in PRIMARY_MODES:
+            raise ValueError(f"Invalid primary mode: {primary_mode}")
+        if secondary_mode not in SECONDARY_MODES:
+            raise ValueError(f"Invalid secondary mode: {secondary_mode}")
+        if world_up_type not in WORLD_UP_TYPES:
+            raise ValueError(f"Invalid world up type: {world_up_type}")
+        if world_up_type == "object" and not world_up_object:
+            raise ValueError("Provide a world up object for the 'object' world up type.")
+
+        self.primary_mode = primary_mode
+        self.aim_vector = aim_vector
+        self.primary_target_vector = primary_target_vector
+        self.secondary_mode = secondary_mode
+        self.up_vector = up_vector
+        self.secondary_target_vector = secondary_target_vector
+        self.world_up_type = world_up_type
+        self.world_up_object = world_up_object
+        self.weights = weights or AxisWeights()
+
+
+    def dependencies(self) -> List[str]:
+        """Get the objects whose world matrix feeds the constraint, world up object included.
+
+        Returns:
+            List[str]: The driver and world up object names.
+        """
+        dependencies = list(self.drivers)
+        if self.world_up_type == "object" and self.world_up_object:
+            dependencies.append(self.world_up_object)
+        return dependencies
+
+
+    def _up_space(self) -> Optional[str]:
+        """
+        Get the object giving its space to the secondary target
+
+        Returns:
+            Optional[str]: The up object name, None for world space.
+        """
+        if self.world_up_type == "object":
+            return self.world_up_object
+        if self.world_up_type == "constrained":
+            parent = self.get_parent_driven()
+            return parent[0] if parent else None
+        return None
+
+
+    def _offset_axes(self, driver: str, rest_world: om.MMatrix) -> Tuple[om.MVector, om.MVector]:
+        """
+        Compute the input axes that keep the current orientation of the driven
+
+        Rather than adding an offset node after the aim, the primary and secondary
+        input axes are expressed in the driven rest space so the aimMatrix output
+        matches the current orientation.
+
+        Args:
+            driver (str): The name of the driver object.
+            rest_world (om.MMatrix): The world matrix of the driven before constraint.
+
+        Returns:
+            Tuple[om.MVector, om.MVector]: The primary and secondary input axes.
+        """
+        rest_inverse = rest_world.inverse()
+        position = om.MTransformationMatrix(rest_world).translation(om.MSpace.kWorld)
+
+        driver_world = om.MMatrix(cmds.getAttr(self.get_world_matrix(driver)))
+        if self.primary_mode == "aim":
+            primary = om.MTransformationMatrix(driver_world).translation(om.MSpace.kWorld) - position
+        elif self.primary_mode == "align":
+            primary = om.MVector(self.primary_target_vector) * driver_world
+        else:
+            primary = om.MVector(self.aim_vector) * rest_world
+
+        up_space = self._up_space()
+        up_world = om.MMatrix(cmds.getAttr(self.get_world_matrix(up_space))) if up_space else om.MMatrix()
+        if self.secondary_mode == "aim":
+            secondary = om.MTransformationMatrix(up_world).translation(om.MSpace.kWorld) - position
+        else:
+            secondary = om.MVector(self.secondary_target_vector) * up_world
+
+        return (primary * rest_inverse).normal(), (secondary * rest_inverse).normal()
+
+
+    def _setup_aim(self, driver: str, rest_world: om.MMatrix) -> Tuple[str, str]:
+        """
+        Create and configure the aimMatrix node of a driver
+
+        Args:
+            driver (str): The name of the driver object.
+            rest_world (om.MMatrix): The world matrix of the driven before constraint.
+
+        Returns:
+            Tuple[str, str]: The input and output matrix attributes of the aimMatrix.
+        """
+        aim = self.con_aim_matrix(driver)
+
+        aim_vector, up_vector = self.aim_vector, self.up_vector
+        if self.offset:
+            aim_vector, up_vector = self._offset_axes(driver, rest_world)
+
+        cmds.setAttr(aim.plug("primaryMode"), PRIMARY_MODES[self.primary_mode])
+        cmds.setAttr(aim.plug("primaryInputAxis"), *aim_vector)
+        cmds.setAttr(aim.plug("primaryTargetVector"), *self.primary_target_vector)
+        self.connect_attr(self.get_world_matrix(driver), aim.primary)
+
+        cmds.setAttr(aim.plug("secondaryMode"), SECONDARY_MODES[self.secondary_mode])
+        cmds.setAttr(aim.plug("secondaryInputAxis"), *up_vector)
+        cmds.setAttr(aim.plug("secondaryTargetVector"), *self.secondary_target_vector)
+        up_space = self._up_space()
+        if up_space:
+            self.connect_attr(self.get_world_matrix(up_space), aim.secondary)
+
+        return aim.input, aim.output
+
+
+    def helper_node(self, node_type: str, role: str) -> str:
+        """
+        Create a matrix node of the aim system that does not belong to a driver.
+
+        Args:
+            node_type (str): The Maya node type to create (e.g., "holdMatrix").
+            role (str): "rest" or "parent".
+
+        Returns:
+            str: The name of the created node.
+        """
+        return cmds.createNode(node_type, name=naming.aim_helper_name(node_type, self.driven, role))
+
+
+    def create_rest(self, parent_node: Optional[str], rest_world: om.MMatrix) -> Optional[str]:
+        """
+        Create the rest system feeding the driven position to every aimMatrix
+
+        Args:
+            parent_node (Optional[str]): The parent of the driven, None at world root.
+            rest_world (om.MMatrix): The world matrix of the driven before constraint.
+
+        Returns:
+            Optional[str]: The rest world matrix attribute, None if the rest is static.
+        """
+        rest_local = rest_world
+        if parent_node:
+            rest_local = rest_world * om.MMatrix(cmds.getAttr(self.get_inverse_world_matrix(parent_node)))
+
+        rest_out = None
+        if self.keep_hold:
+            hold = HoldMatrixHandle(self.helper_node("holdMatrix", "rest"))
+            cmds.setAttr(hold.input, *list(rest_local), type="matrix")
+            rest_out = hold.output
+
+        if parent_node:
+            mult = MultMatrixHandle(self.helper_node("multMatrix", "rest"))
+            if rest_out:
+                self.connect_attr(rest_out, mult.matrix_in(0))
+            else:
+                cmds.setAttr(mult.matrix_in(0), *list(rest_local), type="matrix")
+            self.connect_attr(self.get_world_matrix(parent_node), mult.matrix_in(1))
+            rest_out = mult.output
+
+        return rest_out
+
+
+    def mount_system(self):
+        """
+        Internal setup to create the constraint chain and connect it.
+        """
+        self.validate_hierarchy()
+
+        with self.undo_chunk(name="create"):
+            parent_result = self.get_parent_driven()
+            parent_node = parent_result[0] if parent_result else None
+
+            rest_world = om.MMatrix(cmds.getAttr(self.get_world_matrix(self.driven)))
+
+            self.preserve_initial_transform()
+            self.preserve_initial_matrix()
+
+            rest_out = self.create_rest(parent_node, rest_world)
+
+            # Setup of the aim system
+            aim_outs = []
+            for driver in self.drivers:
+                aim_in, aim_out = self._setup_aim(driver, rest_world)
+                if rest_out:
+                    self.connect_attr(rest_out, aim_in)
+                else:
+                    cmds.setAttr(aim_in, *list(rest_world), type="matrix")
+                aim_outs.append(aim_out)
+
+            # Setup of the blend system, channel weights use the native blendMatrix target weights
+            channel_weights = self.weights.channels()
+            if len(self.drivers) > 1 or self.envelope or channel_weights:
+                blend_input, world_out = self.create_blend(aim_outs, self.weights.all, channel_weights)
+                if self.envelope:
+                    if rest_out:
+                        self.connect_attr(rest_out, blend_input)
+                    else:
+                        cmds.setAttr(blend_input, *list(rest_world), type="matrix")
+            else:
+                world_out = aim_outs[0]
+
+            # Bring back the aimed world matrix into the parent space
+            if parent_node:
+                mult = MultMatrixHandle(self.helper_node("multMatrix", "parent"))
+                self.connect_attr(world_out, mult.matrix_in(0))
+                self.connect_attr(self.get_inverse_world_matrix(parent_node), mult.matrix_in(1))
+                world_out = mult.output
+
+            self.connect_attr(world_out, self.get_offset_parent_matrix(self.driven))
+
+            transform.idtransform(self.driven)
+
+            index.register(self.driven)
+
+
+# ---------- CONVENIENCE FUNCTIONS ----------
+
+
+def aim_constraint(driven: Optional[str] = None, drivers: Optional[List[str]] = None, **kwargs) -> AimCon:
+    """
+    Convenience function to create a matrix aim constraint.
+
+    Args:
+        driven (Optional[str]): The name of the driven object. If None, uses selection.
+        drivers (Optional[List[str]]): The aim targets. If None, uses selection.
+        **kwargs: AimCon options (offset, keep_hold, vectors, world up...).
+
+    Returns:
+        AimCon: The mounted aim constraint.
+
+    Example:
+        aim_constraint("head_ctrl", ["look_at_ctrl"], offset=True)
+        aim_constraint()  # Uses selection, driven last
+    """
+    con = AimCon(driven=driven, drivers=drivers, **kwargs)
+    con.mount_system()
+    return con
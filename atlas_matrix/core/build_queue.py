@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+""" Time-budgeted deferred queue of constraint build and remove jobs inside Maya
+
+This module provides the `BuildQueue` class, which processes constraint jobs in
+chunks driven by `cmds.evalDeferred`. Each tick runs jobs until its time budget
+is spent and hands control back to Maya, keeping the UI and viewport
+interactive during large jobs. A cancelled queue rolls back the jobs already done.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import time
+from typing import Any, Callable, List, Optional, Tuple
+from dataclasses import dataclass
+
+import maya.cmds as cmds
+
+from atlas_matrix.core.matrix import Matrix
+from atlas_matrix.core.remove_con import RemoveCon
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class Job:
+    apply: Callable[[], Any]
+    revert: Optional[Callable[[], Any]] = None
+    label: str = ""
+
+
+# ---------- MAIN CLASS ----------
+
+
+class BuildQueue:
+    """
+    Class to process constraint build and remove jobs in time-budgeted chunks.
+
+    Jobs run on Maya's main thread, a chunk per idle tick scheduled with
+    `cmds.evalDeferred(lowestPriority=True)`, until every job is done or the
+    queue is cancelled.
+    """
+    def __init__(
+            self,
+            budget: float = 0.03,
+            on_progress: Optional[Callable[[int, int], None]] = None,
+            on_finished: Optional[Callable[["BuildQueue"], None]] = None
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            budget (float): The time spent per tick, in seconds.
+            on_progress (Optional[Callable[[int, int], None]]): Called with (done, total) after each tick.
+            on_finished (Optional[Callable[[BuildQueue], None]]): Called once the queue is done or cancelled.
+        """
+        self.budget = budget
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+
+        self.jobs: List[Job] = []
+        self.done: List[Job] = []
+        self.errors: List[Tuple[Job, Exception]] = []
+        self.cancelled = False
+        self.running = False
+
+
+    @property
+    def total(self) -> int:
+        """Get the number of jobs queued since the queue was created"""
+        return len(self.jobs) + len(self.done) + len(self.errors)
+
+
+    def add(self, job: Job) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            job (Job): The job to queue.
+
+        Returns:
+            Job: The queued job.
+        """
+        self.jobs.append(job)
+        return job
+
+
+    def add_build(self, builder: Matrix) -> Job:
+        """
+        Queue the build of a constraint, reverted by removing it.
+
+        Args:
+            builder (Matrix): The constraint builder to mount.
+
+        Returns:
+            Job: The queued job.
+        """
+        def revert():
+            RemoveCon(driven=builder.driven, constraint_type=builder.constraint_type).remove()
+
+        return self.add(Job(apply=builder.mount_system, revert=revert, label=f"build {builder.driven}"))
+
+
+    def add_remove(self, driven: str, constraint_type: Optional[str] = None, rebuild: Optional[Matrix] = None) -> Job:
+        """
+        Queue the removal of a constraint.
+
+        Args:
+            driven (str): The name of the constrained object.
+            constraint_type (Optional[str]): Type of constraint ("parent" or "aim"), detected if None.
+            rebuild (Optional[Matrix]): A builder recreating the constraint, used to revert the job.
+                The removal cannot be rolled back without it.
+
+        Returns:
+            Job: The queued job.
+        """
+        def apply():
+            RemoveCon(driven=driven, constraint_type=constraint_type).remove()
+
+        revert = rebuild.mount_system if rebuild else None
+        return self.add(Job(apply=apply, revert=revert, label=f"remove {driven}"))
+
+
+    def _run_next(self) -> None:
+        """Run the next job, keeping track of its success or failure."""
+        job = self.jobs.pop(0)
+        try:
+            job.apply()
+        except Exception as e:
+            cmds.warning(f"Atlas Matrix job '{job.label}' failed: {e}")
+            self.errors.append((job, e))
+        else:
+            self.done.append(job)
+
+
+    def _schedule(self) -> None:
+        """Schedule the next tick when Maya is idle."""
+        cmds.evalDeferred(self._tick, lowestPriority=True)
+
+
+    def _finish(self) -> None:
+        """Stop the queue and notify."""
+        self.running = False
+        if self.on_finished:
+            self.on_finished(self)
+
+
+    def _tick(self) -> None:
+        """Run jobs until the time budget of the tick is spent."""
+        if self.cancelled or not self.running:
+            return
+
+        start = time.perf_counter()
+        while self.jobs and time.perf_counter() - start < self.budget:
+            self._run_next()
+
+        if self.on_progress:
+            self.on_progress(self.total - len(self.jobs), self.total)
+
+        if self.jobs:
+            self._schedule()
+        else:
+            self._finish()
+
+
+    def start(self) -> None:
+        """Start processing the jobs in deferred chunks."""
+        if self.running:
+            return
+        self.running = True
+        self.cancelled = False
+        self._schedule()
+
+
+    def run(self) -> None:
+        """Run every job synchronously, for batch or headless usage."""
+        self.running = True
+        while self.jobs and not self.cancelled:
+            self._run_next()
+        if self.on_progress:
+            self.on_progress(self.total - len(self.jobs), self.total)
+        self._finish()
+
+
+    def cancel(self, rollback: bool = True) -> None:
+        """
+        Stop the queue and roll back the jobs already done, last first.
+
+        Args:
+            rollback (bool): Revert the done jobs. Jobs without revert are left as is.
+        """
+        self.cancelled = True
+        self.jobs = []
+
+        if rollback and self.done:
+            cmds.undoInfo(openChunk=True, chunkName="atlas_matrix_queue_rollback")
+            try:
+                for job in reversed(self.done):
+                    if job.revert is None:
+                        cmds.warning(f"Atlas Matrix job '{job.label}' cannot be rolled back")
+                        continue
+                    try:
+                        job.revert()
+                    except Exception as e:
+                        cmds.warning(f"Could not roll back '{job.label}': {e}")
+            finally:
+                cmds.undoInfo(closeChunk=True)
+            self.done = []
+
+        self._finish()
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+""" Bulk creation of matrix constraints inside Maya
+
+This module mounts many constraint builders (ParentCon, AimCon...) in a
+single undo chunk, so a whole rig layer can be built and undone at once.
+
+The planned parent path reads every world matrix once, computes the
+maintained offsets in pure Python and hands them to the builders, which then
+skip their per-driver offset measurement.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Dict, Iterable, List, Sequence, Tuple, Type
+from contextlib import contextmanager
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from atlas_matrix.core.matrix import Matrix
+from atlas_matrix.core.parent_con import ParentCon
+from atlas_matrix.core.aim_con import AimCon
+from atlas_matrix.core.plan import Snapshot, plan_parent
+from atlas_matrix.core.utils.ancestry import AncestryIndex, validate_pairs
+
+
+# ---------- FUNCTIONS ----------
+
+
+@contextmanager
+def bulk_chunk(name: str = "bulk"):
+    """Context manager wrapping a bulk operation in a single undo chunk"""
+    cmds.undoInfo(openChunk=True, chunkName=f"atlas_matrix_{name}")
+    try:
+        yield
+    except Exception as e:
+        cmds.undoInfo(cancelChunk=True)
+        raise e
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def mount_all(builders: Sequence[Matrix], name: str = "bulk") -> List[Matrix]:
+    """
+    Mount every constraint builder inside a single undo chunk.
+
+    Args:
+        builders (Sequence[Matrix]): The constraint builders to mount.
+        name (str): The name of the undo chunk.
+
+    Returns:
+        List[Matrix]: The mounted builders.
+    """
+    with bulk_chunk(name):
+        for builder in builders:
+            builder.mount_system()
+
+    return list(builders)
+
+
+def _build(
+        builder_type: Type[Matrix],
+        specs: Iterable[Tuple[str, Sequence[str]]],
+        name: str,
+        **kwargs
+) -> List[Matrix]:
+    """
+    Instantiate one builder per (driven, drivers) pair and mount them.
+
+    Args:
+        builder_type (Type[Matrix]): The constraint class to instantiate.
+        specs (Iterable[Tuple[str, Sequence[str]]]): The (driven, drivers) pairs.
+        name (str): The name of the undo chunk.
+        **kwargs: Options shared by every builder.
+
+    Returns:
+        List[Matrix]: The mounted builders.
+    """
+    specs = [(driven, list(drivers)) for driven, drivers in specs]
+
+    # One DAG traversal for the whole batch, nothing is built if any pair conflicts
+    ancestry = AncestryIndex.from_scene()
+    validate_pairs(specs, ancestry)
+
+    builders = [builder_type(driven, drivers, ancestry=ancestry, **kwargs) for driven, drivers in specs]
+    return mount_all(builders, name=name)
+
+
+def parent_constraints(specs: Iterable[Tuple[str, Sequence[str]]], **kwargs) -> List[ParentCon]:
+    """
+    Create many matrix parent constraints in one undo step.
+
+    Args:
+        specs (Iterable[Tuple[str, Sequence[str]]]): The (driven, drivers) pairs.
+        **kwargs: ParentCon options shared by every constraint.
+
+    Returns:
+        List[ParentCon]: The mounted constraints.
+
+    Example:
+        parent_constraints([("ctrl_a", ["space_a"]), ("ctrl_b", ["space_a", "space_b"])], offset=True)
+    """
+    return _build(ParentCon, specs, "parent", **kwargs)
+
+
+def aim_constraints(specs: Iterable[Tuple[str, Sequence[str]]], **kwargs) -> List[AimCon]:
+    """
+    Create many matrix aim constraints in one undo step.
+
+    Args:
+        specs (Iterable[Tuple[str, Sequence[str]]]): The (driven, drivers) pairs.
+        **kwargs: AimCon options shared by every constraint.
+
+    Returns:
+        List[AimCon]: The mounted constraints.
+
+    Example:
+        aim_constraints([("eye_l", ["look_at"]), ("eye_r", ["look_at"])], offset=True)
+    """
+    return _build(AimCon, specs, "aim", **kwargs)
+
+
+def world_matrices(names: Sequence[str]) -> Dict[str, List[float]]:
+    """
+    Read the world matrix of many objects in one selection list.
+
+    Args:
+        names (Sequence[str]): The object names.
+
+    Returns:
+        Dict[str, List[float]]: The 16 values of each world matrix by name.
+    """
+    unique = list(dict.fromkeys(names))
+    selection = om.MSelectionList()
+    for name in unique:
+        selection.add(name)
+
+    return {name: list(selection.getDagPath(index).inclusiveMatrix()) for index, name in enumerate(unique)}
+
+
+def snapshot(specs: Iterable[Tuple[str, Sequence[str]]]) -> List[Snapshot]:
+    """
+    Read the scene data needed to plan parent constraints, on the main thread.
+
+    Args:
+        specs (Iterable[Tuple[str, Sequence[str]]]): The (driven, drivers) pairs.
+
+    Returns:
+        List[Snapshot]: One snapshot per pair.
+    """
+    specs = [(driven, list(drivers)) for driven, drivers in specs]
+    matrices = world_matrices([name for driven, drivers in specs for name in [driven] + drivers])
+
+    return [
+        Snapshot(
+            driven=driven,
+            drivers=drivers,
+            driven_world=matrices[driven],
+            driver_worlds=[matrices[driver] for driver in drivers],
+        )
+        for driven, drivers in specs
+    ]
+
+
+def parent_constraints_planned(specs: Iterable[Tuple[str, Sequence[str]]], **kwargs) -> List[ParentCon]:
+    """
+    Create many matrix parent constraints from plans computed on one scene snapshot.
+
+    Offsets are measured on the pose read before any constraint is built, with
+    one selection list for the whole batch, instead of one temporary multMatrix
+    per driver. Plans are computed on the main thread: maya.cmds must not be
+    called from other threads and the offset products hold the GIL, so worker
+    threads would not overlap with the scene edits.
+
+    Args:
+        specs (Iterable[Tuple[str, Sequence[str]]]): The (driven, drivers) pairs.
+        **kwargs: ParentCon options shared by every constraint.
+
+    Returns:
+        List[ParentCon]: The mounted constraints.
+
+    Example:
+        parent_constraints_planned([("ctrl_a", ["space_a"]), ("ctrl_b", ["space_b"])], offset=True)
+    """
+    specs = [(driven, list(drivers)) for driven, drivers in specs]
+
+    ancestry = AncestryIndex.from_scene()
+    validate_pairs(specs, ancestry)
+
+    plans = [plan_parent(data, offset=kwargs.get("offset", False)) for data in snapshot(specs)]
+    builders = [
+        ParentCon(plan.driven, plan.drivers, offset_matrices=plan.offset_matrices, ancestry=ancestry, **kwargs)
+        for plan in plans
+    ]
+    return mount_all(builders, name="parent")
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+""" Matrix-cache playback of Atlas Matrix constraints
+
+Caching samples the offsetParentMatrix of every constrained control over a
+frame range, stores it as per-channel animCurves on a composeMatrix, and
+switches the offsetParentMatrix to read from that composeMatrix. Constant
+channels are set on the composeMatrix instead of being keyed. The live
+network is kept, frozen, and uncaching reconnects it in one undo step.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from atlas_matrix.core import index
+from atlas_matrix.core import lod
+from atlas_matrix.core.bulk import bulk_chunk
+from atlas_matrix.core.utils import attributes
+from atlas_matrix.core.utils import sampling
+
+
+# ---------- CONSTANTS ----------
+
+
+CACHE_SOURCE = "atlasCacheSource"
+CACHE_PLUG = "atlasCachePlug"
+
+# composeMatrix input, animCurve type and channel names
+CHANNELS = (
+    ("inputTranslate", "animCurveTL", "XYZ"),
+    ("inputRotate", "animCurveTA", "XYZ"),
+    ("inputScale", "animCurveTU", "XYZ"),
+    ("inputShear", "animCurveTU", "XYZ"),
+)
+
+# Channels whose values all stay within this tolerance are not keyed
+CONSTANT_TOLERANCE = 1e-6
+
+
+# ---------- FUNCTIONS ----------
+
+
+def cache_node_name(driven: str) -> str:
+    """
+    Get the name of the cache composeMatrix of a driven object.
+
+    Args:
+        driven (str): The name of the driven object.
+
+    Returns:
+        str: The node name.
+    """
+    return f"composematrix_{driven}_matrix_cache"
+
+
+def is_cached(driven: str) -> bool:
+    """
+    Check if a driven object reads its offsetParentMatrix from a cache.
+
+    Args:
+        driven (str): The name of the driven object.
+
+    Returns:
+        bool: True if the object is cached.
+    """
+    return cmds.attributeQuery(CACHE_SOURCE, node=driven, exists=True)
+
+
+def _frames(start: float, end: float, step: float) -> List[float]:
+    """
+    Get the sampled frames of a range, end included.
+
+    Args:
+        start (float): The first frame.
+        end (float): The last frame.
+        step (float): The sampling step.
+
+    Returns:
+        List[float]: The frames.
+    """
+    count = int(round((end - start) / step)) + 1
+    return [start + i * step for i in range(count)]
+
+
+def _decompose(matrix: om.MMatrix, previous: Optional[om.MEulerRotation]) -> Tuple[List[float], om.MEulerRotation]:
+    """
+    Decompose a matrix into the 12 composeMatrix channels, in UI units.
+
+    Args:
+        matrix (om.MMatrix): The matrix.
+        previous (Optional[om.MEulerRotation]): The rotation of the previous frame,
+            used to keep the rotation curves continuous.
+
+    Returns:
+        Tuple[List[float], om.MEulerRotation]: The channel values and the rotation.
+    """
+    transformation = om.MTransformationMatrix(matrix)
+    rotation = transformation.rotation()
+    if previous is not None:
+        rotation.setToClosestSolution(previous)
+
+    linear_unit = om.MDistance.uiUnit()
+    angular_unit = om.MAngle.uiUnit()
+
+    values = [om.MDistance(value).asUnits(linear_unit) for value in transformation.translation(om.MSpace.kTransform)]
+    values += [om.MAngle(value).asUnits(angular_unit) for value in (rotation.x, rotation.y, rotation.z)]
+    values += list(transformation.scale(om.MSpace.kTransform))
+    values += list(transformation.shear(om.MSpace.kTransform))
+    return values, rotation
+
+
+def sample(driven_list: Sequence[str], frames: Sequence[float]) -> Dict[str, List[List[float]]]:
+    """
+    Sample the offsetParentMatrix channels of many objects without changing the current time.
+
+    Args:
+        driven_list (Sequence[str]): The driven objects.
+        frames (Sequence[float]): The sampled frames.
+
+    Returns:
+        Dict[str, List[List[float]]]: The 12 channel values of each frame, by driven name.
+    """
+    matrices = sampling.sample_plugs([attributes.get_offset_parent_matrix(driven) for driven in driven_list], frames)
+
+    samples = {}
+    for i, driven in enumerate(driven_list):
+        rotation = None
+        values = []
+        for f in range(len(frames)):
+            frame_values, rotation = _decompose(sampling.to_mmatrix(matrices[f][i]), rotation)
+            values.append(frame_values)
+        samples[driven] = values
+
+    return samples
+
+
+def _write_cache(driven: str, frames: Sequence[float], values: List[List[float]]) -> str:
+    """
+    Create the cache composeMatrix of a driven object and key its channels.
+
+    Args:
+        driven (str): The name of the driven object.
+        frames (Sequence[float]): The sampled frames.
+        values (List[List[float]]): The 12 channel values of each frame.
+
+    Returns:
+        str: The cache composeMatrix.
+    """
+    node = cmds.createNode("composeMatrix", name=cache_node_name(driven), skipSelect=True)
+
+    column = 0
+    for attribute, curve_type, axes in CHANNELS:
+        for axis in axes:
+            channel = [frame_values[column] for frame_values in values]
+            column += 1
+
+            plug = f"{node}.{attribute}{axis}"
+            if max(channel) - min(channel) <= CONSTANT_TOLERANCE:
+                cmds.setAttr(plug, channel[0])
+                continue
+
+            curve = cmds.createNode(curve_type, name=f"{node}_{attribute}{axis}", skipSelect=True)
+            keys = [value for pair in zip(frames, channel) for value in pair]
+            cmds.setAttr(f"{curve}.keyTimeValue[0:{len(frames) - 1}]", *keys)
+            cmds.connectAttr(f"{curve}.output", plug)
+
+    return node
+
+
+def cache(
+        driven_list: Optional[Sequence[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        step: float = 1.0
+) -> List[str]:
+    """
+    Drive constrained controls from a per-frame matrix cache.
+
+    Args:
+        driven_list (Optional[Sequence[str]]): The driven objects. If None, every
+            indexed object of the scene is used.
+        start (Optional[float]): The first frame, the playback start if None.
+        end (Optional[float]): The last frame, the playback end if None.
+        step (float): The sampling step.
+
+    Returns:
+        List[str]: The cached driven objects.
+
+    Example:
+        from atlas_matrix.core import cache
+        cache.cache(start=1001, end=1100)
+    """
+    start = cmds.playbackOptions(query=True, minTime=True) if start is None else start
+    end = cmds.playbackOptions(query=True, maxTime=True) if end is None else end
+    if end < start or step <= 0:
+        raise ValueError(f"Invalid frame range {start}-{end} with step {step}")
+
+    driven_list = [
+        driven for driven in (index.list_indexed() if driven_list is None else driven_list)
+        if not is_cached(driven)
+        and cmds.listConnections(f"{driven}.offsetParentMatrix", source=True, destination=False)
+    ]
+    if not driven_list:
+        cmds.warning("No live constraint found to cache.")
+        return []
+
+    frames = _frames(start, end, step)
+    samples = sample(driven_list, frames)
+
+    with bulk_chunk("cache"):
+        for driven in driven_list:
+            source = cmds.listConnections(f"{driven}.offsetParentMatrix", source=True, destination=False, plugs=True)[0]
+            source_node, _, source_attribute = source.partition(".")
+
+            cmds.addAttr(driven, longName=CACHE_SOURCE, attributeType="message", hidden=True)
+            cmds.addAttr(driven, longName=CACHE_PLUG, dataType="string", hidden=True)
+            cmds.connectAttr(f"{source_node}.message", f"{driven}.{CACHE_SOURCE}")
+            cmds.setAttr(f"{driven}.{CACHE_PLUG}", source_attribute, type="string")
+
+            node = _write_cache(driven, frames, samples[driven])
+            cmds.connectAttr(f"{node}.outputMatrix", f"{driven}.offsetParentMatrix", force=True)
+
+            for network_node in lod.network_nodes(source_node):
+                cmds.setAttr(f"{network_node}.frozen", True)
+
+    return driven_list
+
+
+def uncache(driven_list: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Reconnect the live constraint networks of cached controls and delete their cache.
+
+    Args:
+        driven_list (Optional[Sequence[str]]): The driven objects. If None, every
+            indexed object of the scene is used.
+
+    Returns:
+        List[str]: The restored driven objects.
+    """
+    restored = []
+    with bulk_chunk("uncache"):
+        for driven in (index.list_indexed() if driven_list is None else driven_list):
+            if not is_cached(driven):
+                continue
+
+            source_nodes = cmds.listConnections(f"{driven}.{CACHE_SOURCE}", source=True, destination=False) or []
+            source_attribute = cmds.getAttr(f"{driven}.{CACHE_PLUG}")
+            if not source_nodes or not source_attribute:
+                cmds.warning(f"Live network of {driven} is missing, cache left as is.")
+                continue
+
+            for network_node in lod.network_nodes(source_nodes[0]):
+                cmds.setAttr(f"{network_node}.frozen", False)
+
+            cmds.connectAttr(f"{source_nodes[0]}.{source_attribute}", f"{driven}.offsetParentMatrix", force=True)
+
+            node = cache_node_name(driven)
+            if cmds.objExists(node):
+                curves = cmds.listConnections(node, source=True, destination=False, type="animCurve") or []
+                cmds.delete([node] + curves)
+
+            cmds.deleteAttr(f"{driven}.{CACHE_SOURCE}")
+            cmds.deleteAttr(f"{driven}.{CACHE_PLUG}")
+            restored.append(driven)
+
+    return restored
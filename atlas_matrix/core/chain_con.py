@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+""" DEP class to use constraint parent matrix between matching hierarchies inside Maya
+
+This module provides the `ChainCon` class, which constrains a whole driven
+hierarchy (FK/IK joint chain, control chain...) to a matching driver hierarchy.
+Wherever the parents of a driven/driver pair correspond, the local `.matrix` of
+the driver is used instead of the world matrix round trip. It inherits from
+ParentCon class.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# ---------- IMPORT ----------
+
+
+from typing import Optional, List
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from atlas_matrix.core.parent_con import ParentCon
+from atlas_matrix.core import index
+from atlas_matrix.core.utils import transform
+
+
+# ---------- MAIN CLASS ----------
+
+
+class ChainCon(ParentCon):
+    """
+    Class to create matrix-based parent constraints between two matching hierarchies.
+
+    The root of the chain (and any link whose parents do not correspond) is built
+    with the regular world-space `ParentCon` network. Every other link only reads
+    the driver local `.matrix` through a single multMatrix holding a one-time
+    offset, so node count and evaluation depth stay flat along the chain.
+    """
+    def __init__(
+            self,
+            driven_chain: List[str],
+            driver_chain: List[str],
+            **kwargs
+    ):
+        """
+        Initialize the ChainCon constraint setup.
+
+        Args:
+            driven_chain (List[str]): The driven hierarchy objects.
+            driver_chain (List[str]): The driver hierarchy objects, matched by index.
+            **kwargs: ParentCon options (offset, keep_hold, filters, weights...).
+
+        Raises:
+            ValueError: If the chains are empty or have different lengths.
+        """
+        if not driven_chain or len(driven_chain) != len(driver_chain):
+            raise ValueError("Provide driven and driver chains of the same non-zero length.")
+
+        super().__init__(driven_chain[0], [driver_chain[0]], **kwargs)
+        self.driven_chain = list(driven_chain)
+        self.driver_chain = list(driver_chain)
+        self.links = dict(zip(self.driven_chain, self.driver_chain))
+
+
+    @staticmethod
+    def _first_parent(node: str) -> Optional[str]:
+        """
+        Get the parent of a node
+
+        Args:
+            node (str): The name of the node.
+
+        Returns:
+            Optional[str]: The parent name, None if the node is at world root.
+        """
+        parent = cmds.listRelatives(node, parent=True)
+        return parent[0] if parent else None
+
+
+    @staticmethod
+    def _depth(node: str) -> int:
+        """
+        Get the depth of a node inside the DAG
+
+        Args:
+            node (str): The name of the node.
+
+        Returns:
+            int: The number of ancestors of the node.
+        """
+        return cmds.ls(node, long=True)[0].count("|") - 1
+
+
+    def _parents_correspond(self, driven: str, driver: str) -> bool:
+        """
+        Indicate if the parent of the driven is constrained to the parent of the driver in this chain
+
+        Args:
+            driven (str): The name of the driven object.
+            driver (str): The name of the driver object.
+
+        Returns:
+            bool: True if the link can be evaluated in local space.
+        """
+        driven_parent = self._first_parent(driven)
+        driver_parent = self._first_parent(driver)
+        if not driven_parent or not driver_parent:
+            return False
+        return self.links.get(driven_parent) == driver_parent
+
+
+    def _all_axis(self) -> bool:
+        """
+        Indicate if every axis of every channel is checked
+        """
+        return self._all_translate() and self._all_rotate() and self._all_scale() and self._all_shear()
+
+
+    def _local_offset(self, driver: str) -> List[float]:
+        """
+        Compute the constant matrix bringing the driver local space into the driven parent space
+
+        The matrix equals driver.matrix^-1 * driver.worldMatrix * drivenParent.worldInverseMatrix,
+        captured once at build time.
+
+        Args:
+            driver (str): The name of the driver object.
+
+        Returns:
+            List[float]: The 16 values of the matrix.
+        """
+        driver_local = om.MMatrix(cmds.getAttr(self.get_matrix(driver)))
+        driver_world = om.MMatrix(cmds.getAttr(self.get_world_matrix(driver)))
+        parent_inverse = om.MMatrix(cmds.getAttr(self.get_inverse_world_matrix(self.get_parent_driven()[0])))
+
+        return list(driver_local.inverse() * driver_world * parent_inverse)
+
+
+    def mount_local(self):
+        """
+        Internal setup to create the local-space link and connect it.
+        """
+        driver = self.drivers[0]
+
+        self.validate_hierarchy()
+
+        self.preserve_initial_transform()
+        self.preserve_initial_matrix()
+
+        mult = self.con_mult_matrix(driver)
+
+        # Generate offset
+        self.create_offset(driver, mult)
+
+        self.connect_attr(self.get_matrix(driver), mult.matrix_in(1))
+
+        local_offset = self._local_offset(driver)
+        if not om.MMatrix(local_offset).isEquivalent(om.MMatrix.kIdentity):
+            cmds.setAttr(mult.matrix_in(2), *local_offset, type="matrix")
+
+        self.connect_attr(mult.output, self.get_offset_parent_matrix(self.driven))
+
+        transform.idtransform(self.driven)
+
+        index.register(self.driven)
+
+
+    def mount_system(self):
+        """
+        Internal setup to create every link of the chain, parents first.
+        """
+        with self.undo_chunk(name="create"):
+            ordered = sorted(self.driven_chain, key=self._depth)
+
+            for driven in ordered:
+                driver = self.links[driven]
+                self.driven = driven
+                self.drivers = [driver]
+
+                if self._all_axis() and self._parents_correspond(driven, driver):
+                    self.mount_local()
+                else:
+                    super().mount_system()
+
+            self.driven = self.driven_chain[0]
+            self.drivers = [self.driver_chain[0]]
+
+
+# ---------- CONVENIENCE FUNCTIONS ----------
+
+
+def chain_constraint(driven_chain: List[str], driver_chain: List[str], **kwargs) -> ChainCon:
+    """
+    Convenience function to constrain a hierarchy to a matching hierarchy.
+
+    Args:
+        driven_chain (List[str]): The driven hierarchy objects.
+        driver_chain (List[str]): The driver hierarchy objects, matched by index.
+        **kwargs: ParentCon options (offset, keep_hold, filters, weights...).
+
+    Returns:
+        ChainCon: The mounted chain constraint.
+
+    Example:
+        chain_constraint(["bind_01", "bind_02", "bind_03"], ["fk_01", "fk_02", "fk_03"], offset=True)
+    """
+    con = ChainCon(driven_chain, driver_chain, **kwargs)
+    con.mount_system()
+    return con
@@ -0,0 +1,579 @@
+# -*- coding: utf-8 -*-
+""" Conversion of native parentConstraint nodes into Atlas matrix constraints
+
+This module reads the targets, weights, target offsets and skipped channels of
+native `parentConstraint` nodes and rebuilds the same setups as matrix parent
+constraints driving the offsetParentMatrix, in a single undo step. The native
+constraints are only deleted once every matrix constraint is built, a failed
+build restores them. Native weights are normalized, they are converted to the
+sequential weights of the space shifter blendMatrix, with utility nodes when
+they are animated. The conversion reports the node count, the playback rate and the
+world pose of the converted objects before and after.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import math
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field, asdict
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from atlas_matrix.core import index
+from atlas_matrix.core.bulk import bulk_chunk, mount_all
+from atlas_matrix.core.parent_con import ParentCon, AxisFilter
+from atlas_matrix.core.utils import attributes
+from atlas_matrix.core.utils import matrix_math
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils import sampling
+from atlas_matrix.core.utils.ancestry import AncestryIndex, validate_pairs
+
+
+# ---------- CONSTANTS ----------
+
+
+# Rotate orders of the constraintRotateOrder enum, in Maya order
+ROTATE_ORDERS = (
+    om.MEulerRotation.kXYZ,
+    om.MEulerRotation.kYZX,
+    om.MEulerRotation.kZXY,
+    om.MEulerRotation.kXZY,
+    om.MEulerRotation.kYXZ,
+    om.MEulerRotation.kZYX,
+)
+
+# Largest world matrix value change accepted by the pose check
+POSE_TOLERANCE = 1e-3
+
+# Local channels reset by the matrix constraints, restored if the build fails
+CHANNELS = ("translate", "rotate", "scale", "shear")
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class NativeConstraint:
+    constraint: str
+    driven: str
+    drivers: List[str]
+    weights: List[float]
+    weight_sources: List[Optional[str]]
+    weight_aliases: List[Optional[str]]
+    offset_matrices: List[List[float]]
+    translate_filter: AxisFilter
+    rotate_filter: AxisFilter
+
+    @property
+    def has_offset(self) -> bool:
+        """Check if any target holds an offset"""
+        return not all(matrix_math.is_identity(matrix) for matrix in self.offset_matrices)
+
+    @property
+    def is_animated(self) -> bool:
+        """Check if any target weight is animated or connected"""
+        return any(source for source in self.weight_sources)
+
+
+@dataclass
+class ConversionReport:
+    converted: List[str] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    nodes_before: int = 0
+    nodes_after: int = 0
+    fps_before: float = 0.0
+    fps_after: float = 0.0
+    pose_deltas: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def pose_matched(self) -> bool:
+        """Check if every converted object kept its world pose"""
+        return all(delta <= POSE_TOLERANCE for delta in self.pose_deltas.values())
+
+    def to_dict(self) -> dict:
+        """Get the report as a JSON-compatible dictionary"""
+        return asdict(self)
+
+
+@dataclass
+class SceneState:
+    nodes: Set[str]
+    attributes: Dict[str, Set[str]]
+    channels: Dict[str, Dict[str, Tuple[float, ...]]]
+    links: List[Tuple[str, str]]
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _driven(constraint: str) -> str:
+    """
+    Get the object driven by a native constraint.
+
+    Args:
+        constraint (str): The parentConstraint node.
+
+    Returns:
+        str: The driven object.
+
+    Raises:
+        ValueError: If the constraint drives no object or several objects.
+    """
+    driven = set()
+    for channel in ("Translate", "Rotate"):
+        for axis in "XYZ":
+            driven.update(cmds.listConnections(
+                f"{constraint}.constraint{channel}{axis}",
+                source=False,
+                destination=True,
+                skipConversionNodes=True
+            ) or [])
+
+    if len(driven) != 1:
+        raise ValueError(f"{constraint} drives {len(driven)} objects, expected one.")
+    return driven.pop()
+
+
+def _axis_filter(constraint: str, driven: str, channel: str) -> AxisFilter:
+    """
+    Get the axes of a channel the native constraint drives, the others being skipped.
+
+    Args:
+        constraint (str): The parentConstraint node.
+        driven (str): The driven object.
+        channel (str): "translate" or "rotate".
+
+    Returns:
+        AxisFilter: The driven axes.
+    """
+    enabled = []
+    for axis in "XYZ":
+        sources = cmds.listConnections(
+            f"{driven}.{channel}{axis}",
+            source=True,
+            destination=False,
+            skipConversionNodes=True
+        ) or []
+        enabled.append(constraint in sources)
+    return AxisFilter(*enabled)
+
+
+def _offset_matrix(constraint: str, target_index: int, scale: Sequence[float]) -> List[float]:
+    """
+    Compose the offset of a native target as an Atlas offset matrix.
+
+    The driven local scale is folded in, the native constraint never driving it.
+    Target and constraint pivots are ignored.
+
+    Args:
+        constraint (str): The parentConstraint node.
+        target_index (int): The target index.
+        scale (Sequence[float]): The local scale of the driven object.
+
+    Returns:
+        List[float]: The offset matrix (16 values).
+    """
+    translate = cmds.getAttr(f"{constraint}.target[{target_index}].targetOffsetTranslate")[0]
+    rotate = cmds.getAttr(f"{constraint}.target[{target_index}].targetOffsetRotate")[0]
+    order = ROTATE_ORDERS[cmds.getAttr(f"{constraint}.constraintRotateOrder")]
+
+    offset = om.MTransformationMatrix()
+    offset.setScale(om.MVector(*scale), om.MSpace.kTransform)
+    offset.setRotation(om.MEulerRotation(*[math.radians(value) for value in rotate], order))
+    offset.setTranslation(om.MVector(*translate), om.MSpace.kTransform)
+    return list(offset.asMatrix())
+
+
+def read_native(constraint: str) -> NativeConstraint:
+    """
+    Read the setup of a native parentConstraint.
+
+    Args:
+        constraint (str): The parentConstraint node.
+
+    Returns:
+        NativeConstraint: The targets, weights, offsets and driven axes.
+
+    Raises:
+        ValueError: If the constraint cannot be converted.
+    """
+    driven = _driven(constraint)
+    if cmds.listConnections(attributes.get_offset_parent_matrix(driven), source=True, destination=False):
+        raise ValueError(f"{driven}.offsetParentMatrix is already connected.")
+
+    scale = cmds.getAttr(f"{driven}.scale")[0]
+    native = NativeConstraint(
+        constraint=constraint,
+        driven=driven,
+        drivers=[],
+        weights=[],
+        weight_sources=[],
+        weight_aliases=[],
+        offset_matrices=[],
+        translate_filter=_axis_filter(constraint, driven, "translate"),
+        rotate_filter=_axis_filter(constraint, driven, "rotate"),
+    )
+
+    for target_index in cmds.getAttr(f"{constraint}.target", multiIndices=True) or []:
+        target = f"{constraint}.target[{target_index}]"
+        drivers = cmds.listConnections(f"{target}.targetParentMatrix", source=True, destination=False)
+        if not drivers:
+            continue
+
+        # The targetWeight is fed by the driverW# alias, keep what drives the alias
+        weight_sources = None
+        aliases = cmds.listConnections(f"{target}.targetWeight", source=True, destination=False, plugs=True)
+        if aliases:
+            weight_sources = cmds.listConnections(aliases[0], source=True, destination=False, plugs=True)
+
+        native.drivers.append(drivers[0])
+        native.weights.append(cmds.getAttr(f"{target}.targetWeight"))
+        native.weight_sources.append(weight_sources[0] if weight_sources else None)
+        native.weight_aliases.append(aliases[0] if weight_sources else None)
+        native.offset_matrices.append(_offset_matrix(constraint, target_index, scale))
+
+    if not native.drivers:
+        raise ValueError(f"{constraint} has no connected target.")
+    return native
+
+
+def _options(native: NativeConstraint, keep_hold: bool, follow_scale: bool) -> dict:
+    """
+    Map a native constraint onto ParentCon options.
+
+    Args:
+        native (NativeConstraint): The native setup.
+        keep_hold (bool): Keep the offsets in holdMatrix nodes.
+        follow_scale (bool): Let the driver scale and shear through.
+
+    Returns:
+        dict: The ParentCon keyword arguments.
+    """
+    options = {
+        "offset": native.has_offset,
+        "keep_hold": keep_hold,
+        # A single target is fully applied unless its weight is zero, animated weights may reach zero
+        "envelope": len(native.drivers) == 1 and (native.is_animated or native.weights[0] <= 0.0),
+        "translate_filter": native.translate_filter,
+        "rotate_filter": native.rotate_filter,
+        "offset_matrices": native.offset_matrices if native.has_offset else None,
+    }
+    if not follow_scale:
+        options["scale_filter"] = AxisFilter(False, False, False)
+        options["shear_filter"] = AxisFilter(False, False, False)
+    return options
+
+
+def _release_weight_sources(native: NativeConstraint) -> None:
+    """
+    Disconnect the animated weights from the native constraint, so deleting it keeps their animCurves.
+
+    Args:
+        native (NativeConstraint): The native setup.
+    """
+    for source, alias in zip(native.weight_sources, native.weight_aliases):
+        if source:
+            cmds.disconnectAttr(source, alias)
+
+
+def _feed_weight(native: NativeConstraint, target_index: int, plug: str) -> None:
+    """
+    Feed a native weight, animated or static, into a plug.
+
+    Args:
+        native (NativeConstraint): The native setup.
+        target_index (int): The target index.
+        plug (str): The destination plug.
+    """
+    source = native.weight_sources[target_index]
+    if source:
+        cmds.connectAttr(source, plug, force=True)
+    else:
+        cmds.setAttr(plug, native.weights[target_index])
+
+
+def _layered_weight_nodes(native: NativeConstraint, target_index: int, plug: str) -> None:
+    """
+    Compute the layered weight w_i / (w_0 + ... + w_i) of an animated target with utility nodes.
+
+    A zero running sum divides by one instead, its target weight is zero as well.
+
+    Args:
+        native (NativeConstraint): The native setup.
+        target_index (int): The target index.
+        plug (str): The weight plug fed by the nodes.
+    """
+    driven = native.driven
+    if target_index:
+        total = cmds.createNode("plusMinusAverage", name=naming.weight_node_name("plusMinusAverage", driven, target_index))
+        for i in range(target_index + 1):
+            _feed_weight(native, i, f"{total}.input1D[{i}]")
+        total_plug = f"{total}.output1D"
+    else:
+        total = None
+        total_plug = None
+
+    guard = cmds.createNode("condition", name=naming.weight_node_name("condition", driven, target_index))
+    cmds.setAttr(f"{guard}.secondTerm", 0.0)
+    cmds.setAttr(f"{guard}.colorIfTrueR", 1.0)
+    if total_plug:
+        cmds.connectAttr(total_plug, f"{guard}.firstTerm")
+        cmds.connectAttr(total_plug, f"{guard}.colorIfFalseR")
+    else:
+        _feed_weight(native, target_index, f"{guard}.firstTerm")
+        _feed_weight(native, target_index, f"{guard}.colorIfFalseR")
+
+    divide = cmds.createNode("multiplyDivide", name=naming.weight_node_name("multiplyDivide", driven, target_index))
+    cmds.setAttr(f"{divide}.operation", 2)
+    _feed_weight(native, target_index, f"{divide}.input1X")
+    cmds.connectAttr(f"{guard}.outColorR", f"{divide}.input2X")
+    cmds.connectAttr(f"{divide}.outputX", plug, force=True)
+
+
+def _transfer_weights(native: NativeConstraint) -> None:
+    """
+    Convert the native target weights onto the new weight attributes.
+
+    Static weights are set to their layered value. Once an animated weight is
+    met, the layered weight of every following target is computed by nodes.
+
+    Args:
+        native (NativeConstraint): The native setup.
+    """
+    plugs = attributes.get_weight_plugs(native.driven)
+    layered = matrix_math.layered_weights(native.weights)
+    animated = False
+    for target_index, plug in enumerate(plugs[:len(native.drivers)]):
+        animated = animated or bool(native.weight_sources[target_index])
+        if animated:
+            _layered_weight_nodes(native, target_index, plug)
+        else:
+            cmds.setAttr(plug, layered[target_index])
+
+
+def _native_links(native: NativeConstraint) -> List[Tuple[str, str]]:
+    """
+    Get the connections from a native constraint into the channels of its driven object.
+
+    Args:
+        native (NativeConstraint): The native setup.
+
+    Returns:
+        List[Tuple[str, str]]: The (source, destination) plugs.
+    """
+    plugs = cmds.listConnections(native.constraint, source=False, destination=True, connections=True, plugs=True) or []
+    return [
+        (source, destination) for source, destination in zip(plugs[::2], plugs[1::2])
+        if destination.partition(".")[0] == native.driven
+    ]
+
+
+def _scene_state(natives: Sequence[NativeConstraint]) -> SceneState:
+    """
+    Record what the matrix constraints change, before they are built.
+
+    Args:
+        natives (Sequence[NativeConstraint]): The native setups.
+
+    Returns:
+        SceneState: The nodes, the driven attributes and channels, and the native links.
+    """
+    return SceneState(
+        nodes=set(cmds.ls(dependencyNodes=True)),
+        attributes={native.driven: set(cmds.listAttr(native.driven, userDefined=True) or []) for native in natives},
+        channels={
+            native.driven: {channel: cmds.getAttr(f"{native.driven}.{channel}")[0] for channel in CHANNELS}
+            for native in natives
+        },
+        links=[link for native in natives for link in _native_links(native)],
+    )
+
+
+def _restore(state: SceneState) -> None:
+    """
+    Undo a failed build: delete what it created and reconnect the native constraints.
+
+    Args:
+        state (SceneState): The state recorded before the build.
+    """
+    for driven in state.channels:
+        index.unregister(driven)
+
+    created = [node for node in cmds.ls(dependencyNodes=True) if node not in state.nodes]
+    if created:
+        cmds.delete(created)
+
+    for driven, attributes_before in state.attributes.items():
+        for attribute in cmds.listAttr(driven, userDefined=True) or []:
+            if attribute not in attributes_before and cmds.attributeQuery(attribute, node=driven, exists=True):
+                cmds.deleteAttr(f"{driven}.{attribute}")
+        for channel, values in state.channels[driven].items():
+            cmds.setAttr(f"{driven}.{channel}", *values)
+
+    for source, destination in state.links:
+        cmds.connectAttr(source, destination, force=True)
+
+
+def _world_matrices(nodes: Sequence[str]) -> List[List[float]]:
+    """
+    Read the world matrix of nodes at the current time.
+
+    Args:
+        nodes (Sequence[str]): The node names.
+
+    Returns:
+        List[List[float]]: The world matrix (16 values) of each node.
+    """
+    return [list(sampling.to_mmatrix(matrix)) for matrix in sampling.current_world(nodes)]
+
+
+def _node_count() -> int:
+    """Count the dependency nodes of the scene"""
+    return len(cmds.ls(dependencyNodes=True))
+
+
+def _playback_rate(nodes: Sequence[str]) -> float:
+    """
+    Measure the evaluation rate of the playback range, pulling the world matrix of nodes.
+
+    Args:
+        nodes (Sequence[str]): The nodes whose world matrix is pulled each frame.
+
+    Returns:
+        float: The evaluated frames per second.
+    """
+    start = int(cmds.playbackOptions(query=True, minTime=True))
+    end = int(cmds.playbackOptions(query=True, maxTime=True))
+    current = cmds.currentTime(query=True)
+    plugs = [attributes.get_world_matrix(node) for node in nodes]
+
+    begin = time.perf_counter()
+    for frame in range(start, end + 1):
+        cmds.currentTime(frame, update=True)
+        for plug in plugs:
+            cmds.getAttr(plug)
+    elapsed = time.perf_counter() - begin
+
+    cmds.currentTime(current, update=True)
+    return (end - start + 1) / elapsed if elapsed else 0.0
+
+
+def convert(
+        constraints: Optional[List[str]] = None,
+        keep_hold: bool = False,
+        follow_scale: bool = False,
+        measure: bool = True
+) -> ConversionReport:
+    """
+    Replace native parentConstraint nodes with Atlas matrix parent constraints.
+
+    Constraints that cannot be converted are skipped with a warning and left
+    untouched. If a matrix constraint fails to build, the native constraints are
+    restored and the error is raised. The world matrix of every converted object
+    is compared before and after, a pose change above POSE_TOLERANCE is reported
+    with a warning.
+
+    Args:
+        constraints (Optional[List[str]]): The parentConstraint nodes. If None,
+            every parentConstraint of the scene is converted.
+        keep_hold (bool): Keep the offsets in holdMatrix nodes.
+        follow_scale (bool): Let the driver scale and shear through instead of
+            filtering them out like the native constraint does. Saves the
+            decompose/compose filter on rigs whose drivers are never scaled.
+        measure (bool): Measure the node count and playback rate before and after.
+
+    Returns:
+        ConversionReport: The converted and skipped constraints, the pose check and the measures.
+
+    Example:
+        report = convert()
+        print(report.pose_matched, report.nodes_before, report.nodes_after, report.fps_before, report.fps_after)
+    """
+    if constraints is None:
+        constraints = cmds.ls(type="parentConstraint") or []
+
+    report = ConversionReport()
+    natives = []
+    for constraint in constraints:
+        try:
+            natives.append(read_native(constraint))
+        except ValueError as e:
+            report.skipped[constraint] = str(e)
+            cmds.warning(f"Skipping {constraint}: {e}")
+
+    if not natives:
+        return report
+
+    driven_list = [native.driven for native in natives]
+    if measure:
+        report.nodes_before = _node_count()
+        report.fps_before = _playback_rate(driven_list)
+
+    # Validate before anything is changed, removing the constraint nodes keeps the ancestry valid
+    specs = [(native.driven, native.drivers) for native in natives]
+    ancestry = AncestryIndex.from_scene()
+    validate_pairs(specs, ancestry)
+    poses_before = _world_matrices(driven_list)
+
+    # The driven channels are released for the build, the native constraints are deleted once it succeeded
+    state = _scene_state(natives)
+    with bulk_chunk("convert"):
+        for source, destination in state.links:
+            cmds.disconnectAttr(source, destination)
+
+        builders = [
+            ParentCon(
+                native.driven,
+                native.drivers,
+                ancestry=ancestry,
+                **_options(native, keep_hold, follow_scale)
+            )
+            for native in natives
+        ]
+        try:
+            mount_all(builders, name="convert")
+        except Exception:
+            _restore(state)
+            raise
+
+        for native in natives:
+            _release_weight_sources(native)
+        cmds.delete([native.constraint for native in natives])
+
+        for native in natives:
+            _transfer_weights(native)
+            report.converted.append(native.constraint)
+
+    for driven, before, after in zip(driven_list, poses_before, _world_matrices(driven_list)):
+        report.pose_deltas[driven] = matrix_math.max_delta(before, after)
+        if report.pose_deltas[driven] > POSE_TOLERANCE:
+            cmds.warning(f"{driven} moved by {report.pose_deltas[driven]:.6f} after conversion, check pivots and rest pose.")
+
+    if measure:
+        report.nodes_after = _node_count()
+        report.fps_after = _playback_rate(driven_list)
+
+    return report
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+""" Cost model and node-budget report of Atlas constraint networks inside Maya
+
+This module walks every Atlas constraint network of the scene, measures its
+node count, connection count and evaluation depth, estimates its cost weighted
+by node type, aggregates the result per asset and flags networks that have a
+cheaper equivalent topology. The estimate can be replaced by the evaluation
+time recorded by the Maya profiler over a playback range.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import json
+import statistics
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field, asdict
+
+import maya.cmds as cmds
+
+from atlas_matrix.core.utils import network as net
+
+
+# ---------- CONSTANTS ----------
+
+
+# Relative evaluation cost of each node type, multMatrix being the reference
+NODE_COST = {
+    "multMatrix": 1.0,
+    "decomposeMatrix": 1.5,
+    "composeMatrix": 1.0,
+    "holdMatrix": 0.25,
+    "blendMatrix": 2.0,
+    "aimMatrix": 2.0,
+    "pickMatrix": 0.5,
+    "inverseMatrix": 1.0,
+}
+
+# Cost of a single connection, relative to a multMatrix
+CONNECTION_COST = 0.1
+
+# A constraint is an outlier when its cost is above mean + OUTLIER_SIGMA * stdev of its asset
+OUTLIER_SIGMA = 2.0
+
+CHANNELS = {
+    "translate": ("X", "Y", "Z"),
+    "rotate": ("X", "Y", "Z"),
+    "scale": ("X", "Y", "Z"),
+    "shear": ("X", "Y", "Z"),
+}
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class ConstraintCost:
+    driven: str
+    asset: str
+    constraint_type: str
+    node_count: int
+    connection_count: int
+    depth: int
+    cost: float
+    node_types: Dict[str, int] = field(default_factory=dict)
+    suggestions: List[str] = field(default_factory=list)
+    outlier: bool = False
+    eval_ms: float = 0.0
+
+
+@dataclass
+class AssetCost:
+    asset: str
+    constraint_count: int = 0
+    node_count: int = 0
+    connection_count: int = 0
+    max_depth: int = 0
+    cost: float = 0.0
+    outliers: List[str] = field(default_factory=list)
+    eval_ms: float = 0.0
+
+
+@dataclass
+class CostReport:
+    constraints: List[ConstraintCost] = field(default_factory=list)
+    assets: List[AssetCost] = field(default_factory=list)
+
+    def candidates(self) -> List[ConstraintCost]:
+        """Get the constraints with a cheaper topology, the slowest to evaluate first"""
+        return sorted(
+            (constraint for constraint in self.constraints if constraint.suggestions),
+            key=lambda constraint: (constraint.eval_ms, constraint.cost),
+            reverse=True
+        )
+
+    def table(self, limit: int = 20) -> str:
+        """
+        Format the slowest constraints and assets as a text table
+
+        Args:
+            limit (int): The number of constraints listed.
+
+        Returns:
+            str: The table.
+        """
+        lines = [f"{'constraint':<40}{'asset':<24}{'eval_ms':>10}{'cost':>10}"]
+        for constraint in self.constraints[:limit]:
+            lines.append(f"{constraint.driven:<40}{constraint.asset:<24}{constraint.eval_ms:>10.3f}{constraint.cost:>10.3f}")
+        lines.append("")
+        lines.append(f"{'asset':<40}{'constraints':>12}{'eval_ms':>10}{'cost':>10}")
+        for asset in self.assets:
+            lines.append(f"{asset.asset:<40}{asset.constraint_count:>12}{asset.eval_ms:>10.3f}{asset.cost:>10.3f}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Get the report as a JSON-compatible dictionary"""
+        return {
+            "constraints": [asdict(constraint) for constraint in self.constraints],
+            "assets": [asdict(asset) for asset in self.assets],
+        }
+
+    def to_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        """
+        Export the report as JSON
+
+        Args:
+            path (Optional[str]): The file to write, nothing is written if None.
+            indent (int): The JSON indentation.
+
+        Returns:
+            str: The JSON string.
+        """
+        data = json.dumps(self.to_dict(), indent=indent)
+        if path:
+            with open(path, "w") as f:
+                f.write(data)
+        return data
+
+
+# ---------- FUNCTIONS ----------
+
+
+def get_asset(driven: str) -> str:
+    """Get the asset owning a driven object.
+
+    The asset is the namespace of the object, or its top-level DAG root when
+    the object has no namespace.
+
+    Args:
+        driven (str): The name of the driven object.
+
+    Returns:
+        str: The asset name.
+    """
+    if ":" in driven:
+        return driven.rsplit("|", 1)[-1].rpartition(":")[0]
+
+    long_name = (cmds.ls(driven, long=True) or [driven])[0]
+    return long_name.lstrip("|").split("|", 1)[0]
+
+
+def network_depth(network: net.Network) -> int:
+    """Get the evaluation depth of a network (longest chain of network nodes).
+
+    Args:
+        network (net.Network): The network to measure.
+
+    Returns:
+        int: The number of nodes on the longest upstream path.
+    """
+    upstream = net.upstream_map(network)
+    depths = {}
+
+    def depth(node: str, stack: frozenset) -> int:
+        if node in depths:
+            return depths[node]
+        parents = [parent for parent in upstream[node] if parent not in stack]
+        value = 1 + max((depth(parent, stack | {node}) for parent in parents), default=0)
+        depths[node] = value
+        return value
+
+    return max((depth(node, frozenset()) for node in network.nodes), default=0)
+
+
+def _incoming_attributes(node: str, connections: List[tuple]) -> List[str]:
+    """Get the attribute names of a node receiving a connection.
+
+    Args:
+        node (str): The name of the node.
+        connections (List[tuple]): The (source, destination) plugs of the network.
+
+    Returns:
+        List[str]: The connected destination attributes.
+    """
+    return [destination.split(".", 1)[1] for source, destination in connections
+            if destination.split(".", 1)[0] == node]
+
+
+def suggest(network: net.Network, node_types: Dict[str, str]) -> List[str]:
+    """List cheaper equivalent topologies for a network.
+
+    Args:
+        network (net.Network): The network to inspect.
+        node_types (Dict[str, str]): The node type by node name.
+
+    Returns:
+        List[str]: Human readable suggestions.
+    """
+    suggestions = []
+    for node in network.nodes:
+        node_type = node_types[node]
+
+        # decompose/compose axis filter keeping or dropping whole channels is a pickMatrix
+        if node_type == "composeMatrix" and not node.endswith("_identity_parent"):
+            incoming = _incoming_attributes(node, network.connections)
+            whole_channels = True
+            for channel, axes in CHANNELS.items():
+                prefix = f"input{channel.capitalize()}"
+                connected = [attr for attr in incoming if attr.startswith(prefix)]
+                if connected and len(connected) < len(axes):
+                    whole_channels = False
+            if whole_channels:
+                suggestions.append(f"{node}: decompose/compose filter keeps whole channels, use a pickMatrix")
+
+        # identity composeMatrix only feeds an identity into the multMatrix
+        elif node_type == "composeMatrix":
+            suggestions.append(f"{node}: identity input can be dropped from the multMatrix")
+
+        # holdMatrix without input is a constant that can live in the multMatrix matrixIn
+        elif node_type == "holdMatrix":
+            if not _incoming_attributes(node, network.connections):
+                suggestions.append(f"{node}: static holdMatrix can be folded into the multMatrix matrixIn")
+
+        # blendMatrix with a single target and no envelope is a pass-through
+        elif node_type == "blendMatrix":
+            targets = {attr.split("]", 1)[0] for attr in _incoming_attributes(node, network.connections)
+                       if attr.startswith("target[")}
+            if len(targets) == 1:
+                suggestions.append(f"{node}: single target blendMatrix can be removed if the envelope is unused")
+
+    return suggestions
+
+
+def measure(network: net.Network) -> ConstraintCost:
+    """Measure the cost of a single constraint network.
+
+    Args:
+        network (net.Network): The network to measure.
+
+    Returns:
+        ConstraintCost: The measured cost.
+    """
+    node_types = {node: cmds.nodeType(node) for node in network.nodes}
+
+    type_count = {}
+    for node_type in node_types.values():
+        type_count[node_type] = type_count.get(node_type, 0) + 1
+
+    connection_count = len(network.connections)
+    cost = sum(NODE_COST.get(node_type, 1.0) * count for node_type, count in type_count.items())
+    cost += CONNECTION_COST * connection_count
+
+    return ConstraintCost(
+        driven=network.driven,
+        asset=get_asset(network.driven),
+        constraint_type=network.constraint_type,
+        node_count=len(network.nodes),
+        connection_count=connection_count,
+        depth=network_depth(network),
+        cost=round(cost, 3),
+        node_types=type_count,
+        suggestions=suggest(network, node_types),
+    )
+
+
+def analyze(
+        driven_list: Optional[List[str]] = None,
+        networks: Optional[Dict[str, net.Network]] = None
+) -> CostReport:
+    """Build the cost report of every Atlas constraint of the scene.
+
+    Args:
+        driven_list (Optional[List[str]]): The driven objects to analyze. If None,
+            every constrained object of the scene is analyzed.
+        networks (Optional[Dict[str, net.Network]]): Networks already walked, by driven name.
+
+    Returns:
+        CostReport: The per constraint and per asset report.
+
+    Example:
+        report = analyze()
+        report.to_json("C:/tmp/rig_cost.json")
+    """
+    report = CostReport()
+    networks = net.get_networks(driven_list) if networks is None else networks
+    for network in networks.values():
+        report.constraints.append(measure(network))
+
+    assets = {}
+    for constraint in report.constraints:
+        asset = assets.setdefault(constraint.asset, AssetCost(asset=constraint.asset))
+        asset.constraint_count += 1
+        asset.node_count += constraint.node_count
+        asset.connection_count += constraint.connection_count
+        asset.max_depth = max(asset.max_depth, constraint.depth)
+        asset.cost = round(asset.cost + constraint.cost, 3)
+
+    # Outliers are networks with a cheaper topology or a cost far above their asset
+    for asset in assets.values():
+        constraints = [constraint for constraint in report.constraints if constraint.asset == asset.asset]
+        costs = [constraint.cost for constraint in constraints]
+        threshold = statistics.mean(costs) + OUTLIER_SIGMA * statistics.pstdev(costs)
+        for constraint in constraints:
+            if constraint.suggestions or (len(costs) > 1 and constraint.cost > threshold):
+                constraint.outlier = True
+                asset.outliers.append(constraint.driven)
+
+    report.assets = sorted(assets.values(), key=lambda asset: asset.cost, reverse=True)
+    return report
+
+
+def record(start: Optional[int] = None, end: Optional[int] = None, buffer_size: int = 200) -> Dict[str, float]:
+    """Record a playback range with the Maya profiler and sum the evaluation time of each node.
+
+    Args:
+        start (Optional[int]): The first frame, the playback start if None.
+        end (Optional[int]): The last frame, the playback end if None.
+        buffer_size (int): The profiler buffer size, in MB.
+
+    Returns:
+        Dict[str, float]: The evaluation time in milliseconds by node name.
+    """
+    start = int(cmds.playbackOptions(query=True, minTime=True)) if start is None else start
+    end = int(cmds.playbackOptions(query=True, maxTime=True)) if end is None else end
+    current = cmds.currentTime(query=True)
+
+    cmds.profiler(reset=True)
+    cmds.profiler(bufferSize=buffer_size)
+    cmds.profiler(sampling=True)
+    try:
+        for frame in range(start, end + 1):
+            cmds.currentTime(frame, update=True)
+    finally:
+        cmds.profiler(sampling=False)
+        cmds.currentTime(current, update=True)
+
+    timings = {}
+    for event in range(cmds.profiler(query=True, eventCount=True)):
+        # Evaluation events carry the node name in their name or their description
+        name = cmds.profiler(query=True, eventIndex=event, eventName=True) or ""
+        description = cmds.profiler(query=True, eventIndex=event, eventDescription=True) or ""
+        duration = cmds.profiler(query=True, eventIndex=event, eventDuration=True) / 1000.0
+        for node in {label.split(" ", 1)[0] for label in (name, description)} - {""}:
+            timings[node] = timings.get(node, 0.0) + duration
+    return timings
+
+
+def profile(
+        driven_list: Optional[List[str]] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+) -> CostReport:
+    """Build the cost report with the evaluation time recorded by the Maya profiler.
+
+    The time of every network node is credited to its driven object, constraints
+    and assets are ranked from the slowest to the fastest.
+
+    Args:
+        driven_list (Optional[List[str]]): The driven objects to analyze. If None,
+            every constrained object of the scene is analyzed.
+        start (Optional[int]): The first frame, the playback start if None.
+        end (Optional[int]): The last frame, the playback end if None.
+
+    Returns:
+        CostReport: The report, ranked by evaluation time.
+
+    Example:
+        report = profile(start=1, end=120)
+        print(report.table())
+        report.to_json("C:/tmp/rig_profile.json")
+        slowest_fixes = report.candidates()
+    """
+    networks = net.get_networks(driven_list)
+    report = analyze(networks=networks)
+    timings = record(start, end)
+
+    for constraint in report.constraints:
+        network = networks.get(constraint.driven)
+        if network:
+            constraint.eval_ms = round(sum(timings.get(node, 0.0) for node in network.nodes), 3)
+
+    for asset in report.assets:
+        asset.eval_ms = round(sum(
+            constraint.eval_ms for constraint in report.constraints if constraint.asset == asset.asset
+        ), 3)
+
+    report.constraints.sort(key=lambda constraint: constraint.eval_ms, reverse=True)
+    report.assets.sort(key=lambda asset: asset.eval_ms, reverse=True)
+    return report
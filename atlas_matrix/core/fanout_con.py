@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+""" DEP class to rivet many objects to a single driver inside Maya
+
+This module provides the `FanoutCon` class, which constrains many driven
+objects to one driver. The driver world matrix brought into each distinct
+parent space is computed once by a shared multMatrix, and every driven only
+adds a single multMatrix holding its own offset.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Dict, List, Optional
+
+import maya.cmds as cmds
+
+from atlas_matrix.core.matrix import Matrix
+from atlas_matrix.core import index
+from atlas_matrix.core.bulk import world_matrices
+from atlas_matrix.core.offsets import compute_offsets
+from atlas_matrix.core.utils import ancestry as anc
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils import transform
+from atlas_matrix.core.utils.handles import MultMatrixHandle
+
+
+# ---------- MAIN CLASS ----------
+
+
+class FanoutCon(Matrix):
+    """
+    Class to create matrix-based parent constraints from one driver to many driven.
+
+    Driven objects sharing a parent share the driverWorld * parentInverse
+    product, so each extra driven costs a single multMatrix.
+    """
+    def __init__(
+            self,
+            driver: str,
+            driven_list: List[str],
+            *,
+            offset: bool = False,
+            **kwargs
+    ):
+        """
+        Initialize the FanoutCon constraint setup.
+
+        Args:
+            driver (str): The name of the driver object.
+            driven_list (List[str]): The driven objects.
+            offset (bool): Keep the current world pose of every driven.
+            **kwargs: Matrix options (ancestry).
+
+        Raises:
+            ValueError: If no driven object is provided.
+        """
+        if not driven_list:
+            raise ValueError("Provide at least one driven object.")
+
+        super().__init__(driven_list[0], [driver], **kwargs)
+        self.constraint_type = "parent"
+        self.driver = driver
+        self.driven_list = list(driven_list)
+        self.offset = offset
+        self.shared: Dict[Optional[str], str] = {}
+
+
+    def _parent(self, driven: str) -> Optional[str]:
+        """
+        Get the parent of a driven object.
+
+        Args:
+            driven (str): The name of the driven object.
+
+        Returns:
+            Optional[str]: The parent, None at world root.
+        """
+        parents = cmds.listRelatives(driven, parent=True)
+        return parents[0] if parents else None
+
+
+    def shared_space(self, parent: Optional[str]) -> str:
+        """
+        Get the driver world matrix expressed in a parent space, created once per parent.
+
+        Args:
+            parent (Optional[str]): The parent of the driven objects, None at world root.
+
+        Returns:
+            str: The output matrix attribute.
+        """
+        if parent in self.shared:
+            return self.shared[parent]
+
+        name = naming.fanout_node_name(self.driver, parent) if parent else None
+        if parent is None:
+            out = self.get_world_matrix(self.driver)
+        elif cmds.objExists(name) and cmds.nodeType(name) == "multMatrix":
+            # Reuse the space shared by an earlier fan-out of the same driver
+            out = MultMatrixHandle(name).output
+        else:
+            shared = MultMatrixHandle(cmds.createNode("multMatrix", name=name))
+            self.connect_attr(self.get_world_matrix(self.driver), shared.matrix_in(0))
+            self.connect_attr(self.get_inverse_world_matrix(parent), shared.matrix_in(1))
+            out = shared.output
+
+        self.shared[parent] = out
+        return out
+
+
+    def mount_system(self):
+        """
+        Internal setup to create the shared spaces and the offset of every driven.
+        """
+        ancestry = self.ancestry if self.ancestry is not None else anc.AncestryIndex()
+        anc.validate_pairs([(driven, [self.driver]) for driven in self.driven_list], ancestry)
+
+        offsets = [None] * len(self.driven_list)
+        if self.offset:
+            matrices = world_matrices(self.driven_list + [self.driver])
+            offsets = compute_offsets(
+                [matrices[driven] for driven in self.driven_list],
+                [matrices[self.driver]] * len(self.driven_list),
+            )
+
+        with self.undo_chunk(name="create"):
+            for driven, offset in zip(self.driven_list, offsets):
+                self.driven = driven
+
+                self.preserve_initial_transform()
+                self.preserve_initial_matrix()
+
+                mult = self.con_mult_matrix(self.driver)
+                if offset:
+                    cmds.setAttr(mult.matrix_in(0), *offset, type="matrix")
+                self.connect_attr(self.shared_space(self._parent(driven)), mult.matrix_in(1))
+                self.connect_attr(mult.output, self.get_offset_parent_matrix(driven))
+
+                transform.idtransform(driven)
+
+                index.register(driven)
+
+            self.driven = self.driven_list[0]
+
+
+# ---------- CONVENIENCE FUNCTIONS ----------
+
+
+def fanout_constraint(driver: str, driven_list: List[str], **kwargs) -> FanoutCon:
+    """
+    Convenience function to rivet many objects to a single driver.
+
+    Args:
+        driver (str): The name of the driver object.
+        driven_list (List[str]): The driven objects.
+        **kwargs: FanoutCon options (offset).
+
+    Returns:
+        FanoutCon: The mounted constraint.
+
+    Example:
+        fanout_constraint("head_ctrl", ["hat", "glasses", "earring_l", "earring_r"], offset=True)
+    """
+    con = FanoutCon(driver, driven_list, **kwargs)
+    con.mount_system()
+    return con
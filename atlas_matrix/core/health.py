@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+""" Scene health scanner for orphaned and half-built Atlas Matrix constraints
+
+A failed build or an incomplete removal can leave Atlas nodes feeding nothing,
+and constraint attributes (`W#`, `initialMatrix`, `initialTransform`) on
+objects without any network. This module finds both in a few batched queries
+and purges them in one undo step.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Dict, List, Optional, Set
+from dataclasses import dataclass, field, asdict
+
+import maya.cmds as cmds
+
+from atlas_matrix.core import index
+from atlas_matrix.core.bulk import bulk_chunk
+from atlas_matrix.core.lod import FROZEN_SOURCE
+from atlas_matrix.core.cache import CACHE_SOURCE
+from atlas_matrix.core.utils import network as net
+from atlas_matrix.core.utils.attributes import WEIGHT_ARRAY
+from atlas_matrix.core.utils.naming import CONSTRAINT_ATTRIBUTE
+
+
+# ---------- CONSTANTS ----------
+
+
+# Attributes pointing to a network kept out of the offsetParentMatrix (frozen or cached)
+HELD_SOURCES = (FROZEN_SOURCE, CACHE_SOURCE)
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class HealthReport:
+    dangling: List[str] = field(default_factory=list)
+    orphan_attributes: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def is_clean(self) -> bool:
+        """Check if the scene has nothing to purge"""
+        return not self.dangling and not self.orphan_attributes
+
+    def to_dict(self) -> Dict:
+        """Get the report as a dictionary"""
+        return asdict(self)
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _network_outputs() -> Dict[str, str]:
+    """
+    Get the node feeding the network of each constrained object, held networks included.
+
+    Returns:
+        Dict[str, str]: The network output node by driven name.
+    """
+    outputs = {}
+
+    pairs = []
+    atlas_nodes = net.list_atlas_nodes()
+    if atlas_nodes:
+        pairs = cmds.listConnections(atlas_nodes, source=False, destination=True, connections=True, plugs=True) or []
+    for source, destination in zip(pairs[::2], pairs[1::2]):
+        driven, _, attribute = destination.partition(".")
+        if attribute == "offsetParentMatrix":
+            outputs[driven] = source.split(".", 1)[0]
+
+    for attribute in HELD_SOURCES:
+        for plug in cmds.ls(f"*.{attribute}", recursive=True) or []:
+            sources = cmds.listConnections(plug, source=True, destination=False) or []
+            if sources:
+                outputs[plug.split(".", 1)[0]] = sources[0]
+
+    return outputs
+
+
+def find_dangling(outputs: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Find the Atlas nodes with no path to any offsetParentMatrix.
+
+    Args:
+        outputs (Optional[Dict[str, str]]): The network output node by driven name.
+
+    Returns:
+        List[str]: The dangling node names.
+    """
+    outputs = _network_outputs() if outputs is None else outputs
+
+    live: Set[str] = set()
+    for node in set(outputs.values()):
+        live.update(cmds.listHistory(node, pruneDagObjects=True) or [])
+
+    return [node for node in net.list_atlas_nodes() if node not in live]
+
+
+def find_orphan_attributes(outputs: Optional[Dict[str, str]] = None) -> Dict[str, List[str]]:
+    """
+    Find the constraint attributes left on objects without network.
+
+    Args:
+        outputs (Optional[Dict[str, str]]): The network output node by driven name.
+
+    Returns:
+        Dict[str, List[str]]: The orphan attribute names by object name.
+    """
+    outputs = _network_outputs() if outputs is None else outputs
+
+    candidates = set()
+    for attribute in ("initialMatrix", "initialTransform", "W0", WEIGHT_ARRAY):
+        candidates.update(plug.split(".", 1)[0] for plug in cmds.ls(f"*.{attribute}", recursive=True) or [])
+
+    orphans = {}
+    for node in sorted(candidates - set(outputs)):
+        attributes = [attr for attr in cmds.listAttr(node, userDefined=True) or [] if CONSTRAINT_ATTRIBUTE.match(attr)]
+        if attributes:
+            orphans[node] = attributes
+    return orphans
+
+
+def scan() -> HealthReport:
+    """
+    Scan the scene for dangling Atlas nodes and orphan constraint attributes.
+
+    Returns:
+        HealthReport: The findings.
+    """
+    outputs = _network_outputs()
+    return HealthReport(
+        dangling=find_dangling(outputs),
+        orphan_attributes=find_orphan_attributes(outputs),
+    )
+
+
+def purge(report: Optional[HealthReport] = None) -> HealthReport:
+    """
+    Delete every dangling node and orphan attribute in one undo step.
+
+    Args:
+        report (Optional[HealthReport]): A previous scan, the scene is scanned if None.
+
+    Returns:
+        HealthReport: The purged findings.
+
+    Example:
+        from atlas_matrix.core import health
+        report = health.scan()
+        if not report.is_clean:
+            health.purge(report)
+    """
+    report = scan() if report is None else report
+    if report.is_clean:
+        return report
+
+    with bulk_chunk("purge"):
+        dangling = [node for node in report.dangling if cmds.objExists(node)]
+        if dangling:
+            cmds.delete(dangling)
+
+        for node, attributes in report.orphan_attributes.items():
+            # Children of initialTransform go with it
+            for attribute in attributes:
+                if cmds.attributeQuery(attribute, node=node, exists=True):
+                    cmds.deleteAttr(node, attribute=attribute)
+            index.unregister(node)
+
+    return report
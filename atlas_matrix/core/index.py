@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+""" Scene index of the objects constrained by Atlas Matrix
+
+Every constraint builder registers its driven object on a single network node,
+`atlas_matrix_index`, by connecting the driven `message` plug into the
+`constrained` multi attribute. Scene-wide tools read the index instead of
+scanning every matrix node of the scene. Message connections follow renames
+and reparenting, and deleted objects simply drop out of the index.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Optional
+
+import maya.cmds as cmds
+
+from atlas_matrix.core.utils import network as net
+
+
+# ---------- CONSTANTS ----------
+
+
+INDEX_NODE = "atlas_matrix_index"
+INDEX_ATTRIBUTE = "constrained"
+
+
+# ---------- FUNCTIONS ----------
+
+
+def get_index(create: bool = False) -> Optional[str]:
+    """
+    Get the index node of the scene.
+
+    Args:
+        create (bool): Create the node if it does not exist.
+
+    Returns:
+        Optional[str]: The index node, None if it does not exist and is not created.
+    """
+    if cmds.objExists(INDEX_NODE):
+        return INDEX_NODE
+    if not create:
+        return None
+
+    node = cmds.createNode("network", name=INDEX_NODE, skipSelect=True)
+    cmds.addAttr(node, longName=INDEX_ATTRIBUTE, attributeType="message", multi=True, indexMatters=False)
+    return node
+
+
+def _index_plugs(driven: str) -> List[str]:
+    """
+    Get the index plugs a driven object is connected to.
+
+    Args:
+        driven (str): The name of the driven object.
+
+    Returns:
+        List[str]: The connected index plugs.
+    """
+    plugs = cmds.listConnections(f"{driven}.message", source=False, destination=True, plugs=True) or []
+    return [plug for plug in plugs if plug.startswith(f"{INDEX_NODE}.{INDEX_ATTRIBUTE}[")]
+
+
+def register(driven: str) -> None:
+    """
+    Add a constrained object to the index.
+
+    Args:
+        driven (str): The name of the driven object.
+    """
+    node = get_index(create=True)
+    if _index_plugs(driven):
+        return
+    cmds.connectAttr(f"{driven}.message", f"{node}.{INDEX_ATTRIBUTE}", nextAvailable=True)
+
+
+def unregister(driven: str) -> None:
+    """
+    Remove a constrained object from the index.
+
+    Args:
+        driven (str): The name of the driven object.
+    """
+    for plug in _index_plugs(driven):
+        cmds.disconnectAttr(f"{driven}.message", plug)
+        cmds.removeMultiInstance(plug, b=True)
+
+
+def list_indexed() -> List[str]:
+    """
+    List the constrained objects of the index.
+
+    Returns:
+        List[str]: The driven object names, empty if the scene has no index.
+    """
+    node = get_index()
+    if not node:
+        return []
+    return cmds.listConnections(f"{node}.{INDEX_ATTRIBUTE}", source=True, destination=False) or []
+
+
+def rebuild_index() -> List[str]:
+    """
+    Rebuild the index by scanning the scene, for scenes built before it existed.
+
+    Returns:
+        List[str]: The indexed driven object names.
+    """
+    node = get_index()
+    if node:
+        cmds.delete(node)
+
+    constrained = net.list_constrained()
+    for driven in constrained:
+        register(driven)
+    return constrained
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+""" Playback level of detail for Atlas Matrix constraint networks
+
+Freezing captures the current offsetParentMatrix of every indexed control,
+disconnects it from its constraint network and sets the `frozen` state on the
+network nodes, so the constraint layer costs nothing during playback. The
+source of each offsetParentMatrix is remembered on the control itself (a
+message connection plus the attribute name) and unfreezing reconnects
+everything in one undo step.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Optional, Sequence
+
+import maya.cmds as cmds
+
+from atlas_matrix.core import index
+from atlas_matrix.core.bulk import bulk_chunk
+from atlas_matrix.core.utils import network as net
+
+
+# ---------- CONSTANTS ----------
+
+
+FROZEN_SOURCE = "atlasFrozenSource"
+FROZEN_PLUG = "atlasFrozenPlug"
+LOD_STATE = "lodFrozen"
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _driven_list(driven_list: Optional[Sequence[str]]) -> List[str]:
+    """
+    Get the controls to process, from the index when none are given.
+
+    Args:
+        driven_list (Optional[Sequence[str]]): The driven objects.
+
+    Returns:
+        List[str]: The driven objects.
+    """
+    if driven_list is not None:
+        return list(driven_list)
+    return index.list_indexed() or index.rebuild_index()
+
+
+def network_nodes(source_node: str) -> List[str]:
+    """
+    Get the Atlas nodes upstream of a network output, stopping at DAG objects.
+
+    Args:
+        source_node (str): The node feeding the offsetParentMatrix.
+
+    Returns:
+        List[str]: The network nodes.
+    """
+    history = cmds.listHistory(source_node, pruneDagObjects=True) or []
+    return [node for node in history if cmds.nodeType(node) in net.ATLAS_NODE_TYPES]
+
+
+def _set_state(frozen: bool) -> None:
+    """
+    Store the scene LOD state on the index node.
+
+    Args:
+        frozen (bool): The new state.
+    """
+    node = index.get_index(create=True)
+    if not cmds.attributeQuery(LOD_STATE, node=node, exists=True):
+        cmds.addAttr(node, longName=LOD_STATE, attributeType="bool")
+    cmds.setAttr(f"{node}.{LOD_STATE}", frozen)
+
+
+def is_frozen() -> bool:
+    """
+    Check if the constraint layer of the scene is frozen.
+
+    Returns:
+        bool: True if the last toggle froze the constraints.
+    """
+    node = index.get_index()
+    if not node or not cmds.attributeQuery(LOD_STATE, node=node, exists=True):
+        return False
+    return cmds.getAttr(f"{node}.{LOD_STATE}")
+
+
+def freeze(driven_list: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Hold the current offsetParentMatrix of constrained controls and freeze their networks.
+
+    Nodes also feeding a constraint left live, such as the shared space of a
+    fan-out constraint, are not frozen and are reported with a warning.
+
+    Args:
+        driven_list (Optional[Sequence[str]]): The driven objects. If None, every
+            indexed object of the scene is used.
+
+    Returns:
+        List[str]: The frozen driven objects.
+    """
+    # Read every source and value before any network is cut
+    captured = []
+    for driven in _driven_list(driven_list):
+        opm = f"{driven}.offsetParentMatrix"
+        sources = cmds.listConnections(opm, source=True, destination=False, plugs=True) or []
+        if not sources:
+            continue
+        captured.append((driven, sources[0], cmds.getAttr(opm)))
+
+    # Nodes of the constraints left live keep evaluating, cmds.ls([]) would list the whole scene
+    frozen = set(cmds.ls([driven for driven, _, _ in captured], long=True) or []) if captured else set()
+    shared = set()
+    for driven in index.list_indexed():
+        if next(iter(cmds.ls(driven, long=True) or []), None) in frozen:
+            continue
+        sources = cmds.listConnections(f"{driven}.offsetParentMatrix", source=True, destination=False) or []
+        if sources:
+            shared.update(network_nodes(sources[0]))
+
+    skipped = set()
+    with bulk_chunk("freeze"):
+        for driven, source, value in captured:
+            source_node, _, source_attribute = source.partition(".")
+
+            if not cmds.attributeQuery(FROZEN_SOURCE, node=driven, exists=True):
+                cmds.addAttr(driven, longName=FROZEN_SOURCE, attributeType="message", hidden=True)
+                cmds.addAttr(driven, longName=FROZEN_PLUG, dataType="string", hidden=True)
+            cmds.connectAttr(f"{source_node}.message", f"{driven}.{FROZEN_SOURCE}", force=True)
+            cmds.setAttr(f"{driven}.{FROZEN_PLUG}", source_attribute, type="string")
+
+            cmds.disconnectAttr(source, f"{driven}.offsetParentMatrix")
+            cmds.setAttr(f"{driven}.offsetParentMatrix", *value, type="matrix")
+
+            for node in network_nodes(source_node):
+                if node in shared:
+                    skipped.add(node)
+                    continue
+                cmds.setAttr(f"{node}.frozen", True)
+
+        if driven_list is None:
+            _set_state(True)
+
+    if skipped:
+        cmds.warning(f"Nodes shared with live constraints left unfrozen: {', '.join(sorted(skipped))}")
+
+    return [driven for driven, _, _ in captured]
+
+
+def unfreeze(driven_list: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Reconnect frozen constraint networks to their controls.
+
+    Args:
+        driven_list (Optional[Sequence[str]]): The driven objects. If None, every
+            indexed object of the scene is used.
+
+    Returns:
+        List[str]: The restored driven objects.
+    """
+    restored = []
+    with bulk_chunk("unfreeze"):
+        for driven in _driven_list(driven_list):
+            if not cmds.attributeQuery(FROZEN_SOURCE, node=driven, exists=True):
+                continue
+
+            source_nodes = cmds.listConnections(f"{driven}.{FROZEN_SOURCE}", source=True, destination=False) or []
+            source_attribute = cmds.getAttr(f"{driven}.{FROZEN_PLUG}")
+            if not source_nodes or not source_attribute:
+                cmds.warning(f"Frozen network of {driven} is missing, left as is.")
+                continue
+
+            for node in network_nodes(source_nodes[0]):
+                cmds.setAttr(f"{node}.frozen", False)
+
+            cmds.connectAttr(f"{source_nodes[0]}.{source_attribute}", f"{driven}.offsetParentMatrix", force=True)
+            cmds.deleteAttr(f"{driven}.{FROZEN_SOURCE}")
+            cmds.deleteAttr(f"{driven}.{FROZEN_PLUG}")
+            restored.append(driven)
+
+        if driven_list is None:
+            _set_state(False)
+
+    return restored
+
+
+def toggle() -> bool:
+    """
+    Freeze or unfreeze the whole constraint layer of the scene.
+
+    Returns:
+        bool: True if the layer is now frozen.
+
+    Example:
+        from atlas_matrix.core import lod
+        lod.toggle()
+    """
+    if is_frozen():
+        unfreeze()
+        return False
+    freeze()
+    return True
@@ -31,13 +31,24 @@ limitations under the License.
 
 # ---------- IMPORT ----------
 
-from typing import Optional, List, Union, Tuple, Callable
+from typing import Optional, List, Union, Tuple, Callable, Dict, Iterable, Set
 from contextlib import contextmanager
 
 import maya.cmds as cmds
 from atlas_matrix.core.utils import nodes
 from atlas_matrix.core.utils import attributes
 from atlas_matrix.core.utils import verification
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils import ancestry as anc
+from atlas_matrix.core.utils.plugs import TrustedPlug
+from atlas_matrix.core.utils.handles import (
+    HoldMatrixHandle,
+    MultMatrixHandle,
+    BlendMatrixHandle,
+    AimMatrixHandle,
+    ComposeMatrixHandle,
+    DecomposeMatrixHandle,
+)
 
 
 # ---------- MAIN CLASS ----------
@@ -51,12 +62,23 @@ class Matrix:
     pickMatrix, holdMatrix, and blendMatrix nodes for precise control over
     transformations.
     """
-    def __init__(self, driven: Optional[str] = None, drivers: Optional[List[str]] = None) -> None:
+    def __init__(
+            self,
+            driven: Optional[str] = None,
+            drivers: Optional[List[str]] = None,
+            *,
+            ancestry: Optional[anc.AncestryIndex] = None,
+            weight_array: bool = False
+    ) -> None:
         """Initialize the Matrix constraint builder.
 
         Args:
             driven (Optional[str]): The name of the driven object.
             drivers (Optional[List[str]]): A list of driver object names.
+            ancestry (Optional[AncestryIndex]): A prebuilt ancestry index shared by a batch,
+                used to check cycles before building.
+            weight_array (bool): Store the blend weights in the single `atlasWeights`
+                multi attribute instead of one W# attribute per driver.
 
         Raises:
             ValueError: If neither `driven` nor `drivers` are provided.
@@ -65,6 +87,9 @@ class Matrix:
         self.driven = driven or (user_sel[-1] if user_sel else None)
         self.drivers = drivers or (user_sel[:-1] if user_sel else [])
         self.constraint_type = ""
+        self.ancestry = ancestry
+        self.weight_array = weight_array
+        self.validated_plugs: Set[str] = set()
         if not self.driven or not self.drivers:
             raise ValueError("Provide driven and at least one driver.")
 
@@ -96,6 +121,27 @@ class Matrix:
         }.get(self.constraint_type, "")
 
 
+    def dependencies(self) -> List[str]:
+        """Get the objects whose world matrix feeds the constraint.
+
+        Returns:
+            List[str]: The driver names.
+        """
+        return list(self.drivers)
+
+
+    def validate_hierarchy(self) -> None:
+        """Check that no driver would create a cycle, before any node is created.
+
+        Without a shared ancestry index, each driver hierarchy is walked up.
+
+        Raises:
+            ValueError: If a driver is the driven or sits below it.
+        """
+        ancestry = self.ancestry if self.ancestry is not None else anc.AncestryIndex()
+        anc.validate_pairs([(self.driven, self.dependencies())], ancestry)
+
+
     @staticmethod
     def _attribute_validation(attribute_list: List[str]) -> None:
         """Validate that all submitted strings are valid Maya attributes.
@@ -111,6 +157,18 @@ class Matrix:
             raise ValueError(f"Invalid attributes detected: {invalid}")
 
 
+    def _untrusted(self, plugs: Iterable[str]) -> List[str]:
+        """Get the plugs that were neither created by the builder nor validated yet.
+
+        Args:
+            plugs (Iterable[str]): The plugs about to be used.
+
+        Returns:
+            List[str]: The plugs that still need a validation.
+        """
+        return [plug for plug in plugs if not isinstance(plug, TrustedPlug) and plug not in self.validated_plugs]
+
+
     def _attribute_have_same_datatype(self, attribute_a: str, attribute_b: str) -> bool:
         """
         Compare whether two attributes share the same data type (shape + element type).
@@ -157,7 +215,7 @@ class Matrix:
         Returns:
             str: A single driver name string.
         """
-        return driver if isinstance(driver, str) else "_".join(driver)
+        return naming.driver_name(driver)
 
 
     def _create_matrix_node(self, node_type: str, driver: str) -> str:
@@ -170,7 +228,7 @@ class Matrix:
         Returns:
             str: The name of the created matrix node.
         """
-        node_name = f"{node_type.lower()}_{self.driven}_{self.constraining_name}_{self._driver_name(driver)}"
+        node_name = naming.matrix_node_name(node_type, self.driven, self.constraining_name, driver)
         node = cmds.createNode(node_type, name=node_name)
         return node
 
@@ -205,7 +263,7 @@ class Matrix:
         Returns:
             str: The name of the created blendMatrix node.
         """
-        name = f"blendMatrix_{self.driven}_space_shifter"
+        name = naming.blend_node_name(self.driven)
         return cmds.createNode("blendMatrix", name=name)
 
 
@@ -233,13 +291,25 @@ class Matrix:
         return self._create_matrix_node("composeMatrix", driver)
 
 
+    def aim_matrix(self, driver: str) -> str:
+        """Create an aimMatrix node for the given driver.
+
+        Args:
+            driver (str): The name of the driver node.
+
+        Returns:
+            str: The name of the created aimMatrix node.
+        """
+        return self._create_matrix_node("aimMatrix", driver)
+
+
     def identity_matrix(self) -> str:
         """Create a identityMatrix node for the given driver.
 
         Returns:
             str: The name of the created identityMatrix node.
         """
-        node_name = f"composematrix_{self.driven}_identity_parent"
+        node_name = naming.identity_node_name(self.driven)
         node = cmds.createNode("composeMatrix", name=node_name)
         return node
 
@@ -264,14 +334,14 @@ class Matrix:
         if "matrix" in node_type.lower():
 
             if verification.is_inversematrix(matrix_node) or verification.is_holdmatrix(matrix_node):
-                return f"{matrix_node}.outMatrix"
+                return TrustedPlug(f"{matrix_node}.outMatrix")
 
             elif verification.is_multmatrix(matrix_node) or verification.is_addmatrix(
                     matrix_node) or verification.is_wtaddmatrix(matrix_node):
-                return f"{matrix_node}.matrixSum"
+                return TrustedPlug(f"{matrix_node}.matrixSum")
 
             else:
-                return f"{matrix_node}.outputMatrix"
+                return TrustedPlug(f"{matrix_node}.outputMatrix")
 
         else:
             raise ValueError(f"Invalid matrix node: {matrix_node}")
@@ -296,10 +366,10 @@ class Matrix:
         if "matrix" in node_type.lower():
 
             if verification.is_holdmatrix(matrix_node):
-                return f"{matrix_node}.inMatrix"
+                return TrustedPlug(f"{matrix_node}.inMatrix")
 
             else:
-                return f"{matrix_node}.inputMatrix"
+                return TrustedPlug(f"{matrix_node}.inputMatrix")
 
         else:
             raise ValueError(f"Invalid matrix node: {matrix_node}")
@@ -322,7 +392,7 @@ class Matrix:
         if not cmds.attributeQuery('matrix', node=matrix_node, exists=True):
             raise ValueError(f"Submitted node {matrix_node} does not contain a matrix attribute")
 
-        return f"{matrix_node}.matrix"
+        return TrustedPlug(f"{matrix_node}.matrix")
 
 
     @staticmethod
@@ -342,7 +412,7 @@ class Matrix:
         if not cmds.attributeQuery('worldMatrix', node=matrix_node, exists=True):
             raise ValueError(f"Submitted node {matrix_node} does not contain a worldMatrix attribute")
 
-        return f"{matrix_node}.worldMatrix[0]"
+        return TrustedPlug(f"{matrix_node}.worldMatrix[0]")
 
 
     @staticmethod
@@ -362,7 +432,7 @@ class Matrix:
         if not cmds.attributeQuery('worldInverseMatrix', node=matrix_node, exists=True):
             raise ValueError(f"Submitted node {matrix_node} does not contain a worldInverseMatrix attribute")
 
-        return f"{matrix_node}.worldInverseMatrix[0]"
+        return TrustedPlug(f"{matrix_node}.worldInverseMatrix[0]")
 
 
     @staticmethod
@@ -382,12 +452,14 @@ class Matrix:
         if not cmds.attributeQuery('offsetParentMatrix', node=matrix_node, exists=True):
             raise ValueError(f"Submitted node {matrix_node} does not contain a offsetParentMatrix attribute")
 
-        return f"{matrix_node}.offsetParentMatrix"
+        return TrustedPlug(f"{matrix_node}.offsetParentMatrix")
 
 
     def connect_matrix(self, source: str, target: str) -> None:
         """Connect one matrix attribute to another.
 
+        Trusted plugs and plugs already validated by this builder are not checked again.
+
         Args:
             source (str): The source attribute (e.g., "multMatrix.matrixSum").
             target (str): The target attribute (e.g., "object.offsetParentMatrix").
@@ -395,7 +467,10 @@ class Matrix:
         Raises:
             ValueError: If either attribute is invalid.
         """
-        self._attribute_validation([source, target])
+        untrusted = self._untrusted([source, target])
+        if untrusted:
+            self._attribute_validation(untrusted)
+            self.validated_plugs.update(untrusted)
 
         cmds.connectAttr(source, target)
 
@@ -410,12 +485,15 @@ class Matrix:
         Raises:
             ValueError: If either attribute is invalid.
         """
-        self._attribute_validation([source, target])
+        untrusted = self._untrusted([source, target])
+        if untrusted:
+            self._attribute_validation(untrusted)
+            self.validated_plugs.update(untrusted)
 
         cmds.disconnectAttr(source, target)
 
 
-    def con_hold_matrix(self, driver: str) -> Tuple[str, str, str]:
+    def con_hold_matrix(self, driver: str) -> HoldMatrixHandle:
         """
         Create a hold matrix node to maintain offset between objects.
 
@@ -423,17 +501,12 @@ class Matrix:
             driver (str): The name of the driver node.
 
         Returns:
-            str: Hold matrix name.
+            HoldMatrixHandle: Handle on the created holdMatrix.
         """
-        node_hold = self.hold_matrix(driver)
-
-        in_hold = self.get_in_matrix(node_hold)
-        out_hold = self.get_out_matrix(node_hold)
+        return HoldMatrixHandle(self.hold_matrix(driver))
 
-        return node_hold, in_hold, out_hold
 
-
-    def con_mult_matrix(self, driver: str) -> Tuple[str, Callable[[int], str], str]:
+    def con_mult_matrix(self, driver: str) -> MultMatrixHandle:
         """
         Create a mult matrix node to constrain object.
 
@@ -441,80 +514,58 @@ class Matrix:
             driver (str): The name of the driver node.
 
         Returns:
-            Tuple[str, Callable[[int], str], str]: mult matrix name.
+            MultMatrixHandle: Handle on the created multMatrix.
         """
-        node_mult = self.mult_matrix(driver)
-
-        def in_mult(i: int) -> str:
-            return f"{node_mult}.matrixIn[{i}]"
+        return MultMatrixHandle(self.mult_matrix(driver))
 
-        out_mult = self.get_out_matrix(node_mult)
 
-        return node_mult, in_mult, out_mult
-
-
-    def con_blend_matrix(self) -> Tuple[str, str, Callable[[int], str], str, Callable[[int], str]]:
+    def con_blend_matrix(self) -> BlendMatrixHandle:
         """
         Create a blend matrix node to blend constrained objects.
 
         Returns:
-            Tuple[str, str, Callable[[int], str], str]: blend matrix name.
+            BlendMatrixHandle: Handle on the created blendMatrix.
         """
-        node_blend = self.blend_matrix()
-        input_blend = f"{node_blend}.inputMatrix"
-        def in_blend(i: int) -> str:
-            return f"{node_blend}.target[{i}].targetMatrix"
-        out_blend = self.get_out_matrix(node_blend)
-        def in_weight(i: int) -> str:
-            return f"{node_blend}.target[{i}].weight"
-
-        return node_blend, input_blend, in_blend, out_blend, in_weight
+        return BlendMatrixHandle(self.blend_matrix())
 
 
-    def con_compose_matrix(self, driver: str) -> Tuple[str, Callable[[str], str], Callable[[str], str], Callable[[str], str], Callable[[str], str], str]:
+    def con_aim_matrix(self, driver: str) -> AimMatrixHandle:
         """
-        Create a compose matrix node to compose constrained objects.
+        Create an aim matrix node to aim constrained objects.
 
         Args:
             driver (str): The name of the driver node.
+
+        Returns:
+            AimMatrixHandle: Handle on the created aimMatrix.
         """
-        node_compose = self.compose_matrix(driver)
+        return AimMatrixHandle(self.aim_matrix(driver))
+
 
-        def in_translate(axis: str) -> str:
-            return f"{node_compose}.inputTranslate{axis.upper()}"
-        def in_rotate(axis: str) -> str:
-            return f"{node_compose}.inputRotate{axis.upper()}"
-        def in_scale(axis: str) -> str:
-            return f"{node_compose}.inputScale{axis.upper()}"
-        def in_shear(axis: str) -> str:
-            return f"{node_compose}.inputShear{axis.upper()}"
+    def con_compose_matrix(self, driver: str) -> ComposeMatrixHandle:
+        """
+        Create a compose matrix node to compose constrained objects.
 
-        out_compose = self.get_out_matrix(node_compose)
+        Args:
+            driver (str): The name of the driver node.
 
-        return node_compose, in_translate, in_rotate, in_scale, in_shear, out_compose
+        Returns:
+            ComposeMatrixHandle: Handle on the created composeMatrix.
+        """
+        return ComposeMatrixHandle(self.compose_matrix(driver))
 
 
-    def con_decompose_matrix(self, driver: str) -> Tuple[str, str, Callable[[str], str], Callable[[str], str], Callable[[str], str], Callable[[str], str]]:
+    def con_decompose_matrix(self, driver: str) -> DecomposeMatrixHandle:
         """
         Create a decompose matrix node to decompose constrained objects.
 
         Args:
             driver (str): The name of the driver node.
-        """
-        node_decompose = self.decompose_matrix(driver)
 
-        in_decompose = self.get_in_matrix(node_decompose)
-
-        def out_translate(axis: str) -> str:
-            return f"{node_decompose}.outputTranslate{axis.upper()}"
-        def out_rotate(axis: str) -> str:
-            return f"{node_decompose}.outputRotate{axis.upper()}"
-        def out_scale(axis: str) -> str:
-            return f"{node_decompose}.outputScale{axis.upper()}"
-        def out_shear(axis: str) -> str:
-            return f"{node_decompose}.outputShear{axis.upper()}"
-
-        return node_decompose, in_decompose, out_translate, out_rotate, out_scale, out_shear
+        Returns:
+            DecomposeMatrixHandle: Handle on the created decomposeMatrix.
+        """
+        return DecomposeMatrixHandle(self.decompose_matrix(driver))
 
 
     def get_set_attr(self, get_attribute: str, set_attribute: str) -> None:
@@ -540,6 +591,101 @@ class Matrix:
                 cmds.setAttr(set_attribute, value)
 
 
+    def create_attr(self, index: int, blend_weight: Callable[[int], str]) -> str:
+        """
+        Create the attribute on self.driven
+
+        Args:
+            index (int) : The index value
+            blend_weight(str): The input of the blend
+
+        Returns:
+            str : Created attribute
+        """
+        attr_name = f"W{index}"
+        created_attr = TrustedPlug(f"{self.driven}.{attr_name}")
+        cmds.addAttr(
+            self.driven,
+            longName=attr_name,
+            shortName=attr_name,
+            attributeType="float",
+            multi=False,
+            minValue=0.0,
+            maxValue=1.0,
+            defaultValue=1.0,
+            keyable=True
+        )
+
+        self.connect_attr(created_attr, blend_weight(index))
+
+        return created_attr
+
+
+    def create_weight_array(self, count: int, weight: float, blend_weight: Callable[[int], str]) -> List[str]:
+        """
+        Create the atlasWeights multi attribute on self.driven and set every element at once
+
+        Args:
+            count (int): The number of weights.
+            weight (float): The value of every weight but the first one.
+            blend_weight (Callable[[int], str]): The blend weight input by index.
+
+        Returns:
+            List[str]: The weight elements, in driver order.
+        """
+        attr_name = attributes.WEIGHT_ARRAY
+        cmds.addAttr(
+            self.driven,
+            longName=attr_name,
+            attributeType="float",
+            multi=True,
+            minValue=0.0,
+            maxValue=1.0,
+            defaultValue=1.0,
+            keyable=True
+        )
+        cmds.setAttr(f"{self.driven}.{attr_name}[0:{count - 1}]", 1.0, *([weight] * (count - 1)))
+
+        created_attrs = [TrustedPlug(f"{self.driven}.{attr_name}[{index}]") for index in range(count)]
+        for index, created_attr in enumerate(created_attrs):
+            self.connect_attr(created_attr, blend_weight(index))
+
+        return created_attrs
+
+
+    def create_blend(
+            self,
+            outs: List[str],
+            weight: float = 1.0,
+            channel_weights: Optional[Dict[str, float]] = None
+    ) -> Tuple[str, str]:
+        """
+        Create the space shifter blendMatrix and its weight attributes
+
+        Args:
+            outs (List[str]): The output matrix attribute of each driver, in driver order.
+            weight (float): The value applied to every weight attribute but the first one.
+            channel_weights (Optional[Dict[str, float]]): Weight by channel ("translate",
+                "rotate", "scale", "shear") set on the native per-channel weights of every target.
+
+        Returns:
+            Tuple[str, str]: The input matrix and output matrix attributes of the blend.
+        """
+        blend = self.con_blend_matrix()
+        for index, out in enumerate(outs):
+            self.connect_attr(out, blend.target(index))
+            if not self.weight_array:
+                created_attr = self.create_attr(index, blend.weight)
+                if index > 0 :
+                    cmds.setAttr(created_attr, weight)
+            for channel, channel_weight in (channel_weights or {}).items():
+                cmds.setAttr(blend.channel_weight(index, channel), channel_weight)
+        if self.weight_array:
+            self.create_weight_array(len(outs), weight, blend.weight)
+
+        return blend.input, blend.output
+
+
     def get_parent_driven(self):
         """
         Get the parent of the driven node
@@ -554,15 +700,19 @@ class Matrix:
         """
         Connect a source attribute to a target attribute
 
+        Trusted plugs and plugs already validated by this builder are not checked again.
+
         Args:
             source_attribute(str): the attribute with the source connection
             target_attribute(str): the attribute with the target connection
 
         """
-        if not cmds.objExists(source_attribute):
+        untrusted = self._untrusted([source_attribute, target_attribute])
+        if source_attribute in untrusted and not cmds.objExists(source_attribute):
             raise ValueError(f"Source attribute does not exist: {source_attribute}")
-        if not cmds.objExists(target_attribute):
+        if target_attribute in untrusted and not cmds.objExists(target_attribute):
             raise ValueError(f"Target attribute does not exist: {target_attribute}")
+        self.validated_plugs.update(untrusted)
 
         try:
             cmds.connectAttr(source_attribute, target_attribute, force=True)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+""" Left/right mirroring of Atlas parent constraints
+
+This module recreates the parent constraints of one side of a rig on the other
+side. Driven and driver names are mapped through a prefix, suffix or regex
+rule compiled once into a lookup table, drivers without counterpart (spine,
+world...) are kept. Offsets are mirrored mathematically instead of being
+measured in the scene, following the orientation or behaviour convention of
+the rig (see utils.mirroring), and every constraint is built in one pass
+through the bulk builder.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Optional, Sequence
+
+import maya.cmds as cmds
+
+from atlas_matrix.core import index
+from atlas_matrix.core.bulk import bulk_chunk, mount_all
+from atlas_matrix.core.offsets import list_offset_slots
+from atlas_matrix.core.parent_con import ParentCon, AxisFilter, AxisWeights
+from atlas_matrix.core.space_switch import space_target
+from atlas_matrix.core.utils import attributes
+from atlas_matrix.core.utils import matrix_math
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils import network as net
+from atlas_matrix.core.utils.ancestry import AncestryIndex, validate_pairs
+from atlas_matrix.core.utils.mirroring import (
+    MIRROR_AXES,
+    MIRROR_CONVENTIONS,
+    MirrorRule,
+    build_lookup,
+    mirror_offset,
+)
+
+
+# ---------- CONSTANTS ----------
+
+
+CHANNELS = ("translate", "rotate", "scale", "shear")
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _ordered_drivers(network: net.Network) -> List[str]:
+    """
+    Get the drivers of a parent constraint in space shifter target order.
+
+    Args:
+        network (net.Network): The constraint network.
+
+    Returns:
+        List[str]: The drivers.
+    """
+    if not cmds.objExists(naming.blend_node_name(network.driven)):
+        return list(network.drivers)
+    return sorted(network.drivers, key=lambda driver: space_target(network.driven, driver))
+
+
+def _read_options(network: net.Network, drivers: Sequence[str]) -> dict:
+    """
+    Read the ParentCon options of an existing constraint.
+
+    Args:
+        network (net.Network): The constraint network.
+        drivers (Sequence[str]): The drivers, in target order.
+
+    Returns:
+        dict: The ParentCon keyword arguments, offsets excluded.
+    """
+    driven = network.driven
+    driver = drivers[0]
+    options = {
+        "keep_hold": cmds.objExists(naming.matrix_node_name("holdMatrix", driven, "pconstrainedby", driver)),
+    }
+
+    compose = naming.matrix_node_name("composeMatrix", driven, "pconstrainedby", driver)
+    if cmds.objExists(compose):
+        for channel in CHANNELS:
+            options[f"{channel}_filter"] = AxisFilter(*(
+                bool(cmds.listConnections(f"{compose}.input{channel.capitalize()}{axis}", source=True, destination=False))
+                for axis in "XYZ"
+            ))
+
+    blend = naming.blend_node_name(driven)
+    if cmds.objExists(blend):
+        weights = AxisWeights(**{
+            channel: cmds.getAttr(f"{blend}.target[0].{channel}Weight") for channel in CHANNELS
+        })
+        # A single driver blend exists for the envelope or the channel weights
+        options["envelope"] = len(drivers) == 1 and not weights.channels()
+        options["weights"] = weights
+        options["weight_array"] = cmds.attributeQuery(attributes.WEIGHT_ARRAY, node=driven, exists=True)
+    return options
+
+
+def mirror_constraints(
+        rule: Optional[MirrorRule] = None,
+        axis: str = "x",
+        driven_list: Optional[Sequence[str]] = None,
+        convention: str = "orientation"
+) -> List[ParentCon]:
+    """
+    Recreate the parent constraints of one side of a rig on the other side.
+
+    Constraints whose mirrored driven is missing or already constrained are
+    skipped with a warning. Weight values are copied once the constraints are built.
+
+    The convention must match how the mirrored side was built. With "orientation"
+    the local axes of the mirrored objects are reflected like the world, with
+    "behaviour" every local axis is reversed so equal rotations give a symmetric
+    pose. Offsets to drivers without counterpart are only reflected on the driven side.
+
+    Args:
+        rule (Optional[MirrorRule]): The naming rule, "L_" to "R_" prefixes if None.
+        axis (str): The axis normal to the mirror plane.
+        driven_list (Optional[Sequence[str]]): The source driven objects. If None,
+            every indexed object matching the rule is mirrored.
+        convention (str): "orientation" or "behaviour".
+
+    Returns:
+        List[ParentCon]: The mounted constraints.
+
+    Raises:
+        ValueError: If the mirror axis or convention is invalid or a mirrored pair would create a cycle.
+
+    Example:
+        mirror_constraints(MirrorRule("_l", "_r", mode="suffix"), convention="behaviour")
+    """
+    rule = rule or MirrorRule()
+    if axis not in MIRROR_AXES:
+        raise ValueError(f"Invalid mirror axis: {axis}")
+    if convention not in MIRROR_CONVENTIONS:
+        raise ValueError(f"Invalid mirror convention: {convention}")
+
+    networks = {
+        driven: network
+        for driven, network in net.get_networks(index.list_indexed() if driven_list is None else list(driven_list)).items()
+        if network.constraint_type == "parent"
+    }
+    lookup = build_lookup(
+        [name for driven, network in networks.items() for name in [driven] + network.drivers],
+        rule,
+    )
+
+    offsets = {
+        (slot.driven, slot.driver): cmds.getAttr(slot.plug)
+        for slot in list_offset_slots([driven for driven in networks if driven in lookup])
+    }
+
+    specs = []
+    sources = []
+    options = []
+    for driven, network in networks.items():
+        target = lookup.get(driven)
+        if not target:
+            continue
+        if not cmds.objExists(target):
+            cmds.warning(f"Skipping {driven}: mirrored object {target} does not exist.")
+            continue
+        if cmds.listConnections(attributes.get_offset_parent_matrix(target), source=True, destination=False):
+            cmds.warning(f"Skipping {driven}: {target}.offsetParentMatrix is already connected.")
+            continue
+
+        drivers = _ordered_drivers(network)
+        mirrored_drivers = [lookup.get(driver, driver) for driver in drivers]
+        missing = [driver for driver in mirrored_drivers if not cmds.objExists(driver)]
+        if missing:
+            cmds.warning(f"Skipping {driven}: mirrored drivers {missing} do not exist.")
+            continue
+
+        target_options = _read_options(network, drivers)
+        if any((driven, driver) in offsets for driver in drivers):
+            target_options["offset"] = True
+            target_options["offset_matrices"] = [
+                mirror_offset(
+                    offsets.get((driven, driver), matrix_math.IDENTITY),
+                    axis,
+                    convention,
+                    center_driver=driver not in lookup,
+                )
+                for driver in drivers
+            ]
+
+        specs.append((target, mirrored_drivers))
+        sources.append(driven)
+        options.append(target_options)
+
+    if not specs:
+        cmds.warning("No constraint to mirror.")
+        return []
+
+    ancestry = AncestryIndex.from_scene()
+    validate_pairs(specs, ancestry)
+
+    builders = [
+        ParentCon(target, drivers, ancestry=ancestry, **target_options)
+        for (target, drivers), target_options in zip(specs, options)
+    ]
+    with bulk_chunk("mirror"):
+        mount_all(builders, name="mirror")
+
+        for source, builder in zip(sources, builders):
+            for source_plug, target_plug in zip(attributes.get_weight_plugs(source), attributes.get_weight_plugs(builder.driven)):
+                cmds.setAttr(target_plug, cmds.getAttr(source_plug))
+
+    return builders
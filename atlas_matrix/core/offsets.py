@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+""" Bulk re-capture of the maintained offsets of matrix parent constraints
+
+When the rest pose of a rig changes, the offsets stored by constraints built
+with `offset=True` are stale. `recapture_offsets` measures the current world
+matrix of every driven (including its own local transform) against each of
+its drivers and writes the new offsets in place, in the holdMatrix when the
+constraint keeps one, in `matrixIn[0]` of the driver multMatrix otherwise.
+The local transform of each driven is then reset, so its world pose is kept.
+
+NumPy is used for the matrix math when available, OpenMaya otherwise.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Optional, Sequence, Union
+from dataclasses import dataclass
+
+import maya.cmds as cmds
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from atlas_matrix.core.matrix import Matrix
+from atlas_matrix.core.bulk import bulk_chunk
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils import network as net
+from atlas_matrix.core.utils import sampling
+from atlas_matrix.core.utils import transform
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class OffsetSlot:
+    driven: str
+    driver: str
+    plug: str
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _offset_plug(driven: str, driver: str) -> Optional[str]:
+    """
+    Get the plug storing the offset of a driver, None if the constraint has no offset.
+
+    Args:
+        driven (str): The name of the driven object.
+        driver (str): The name of the driver object.
+
+    Returns:
+        Optional[str]: The holdMatrix input or the multMatrix matrixIn[0] plug.
+    """
+    hold_node = naming.matrix_node_name("holdMatrix", driven, "pconstrainedby", driver)
+    if cmds.objExists(hold_node):
+        return f"{hold_node}.inMatrix"
+
+    mult_node = naming.matrix_node_name("multMatrix", driven, "pconstrainedby", driver)
+    if not cmds.objExists(mult_node):
+        return None
+
+    # matrixIn[0] only exists when the offset was set, connected inputs are left alone
+    if 0 not in (cmds.getAttr(f"{mult_node}.matrixIn", multiIndices=True) or []):
+        return None
+    if cmds.listConnections(f"{mult_node}.matrixIn[0]", source=True, destination=False):
+        return None
+    return f"{mult_node}.matrixIn[0]"
+
+
+def list_offset_slots(constraints: Optional[Sequence[Union[str, Matrix]]] = None) -> List[OffsetSlot]:
+    """
+    List the offset plugs of many parent constraints.
+
+    Args:
+        constraints (Optional[Sequence[Union[str, Matrix]]]): Driven names or builders.
+            If None, every constrained object of the scene is used.
+
+    Returns:
+        List[OffsetSlot]: One slot per driver holding an offset.
+    """
+    driven_list = None
+    if constraints is not None:
+        driven_list = [con.driven if isinstance(con, Matrix) else con for con in constraints]
+
+    slots = []
+    for driven, network in net.get_networks(driven_list).items():
+        if network.constraint_type != "parent":
+            continue
+        for driver in network.drivers:
+            plug = _offset_plug(driven, driver)
+            if plug:
+                slots.append(OffsetSlot(driven=driven, driver=driver, plug=plug))
+    return slots
+
+
+def compute_offsets(driven_worlds: Sequence[Sequence[float]], driver_worlds: Sequence[Sequence[float]]) -> List[List[float]]:
+    """
+    Compute drivenWorld * driverWorld^-1 for many pairs at once.
+
+    Args:
+        driven_worlds (Sequence[Sequence[float]]): Each driven world matrix, as 16 values,
+            a (4, 4) array or an om.MMatrix.
+        driver_worlds (Sequence[Sequence[float]]): Each driver world matrix.
+
+    Returns:
+        List[List[float]]: The 16 values of each offset.
+    """
+    if len(driven_worlds) == 0:
+        return []
+
+    if np is not None:
+        driven = np.asarray(driven_worlds, dtype=np.float64).reshape(-1, 4, 4)
+        driver = np.asarray(driver_worlds, dtype=np.float64).reshape(-1, 4, 4)
+        return np.matmul(driven, np.linalg.inv(driver)).reshape(-1, 16).tolist()
+
+    return [
+        list(sampling.to_mmatrix(driven) * sampling.to_mmatrix(driver).inverse())
+        for driven, driver in zip(driven_worlds, driver_worlds)
+    ]
+
+
+def recapture_offsets(
+        constraints: Optional[Sequence[Union[str, Matrix]]] = None,
+        reset_transform: bool = True
+) -> List[OffsetSlot]:
+    """
+    Re-capture the maintained offsets of many parent constraints on the current pose.
+
+    Args:
+        constraints (Optional[Sequence[Union[str, Matrix]]]): Driven names or builders.
+            If None, every constrained object of the scene is used.
+        reset_transform (bool): Reset the local transform of each driven afterward,
+            keeping its world pose.
+
+    Returns:
+        List[OffsetSlot]: The updated offset slots.
+
+    Example:
+        recapture_offsets(["ctrl_a", "ctrl_b"])
+    """
+    slots = list_offset_slots(constraints)
+    if not slots:
+        cmds.warning("No maintained offset found to re-capture.")
+        return []
+
+    # Read every world matrix in one pass, before anything is written
+    names = list(dict.fromkeys(name for slot in slots for name in (slot.driven, slot.driver)))
+    position = {name: i for i, name in enumerate(names)}
+    worlds = sampling.current_world(names)
+    offsets = compute_offsets(
+        [worlds[position[slot.driven]] for slot in slots],
+        [worlds[position[slot.driver]] for slot in slots],
+    )
+
+    with bulk_chunk("recapture_offsets"):
+        for slot, offset in zip(slots, offsets):
+            cmds.setAttr(slot.plug, *offset, type="matrix")
+
+        if reset_transform:
+            for driven in dict.fromkeys(slot.driven for slot in slots):
+                transform.idtransform(driven)
+
+    return slots
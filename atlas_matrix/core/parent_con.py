@@ -30,13 +30,15 @@ limitations under the License.
 # ---------- IMPORT ----------
 
 
-from typing import Optional, List, Union, Tuple, Callable
+from typing import Optional, List, Sequence, Dict
 from dataclasses import dataclass
 
 import maya.cmds as cmds
 
 from atlas_matrix.core.matrix import Matrix
+from atlas_matrix.core import index
 from atlas_matrix.core.utils import transform
+from atlas_matrix.core.utils.handles import MultMatrixHandle
 
 
 # ---------- DATA CLASS ----------
@@ -57,6 +59,19 @@ class AxisWeights:
     shear: float = 1.0
     all: float = 1.0
 
+    def channels(self) -> Dict[str, float]:
+        """Get the channel weights differing from 1.0, by channel name"""
+        return {
+            channel: value
+            for channel, value in (
+                ("translate", self.translate),
+                ("rotate", self.rotate),
+                ("scale", self.scale),
+                ("shear", self.shear),
+            )
+            if value != 1.0
+        }
+
 
 # ---------- MAIN CLASS ----------
 
@@ -81,7 +96,9 @@ class ParentCon(Matrix):
             rotate_filter: AxisFilter = AxisFilter(),
             scale_filter: AxisFilter = AxisFilter(),
             shear_filter: AxisFilter = AxisFilter(),
-            weights: AxisWeights = AxisWeights()
+            weights: AxisWeights = AxisWeights(),
+            offset_matrices: Optional[List[Sequence[float]]] = None,
+            **kwargs
     ):
         """
         Initialize the ParentCon constraint setup.
@@ -89,8 +106,11 @@ class ParentCon(Matrix):
         Args:
             driven (Optional[str]): The name of the driven object.
             drivers (Optional[List[str]]): A list of driver object names.
+            offset_matrices (Optional[List[Sequence[float]]]): Precomputed offset of each
+                driver (16 values), used instead of measuring it in the scene.
+            **kwargs: Matrix options (ancestry, weight_array).
         """
-        super().__init__(driven, drivers)
+        super().__init__(driven, drivers, **kwargs)
         self.constraint_type="parent"
         self.offset = offset
         self.keep_hold = keep_hold
@@ -101,6 +121,7 @@ class ParentCon(Matrix):
         self.scale_filter = scale_filter or AxisFilter()
         self.shear_filter = shear_filter or AxisFilter()
         self.weights = weights or AxisWeights()
+        self.offset_matrices = offset_matrices
 
 
     def _all_translate(self):
@@ -139,65 +160,43 @@ class ParentCon(Matrix):
             driver (str): The name of the driver object
         """
         # Create temporary mult to get the value of the offset
-        mult_tmp_node, mult_tmp_in, mult_tmp_out = self.con_mult_matrix(f"tmp_{driver}")
+        mult_tmp = self.con_mult_matrix(f"tmp_{driver}")
 
-        self.connect_attr(self.get_world_matrix(self.driven), mult_tmp_in(0))
-        self.connect_attr(self.get_inverse_world_matrix(driver), mult_tmp_in(1))
+        self.connect_attr(self.get_world_matrix(self.driven), mult_tmp.matrix_in(0))
+        self.connect_attr(self.get_inverse_world_matrix(driver), mult_tmp.matrix_in(1))
 
-        return mult_tmp_node, mult_tmp_in, mult_tmp_out
+        return mult_tmp
 
 
-    def create_offset(self, driver: str, mult_in: Callable[[int], str]):
+    def create_offset(self, driver: str, mult: MultMatrixHandle):
         """
         Create the wanted offset type
 
         Args:
             driver(str): The name of the driver object name
-            mult_in(str): The in attribute of the multMatrix with great index.
+            mult(MultMatrixHandle): The multMatrix receiving the offset at index 0.
         """
-        if self.offset:
-            mult_tmp_node, mult_tmp_in, mult_tmp_out = self._mount_offset(driver)
+        if self.offset and self.offset_matrices:
+            offset_matrix = list(self.offset_matrices[self.drivers.index(driver)])
+            if self.keep_hold:
+                hold = self.con_hold_matrix(driver)
+                cmds.setAttr(hold.input, *offset_matrix, type="matrix")
+                self.connect_attr(hold.output, mult.matrix_in(0))
+            else:
+                cmds.setAttr(mult.matrix_in(0), *offset_matrix, type="matrix")
+        elif self.offset:
+            mult_tmp = self._mount_offset(driver)
             if self.keep_hold:
-                hold_node, hold_in, hold_out = self.con_hold_matrix(driver)
-                self.get_set_attr(mult_tmp_out, hold_in)
-                self.connect_attr(hold_out, mult_in(0))
+                hold = self.con_hold_matrix(driver)
+                self.get_set_attr(mult_tmp.output, hold.input)
+                self.connect_attr(hold.output, mult.matrix_in(0))
             else:
-                self.get_set_attr(mult_tmp_out, mult_in(0))
-            cmds.delete(mult_tmp_node)
+                self.get_set_attr(mult_tmp.output, mult.matrix_in(0))
+            cmds.delete(mult_tmp.name)
         else:
             pass
 
 
-    def create_attr(self, index: int, blend_weight: Callable[[int], str]) -> str:
-        """
-        Create the attribute on self.driven
-
-        Args:
-            index (int) : The index value
-            blend_weight(str): The input of the blend
-
-        Returns:
-            str : Created attribute
-        """
-        attr_name = f"W{index}"
-        created_attr = f"{self.driven}.{attr_name}"
-        cmds.addAttr(
-            self.driven,
-            longName=attr_name,
-            shortName=attr_name,
-            attributeType="float",
-            multi=False,
-            minValue=0.0,
-            maxValue=1.0,
-            defaultValue=1.0,
-            keyable=True
-        )
-
-        self.connect_attr(created_attr, blend_weight(index))
-
-        return created_attr
-
-
     def create_axis_filter(self, driver: str):
         """
         Create a composeMatrix if needed
@@ -205,32 +204,34 @@ class ParentCon(Matrix):
         Args:
             driver (str): The name of the driver node.
         """
-        decompose_node, decompose_in, decompose_out_translate, decompose_out_rotate, decompose_out_scale, decompose_out_shear = self.con_decompose_matrix(driver)
-        compose_node, compose_in_translate, compose_in_rotate, compose_in_scale, compose_in_shear, compose_out = self.con_compose_matrix(driver)
+        decompose = self.con_decompose_matrix(driver)
+        compose = self.con_compose_matrix(driver)
 
         for axis, enabled in zip("xyz", [self.translate_filter.x, self.translate_filter.y, self.translate_filter.z]):
             if enabled:
-                self.connect_attr(decompose_out_translate(axis), compose_in_translate(axis))
+                self.connect_attr(decompose.translate(axis), compose.translate(axis))
 
         for axis, enabled in zip("xyz", [self.rotate_filter.x, self.rotate_filter.y, self.rotate_filter.z]):
             if enabled:
-                self.connect_attr(decompose_out_rotate(axis), compose_in_rotate(axis))
+                self.connect_attr(decompose.rotate(axis), compose.rotate(axis))
 
         for axis, enabled in zip("xyz", [self.scale_filter.x, self.scale_filter.y, self.scale_filter.z]):
             if enabled:
-                self.connect_attr(decompose_out_scale(axis), compose_in_scale(axis))
+                self.connect_attr(decompose.scale(axis), compose.scale(axis))
 
         for axis, enabled in zip("xyz", [self.shear_filter.x, self.shear_filter.y, self.shear_filter.z]):
             if enabled:
-                self.connect_attr(decompose_out_shear(axis), compose_in_shear(axis))
+                self.connect_attr(decompose.shear(axis), compose.shear(axis))
 
-        return decompose_in, compose_out
+        return decompose.input, compose.output
 
 
     def mount_system(self):
         """
         Internal setup to create the constraint chain and connect it.
         """
+        self.validate_hierarchy()
+
         with self.undo_chunk(name="create"):
             parent_result = self.get_parent_driven()
 
@@ -254,37 +255,35 @@ class ParentCon(Matrix):
             mult_outs = []
 
             # Setup of the mult system
-            for index, driver in enumerate(self.drivers):
-                mult_node, mult_in, mult_out = self.con_mult_matrix(driver)
+            for driver in self.drivers:
+                mult = self.con_mult_matrix(driver)
 
                 if all_translate and all_rotate and all_scale and all_shear:
-                    self.connect_attr(self.get_world_matrix(driver), mult_in(1))
+                    self.connect_attr(self.get_world_matrix(driver), mult.matrix_in(1))
                 else:
                     # Generate axis filter
                     decompose_in, compose_out = self.create_axis_filter(driver)
                     self.connect_attr(self.get_world_matrix(driver), decompose_in)
-                    self.connect_attr(compose_out, mult_in(1))
+                    self.connect_attr(compose_out, mult.matrix_in(1))
 
-                self.connect_attr(parent_inverse, mult_in(2))
+                self.connect_attr(parent_inverse, mult.matrix_in(2))
 
                 # Generate offset
-                self.create_offset(driver, mult_in)
+                self.create_offset(driver, mult)
 
-                mult_outs.append(mult_out)
+                mult_outs.append(mult.output)
 
-            # Setup of the blend system
-            if len(self.drivers) > 1 or self.envelope:
-                blend_node, blend_input, blend_in, blend_out, blend_in_weight = self.con_blend_matrix()
+            # Setup of the blend system, channel weights use the native blendMatrix target weights
+            channel_weights = self.weights.channels()
+            if len(self.drivers) > 1 or self.envelope or channel_weights:
+                blend_input, blend_out = self.create_blend(mult_outs, self.weights.all, channel_weights)
                 if self.envelope:
                     self.get_set_attr(self.get_matrix(self.driven), blend_input)
-                for index, mult_out in enumerate(mult_outs):
-                    self.connect_attr(mult_outs[index], blend_in(index))
-                    created_attr = self.create_attr(index, blend_in_weight)
-                    if index > 0 :
-                        cmds.setAttr(created_attr, self.weights.all)
                 self.connect_attr(blend_out, self.get_offset_parent_matrix(self.driven))
             # End connection if no blend created
             else:
                 self.connect_attr(mult_outs[0], self.get_offset_parent_matrix(self.driven))
 
-            transform.idtransform(self.driven)
\ No newline at end of file
+            transform.idtransform(self.driven)
+
+            index.register(self.driven)
\ No newline at end of file
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+""" Pure-Python planning of matrix parent constraints
+
+This module computes the part of a ParentCon build that does not require
+Maya: the maintained offset of each driver. Plans are built from `Snapshot`
+data read in one pass before anything is built, so ParentCon skips the
+temporary multMatrix and the getAttr it otherwise needs per driver.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Optional, Sequence
+from dataclasses import dataclass
+
+from atlas_matrix.core.utils import matrix_math
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class Snapshot:
+    driven: str
+    drivers: List[str]
+    driven_world: Sequence[float]
+    driver_worlds: List[Sequence[float]]
+
+
+@dataclass
+class ParentPlan:
+    driven: str
+    drivers: List[str]
+    offset_matrices: Optional[List[List[float]]] = None
+
+
+# ---------- FUNCTIONS ----------
+
+
+def plan_parent(snapshot: Snapshot, offset: bool = False) -> ParentPlan:
+    """Compute the plan of a parent constraint from snapshot data.
+
+    Args:
+        snapshot (Snapshot): The scene data read before any constraint is built.
+        offset (bool): Compute the maintained offset of each driver.
+
+    Returns:
+        ParentPlan: The plan, ready to be given to ParentCon.
+    """
+    plan = ParentPlan(driven=snapshot.driven, drivers=list(snapshot.drivers))
+
+    if offset:
+        plan.offset_matrices = [
+            matrix_math.mult(snapshot.driven_world, matrix_math.inverse(driver_world))
+            for driver_world in snapshot.driver_worlds
+        ]
+
+    return plan
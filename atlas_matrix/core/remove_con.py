@@ -31,6 +31,9 @@ limitations under the License.
 from typing import Optional, List
 import maya.cmds as cmds
 from atlas_matrix.core.matrix import Matrix
+from atlas_matrix.core import index
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils.attributes import WEIGHT_ARRAY, get_weight_plugs
 
 # ---------- MAIN CLASS ----------
 
@@ -65,6 +68,7 @@ class RemoveCon(Matrix):
 
         # Don't call super().__init__ to avoid driver requirement
         self.drivers = []
+        self.validated_plugs = set()
         self.constraint_type = constraint_type or self._detect_constraint_type()
 
         if not self.constraint_type:
@@ -108,7 +112,7 @@ class RemoveCon(Matrix):
                 # Check for explicit constraint naming
                 if 'pconstrainedby' in node:
                     return "parent"
-                elif 'aconstrainedby' in node:
+                elif naming.is_aim_name(node):
                     return "aim"
                 # Check for space_shifter (blendMatrix) or other constraint patterns
                 elif 'space_shifter' in node and self.driven in node:
@@ -130,28 +134,33 @@ class RemoveCon(Matrix):
         for node in all_connections:
             if 'pconstrainedby' in node and self.driven in node:
                 return "parent"
-            elif 'aconstrainedby' in node and self.driven in node:
+            elif naming.is_aim_name(node) and self.driven in node:
                 return "aim"
             elif 'space_shifter' in node and self.driven in node:
                 return "parent"
 
-        # Check for weight attributes that indicate constraint type
-        user_attrs = cmds.listAttr(self.driven, userDefined=True) or []
+        # Weight attributes are created by both constraint types, the nodes they feed tell them apart
+        weight_plugs = get_weight_plugs(self.driven)
+        if weight_plugs:
+            return self._weights_constraint_type(weight_plugs)
 
-        # Look for W0, W1, etc. attributes (common in constraints)
-        has_weights = any(attr.startswith('W') and attr[1:].isdigit()
-                          for attr in user_attrs)
+        return None
 
-        # If we have weight attributes and initialTransform or initialMatrix,
-        # assume parent constraint
-        if has_weights:
-            if ('initialTransform' in user_attrs or
-                    'initialMatrix' in user_attrs):
-                return "parent"
-            # Even without initial attributes, W attributes strongly suggest parent constraint
-            return "parent"
+    def _weights_constraint_type(self, weight_plugs: List[str]) -> str:
+        """
+        Detect the type of constraint fed by the weight attributes of the driven object.
 
-        return None
+        Args:
+            weight_plugs (List[str]): The weight plugs of the driven object.
+
+        Returns:
+            str: "aim" if the weights feed an aim network, "parent" otherwise.
+        """
+        fed = cmds.listConnections(weight_plugs, source=False, destination=True) or []
+        history = cmds.listHistory(fed) if fed else []
+        if cmds.ls(history, type="aimMatrix") or any(naming.is_aim_name(node) for node in history):
+            return "aim"
+        return "parent"
 
     def _get_constraint_nodes(self) -> List[str]:
         """
@@ -295,6 +304,11 @@ class RemoveCon(Matrix):
         """
         Remove all constraint-related custom attributes from the driven object.
         """
+        # A weight array holds every weight, no need to scan the user attributes
+        if cmds.attributeQuery(WEIGHT_ARRAY, node=self.driven, exists=True):
+            self._delete_attributes([WEIGHT_ARRAY, 'initialTransform', 'initialMatrix'])
+            return
+
         user_attrs = cmds.listAttr(self.driven, userDefined=True) or []
 
         attrs_to_remove = []
@@ -312,7 +326,15 @@ class RemoveCon(Matrix):
         if 'initialMatrix' in user_attrs:
             attrs_to_remove.append('initialMatrix')
 
-        # Delete attributes
+        self._delete_attributes(attrs_to_remove)
+
+    def _delete_attributes(self, attrs_to_remove: List[str]) -> None:
+        """
+        Delete the given attributes of the driven object, skipping the missing ones.
+
+        Args:
+            attrs_to_remove (List[str]): The attribute names.
+        """
         for attr in attrs_to_remove:
             full_attr = f"{self.driven}.{attr}"
             try:
@@ -384,6 +406,8 @@ class RemoveCon(Matrix):
             # Remove custom attributes
             self._remove_constraint_attributes()
 
+            index.unregister(self.driven)
+
             print(f"Successfully removed {self.constraint_type} constraint from {self.driven}")
 
 
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+""" Retargeting of a driver across every Atlas constraint using it
+
+This module swaps a driver for another one in place. Every constraint network
+reading the old driver matrix is reconnected to the new driver and its nodes
+are renamed after it, nothing is removed or rebuilt, so the node identities
+and the weight animation survive. Offsets can be recomputed in one batch to
+keep the current pose.
+
+A fan-out space shared with driven objects left out of the retarget is not
+touched, the retargeted ones get their own shared space for the new driver.
+ChainCon local links read the driver local matrix through a constant offset
+measured against the old driver parents, they are skipped with a warning.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Dict, List, Optional, Sequence, Set
+
+import maya.cmds as cmds
+
+from atlas_matrix.core import index
+from atlas_matrix.core.bulk import bulk_chunk
+from atlas_matrix.core.offsets import compute_offsets
+from atlas_matrix.core.utils import matrix_math
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils import network as net
+
+
+# ---------- CONSTANTS ----------
+
+
+# Driver output read by the constraint networks
+DRIVER_ATTRIBUTE = "worldMatrix[0]"
+
+# Driver output read by ChainCon local links
+LOCAL_ATTRIBUTE = "matrix"
+
+# Constraint tokens of the per-driver node names
+CONSTRAINING_NAMES = ("pconstrainedby", "aconstrainedby")
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _renamed(node: str, driven: str, parent: Optional[str], old: str, new: str) -> Optional[str]:
+    """
+    Get the name of a network node once its driver is renamed.
+
+    Only the exact names given by the naming scheme for the old driver are
+    renamed, a node whose name merely ends like the driver is left alone.
+
+    Args:
+        node (str): The name of the node.
+        driven (str): The driven object of the network.
+        parent (Optional[str]): The parent of the driven object, naming its fan-out space.
+        old (str): The old driver name.
+        new (str): The new driver name.
+
+    Returns:
+        Optional[str]: The new name, None if the node is not named after the driver.
+    """
+    node_type = cmds.nodeType(node)
+    for constraining_name in CONSTRAINING_NAMES:
+        if node == naming.matrix_node_name(node_type, driven, constraining_name, old):
+            return naming.matrix_node_name(node_type, driven, constraining_name, new)
+    if parent and node == naming.fanout_node_name(old, parent):
+        return naming.fanout_node_name(new, parent)
+    return None
+
+
+def _fanout_space(old: str, new: str, shared: str, consumers: Set[str]) -> Optional[str]:
+    """
+    Give the retargeted users of a fan-out space their own space for the new driver.
+
+    Args:
+        old (str): The old driver name.
+        new (str): The new driver name.
+        shared (str): The fan-out multMatrix of the old driver.
+        consumers (Set[str]): The retargeted plugs reading the fan-out space.
+
+    Returns:
+        Optional[str]: The output of the new space, None if every user of the
+            space is retargeted and the space can be reconnected in place.
+    """
+    users = set(cmds.listConnections(f"{shared}.matrixSum", source=False, destination=True, plugs=True) or [])
+    if users <= consumers:
+        return None
+
+    parent_inverse = cmds.listConnections(f"{shared}.matrixIn[1]", source=True, destination=False, plugs=True)[0]
+    name = naming.fanout_node_name(new, parent_inverse.partition(".")[0])
+    if not (cmds.objExists(name) and cmds.nodeType(name) == "multMatrix"):
+        name = cmds.createNode("multMatrix", name=name)
+        cmds.connectAttr(f"{new}.{DRIVER_ATTRIBUTE}", f"{name}.matrixIn[0]")
+        cmds.connectAttr(parent_inverse, f"{name}.matrixIn[1]")
+    cmds.warning(f"{shared} is shared with objects left out, retargeted objects use {name}.")
+    return f"{name}.matrixSum"
+
+
+def _offset_plug(driven: str, old: str) -> Optional[str]:
+    """
+    Get the plug storing the offset of a driver, set or not yet.
+
+    Args:
+        driven (str): The name of the driven object.
+        old (str): The driver name.
+
+    Returns:
+        Optional[str]: The holdMatrix input or the multMatrix matrixIn[0] plug.
+    """
+    hold_node = naming.matrix_node_name("holdMatrix", driven, "pconstrainedby", old)
+    if cmds.objExists(hold_node):
+        return f"{hold_node}.inMatrix"
+
+    mult_node = naming.matrix_node_name("multMatrix", driven, "pconstrainedby", old)
+    if not cmds.objExists(mult_node):
+        return None
+    if cmds.listConnections(f"{mult_node}.matrixIn[0]", source=True, destination=False):
+        return None
+    return f"{mult_node}.matrixIn[0]"
+
+
+def _offset_value(plug: str) -> List[float]:
+    """
+    Read an offset, identity when the multMatrix matrixIn[0] was never set.
+
+    Args:
+        plug (str): The holdMatrix input or the multMatrix matrixIn[0] plug.
+
+    Returns:
+        List[float]: The offset matrix (16 values).
+    """
+    node, _, attribute = plug.partition(".")
+    if attribute == "matrixIn[0]" and 0 not in (cmds.getAttr(f"{node}.matrixIn", multiIndices=True) or []):
+        return matrix_math.identity()
+    return cmds.getAttr(plug)
+
+
+def retarget_driver(
+        old: str,
+        new: str,
+        maintain_offset: bool = False,
+        driven_list: Optional[Sequence[str]] = None
+) -> List[str]:
+    """
+    Replace a driver with another one in every Atlas constraint using it.
+
+    ChainCon local links are skipped with a warning, remove and rebuild them instead.
+
+    Args:
+        old (str): The current driver.
+        new (str): The new driver.
+        maintain_offset (bool): Recompute the offsets of the parent constraints so
+            the driven objects keep their current pose.
+        driven_list (Optional[Sequence[str]]): The driven objects to retarget. If None,
+            every indexed object of the scene is used.
+
+    Returns:
+        List[str]: The retargeted driven objects.
+
+    Raises:
+        ValueError: If the new driver does not exist.
+
+    Example:
+        retarget_driver("space_chest_OLD", "space_chest", maintain_offset=True)
+    """
+    if not cmds.objExists(new):
+        raise ValueError(f"New driver does not exist: {new}")
+
+    driven_list = index.list_indexed() if driven_list is None else list(driven_list)
+    networks = {
+        driven: network for driven, network in net.get_networks(driven_list).items()
+        if old in network.drivers
+    }
+    if not networks:
+        cmds.warning(f"No Atlas constraint driven by {old}.")
+        return []
+
+    # The local offset of a ChainCon link only holds for the parents of the old driver
+    for driven, network in list(networks.items()):
+        if any(source == f"{old}.{LOCAL_ATTRIBUTE}" for source, _ in network.connections):
+            cmds.warning(f"Skipping {driven}: local-space link to {old}, remove and rebuild it.")
+            del networks[driven]
+    if not networks:
+        return []
+
+    # Connections from the old driver, shared nodes only appear once
+    swaps: Set[str] = set()
+    fanouts: Dict[str, Set[str]] = {}
+    for network in networks.values():
+        for source, destination in network.connections:
+            if source == f"{old}.{DRIVER_ATTRIBUTE}":
+                swaps.add(destination)
+            source_node = source.partition(".")[0]
+            if network.parent and source_node == naming.fanout_node_name(old, network.parent):
+                fanouts.setdefault(source_node, set()).add(destination)
+
+    # new_offset = offset * oldMatrix * newMatrix^-1 keeps every target matrix, whatever the weights
+    offset_plugs: List[str] = []
+    offset_values: List[List[float]] = []
+    if maintain_offset:
+        old_matrix = cmds.getAttr(f"{old}.{DRIVER_ATTRIBUTE}")
+        new_matrix = cmds.getAttr(f"{new}.{DRIVER_ATTRIBUTE}")
+        old_targets, new_matrices = [], []
+        for driven, network in networks.items():
+            if network.constraint_type != "parent":
+                continue
+            plug = _offset_plug(driven, old)
+            if not plug:
+                continue
+            offset_plugs.append(plug)
+            old_targets.append(matrix_math.mult(_offset_value(plug), old_matrix))
+            new_matrices.append(new_matrix)
+        offset_values = compute_offsets(old_targets, new_matrices)
+
+    with bulk_chunk("retarget"):
+        kept = set()
+        for shared, consumers in fanouts.items():
+            space = _fanout_space(old, new, shared, consumers)
+            if space is None:
+                continue
+            kept.add(shared)
+            swaps.discard(f"{shared}.matrixIn[0]")
+            for consumer in consumers:
+                cmds.connectAttr(space, consumer, force=True)
+
+        for destination in swaps:
+            cmds.connectAttr(f"{new}.{DRIVER_ATTRIBUTE}", destination, force=True)
+
+        for plug, offset in zip(offset_plugs, offset_values):
+            cmds.setAttr(plug, *offset, type="matrix")
+
+        renamed = set(kept)
+        for driven, network in networks.items():
+            for node in network.nodes:
+                if node in renamed:
+                    continue
+                name = _renamed(node, driven, network.parent, old, new)
+                if not name:
+                    continue
+                if cmds.objExists(name):
+                    cmds.warning(f"Cannot rename {node}, {name} already exists.")
+                    continue
+                cmds.rename(node, name)
+                renamed.add(node)
+
+    return list(networks)
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+""" Space switching with pose matching for multi-driver parent constraints
+
+This module switches the active driver of a multi-driver ParentCon (the weights
+of its space shifter blendMatrix) without popping the control. The world pose
+is matched on every keyed frame of a range at once: the local matrix, the
+current offsetParentMatrix and the offsetParentMatrix of the new space are
+sampled in one pass, the new local matrices are computed in a single batch,
+then every corrected key is written with one setAttr per channel.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Optional, Sequence, Union
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from atlas_matrix.core.bulk import bulk_chunk
+from atlas_matrix.core.utils import attributes
+from atlas_matrix.core.utils import naming
+from atlas_matrix.core.utils import sampling
+
+
+# ---------- CONSTANTS ----------
+
+
+# Matched channels, in the order of the decomposed values
+CHANNELS = (
+    "translateX", "translateY", "translateZ",
+    "rotateX", "rotateY", "rotateZ",
+    "scaleX", "scaleY", "scaleZ",
+)
+
+
+# ---------- FUNCTIONS ----------
+
+
+def space_target(driven: str, space: Union[int, str]) -> int:
+    """
+    Get the space shifter target index of a space.
+
+    Args:
+        driven (str): The name of the driven object.
+        space (Union[int, str]): The target index or the driver name.
+
+    Returns:
+        int: The target index.
+
+    Raises:
+        ValueError: If the object has no space shifter or the space is not one of its drivers.
+    """
+    blend = naming.blend_node_name(driven)
+    if not cmds.objExists(blend):
+        raise ValueError(f"{driven} has no space shifter to switch.")
+
+    indices = cmds.getAttr(f"{blend}.target", multiIndices=True) or []
+    if isinstance(space, int):
+        if space not in indices:
+            raise ValueError(f"{blend} has no target {space}.")
+        return space
+
+    mult = naming.matrix_node_name("multMatrix", driven, "pconstrainedby", space)
+    for index in indices:
+        sources = cmds.listConnections(f"{blend}.target[{index}].targetMatrix", source=True, destination=False) or []
+        if mult in sources:
+            return index
+    raise ValueError(f"{space} is not a space of {driven}.")
+
+
+def keyed_frames(driven: str, start: Optional[float] = None, end: Optional[float] = None) -> List[float]:
+    """
+    Get the keyed frames of the matched channels and the weights of a driven object.
+
+    Args:
+        driven (str): The name of the driven object.
+        start (Optional[float]): The first frame, unbounded if None.
+        end (Optional[float]): The last frame, unbounded if None.
+
+    Returns:
+        List[float]: The sorted keyed frames inside the range.
+    """
+    plugs = [f"{driven}.{channel}" for channel in CHANNELS] + attributes.get_weight_plugs(driven)
+    frames = set()
+    for plug in plugs:
+        frames.update(cmds.keyframe(plug, query=True, timeChange=True) or [])
+
+    return sorted(
+        frame for frame in frames
+        if (start is None or frame >= start) and (end is None or frame <= end)
+    )
+
+
+def match_locals(local, current, space) -> List[om.MMatrix]:
+    """
+    Compute the local matrices keeping the world pose once the offsetParentMatrix is replaced.
+
+    local * current = new_local * space, the parent being unchanged.
+
+    Args:
+        local: The (frames, 4, 4) local matrices.
+        current: The (frames, 4, 4) current offsetParentMatrix.
+        space: The (frames, 4, 4) offsetParentMatrix of the new space.
+
+    Returns:
+        List[om.MMatrix]: The new local matrix of each frame.
+    """
+    if np is not None:
+        matched = local @ current @ np.linalg.inv(space)
+        return [om.MMatrix(matrix.ravel().tolist()) for matrix in matched]
+
+    return [
+        sampling.to_mmatrix(l) * sampling.to_mmatrix(c) * sampling.to_mmatrix(s).inverse()
+        for l, c, s in zip(local, current, space)
+    ]
+
+
+def _channel_values(matrices: Sequence[om.MMatrix], rotate_order: int) -> List[List[float]]:
+    """
+    Decompose matrices into the matched channels, in UI units, with continuous rotations.
+
+    Args:
+        matrices (Sequence[om.MMatrix]): The local matrices.
+        rotate_order (int): The rotateOrder of the control.
+
+    Returns:
+        List[List[float]]: The values of each channel, by frame.
+    """
+    linear_unit = om.MDistance.uiUnit()
+    angular_unit = om.MAngle.uiUnit()
+
+    channels = [[] for _ in CHANNELS]
+    previous = None
+    for matrix in matrices:
+        transformation = om.MTransformationMatrix(matrix)
+        rotation = transformation.rotation()
+        rotation.reorderIt(rotate_order)
+        if previous is not None:
+            rotation.setToClosestSolution(previous)
+        previous = rotation
+
+        values = [om.MDistance(value).asUnits(linear_unit) for value in transformation.translation(om.MSpace.kTransform)]
+        values += [om.MAngle(value).asUnits(angular_unit) for value in (rotation.x, rotation.y, rotation.z)]
+        values += list(transformation.scale(om.MSpace.kTransform))
+        for channel, value in zip(channels, values):
+            channel.append(value)
+    return channels
+
+
+def _write_keys(plug: str, frames: Sequence[float], values: Sequence[float]) -> None:
+    """
+    Key a plug on frames with one setAttr on its curve.
+
+    Missing keys are inserted first, the keyed frames of the range then map to
+    contiguous key indices.
+
+    Args:
+        plug (str): The plug to key.
+        frames (Sequence[float]): The sorted frames, holding every key of the plug in their range.
+        values (Sequence[float]): The value of each frame.
+    """
+    keyed = set(cmds.keyframe(plug, query=True, timeChange=True) or [])
+    if not keyed:
+        cmds.setKeyframe(plug, time=list(frames))
+    else:
+        missing = [frame for frame in frames if frame not in keyed]
+        if missing:
+            cmds.setKeyframe(plug, time=missing, insert=True)
+
+    curve = cmds.listConnections(plug, source=True, destination=False, type="animCurve")[0]
+    first = cmds.keyframe(curve, query=True, indexValue=True, time=(frames[0], frames[0]))[0]
+    keys = [value for pair in zip(frames, values) for value in pair]
+    cmds.setAttr(f"{curve}.keyTimeValue[{first}:{first + len(frames) - 1}]", *keys)
+
+
+def switch_space(
+        driven: str,
+        space: Union[int, str],
+        start: Optional[float] = None,
+        end: Optional[float] = None
+) -> List[float]:
+    """
+    Switch a multi-driver parent constraint to a single space, keeping the world pose.
+
+    Every keyed frame of the range is matched. Without keys the current frame
+    is matched and the channels are set instead of keyed. Keyed weights are
+    keyed on the matched frames, static weights are set, connected weights are
+    left to their driver with a warning.
+
+    Args:
+        driven (str): The name of the driven object.
+        space (Union[int, str]): The target index or the driver name of the new space.
+        start (Optional[float]): The first frame, unbounded if None.
+        end (Optional[float]): The last frame, unbounded if None.
+
+    Returns:
+        List[float]: The matched frames.
+
+    Example:
+        switch_space("hand_ik_ctrl", "space_chest", start=1001, end=3000)
+    """
+    target = space_target(driven, space)
+    blend = naming.blend_node_name(driven)
+    space_plug = cmds.listConnections(
+        f"{blend}.target[{target}].targetMatrix", source=True, destination=False, plugs=True
+    )[0]
+
+    frames = keyed_frames(driven, start, end)
+    animated = bool(frames)
+    if not animated:
+        frames = [cmds.currentTime(query=True)]
+
+    # One pass over the frames, one batch for the whole range
+    samples = sampling.sample_plugs(
+        [f"{driven}.matrix", attributes.get_offset_parent_matrix(driven), space_plug],
+        frames,
+    )
+    local = [frame_samples[0] for frame_samples in samples] if np is None else samples[:, 0]
+    current = [frame_samples[1] for frame_samples in samples] if np is None else samples[:, 1]
+    new_space = [frame_samples[2] for frame_samples in samples] if np is None else samples[:, 2]
+
+    matched = match_locals(local, current, new_space)
+    channels = _channel_values(matched, cmds.getAttr(f"{driven}.rotateOrder"))
+
+    weight_plugs = attributes.get_weight_plugs(driven)
+    weights = [1.0 if index == target else 0.0 for index in range(len(weight_plugs))]
+
+    with bulk_chunk("space_switch"):
+        for channel, values in zip(CHANNELS, channels):
+            plug = f"{driven}.{channel}"
+            if animated:
+                _write_keys(plug, frames, values)
+            else:
+                cmds.setAttr(plug, values[0])
+
+        for plug, weight in zip(weight_plugs, weights):
+            if cmds.keyframe(plug, query=True, keyframeCount=True):
+                _write_keys(plug, frames, [weight] * len(frames))
+            elif cmds.connectionInfo(plug, isDestination=True):
+                cmds.warning(f"{plug} is driven by a connection, set it to {weight} upstream.")
+            else:
+                cmds.setAttr(plug, weight)
+
+    return frames
@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+""" Utilities functions to detect hierarchy cycles before building constraints
+
+A constraint feeding `driver.worldMatrix` into the offsetParentMatrix of the
+driven creates a DG cycle when the driver sits below the driven. The
+`AncestryIndex` numbers every DAG path once on entry and exit of a single
+depth-first traversal (Euler tour), so "is A an ancestor of B" is answered
+with two integer comparisons for any pair of the batch.
+
+Cycles can also close through other constraints: the driver may sit below an
+object constrained, directly or not, to the driven. `build` reads the networks
+of the scene index once, records the nearest constrained ancestor of every
+path during the same traversal and folds the constraints into the paths each
+constrained object depends on. `check_pairs` only recomputes the closure of
+the batch and of the scene constraints depending on its driven, a pair then
+costs an ancestor test and a set lookup. An index that was not built reads the
+networks only when the batch reaches them.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+from collections import ChainMap
+from dataclasses import dataclass
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from atlas_matrix.core import index
+from atlas_matrix.core.utils import network as net
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class Conflict:
+    driven: str
+    driver: str
+    reason: str
+
+    def __str__(self) -> str:
+        return f"{self.driver} -> {self.driven}: {self.reason}"
+
+
+# ---------- MAIN CLASS ----------
+
+
+class AncestryIndex:
+    """
+    Entry/exit numbering of every transform of the scene, from one DAG traversal.
+    """
+    def __init__(self) -> None:
+        """Initialize an empty index, filled by `build`."""
+        self.entry: Dict[str, int] = {}
+        self.exit: Dict[str, int] = {}
+        self.paths: Dict[str, str] = {}
+        self._indexed: Optional[Set[str]] = None
+        self._drivers: Dict[str, List[str]] = {}
+        self._nearest: Dict[str, str] = {}
+        self._closure: Dict[str, FrozenSet[str]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+
+
+    @classmethod
+    def from_scene(cls) -> "AncestryIndex":
+        """
+        Build the index of the current scene.
+
+        Returns:
+            AncestryIndex: The filled index.
+        """
+        ancestry = cls()
+        ancestry.build()
+        return ancestry
+
+
+    def build(self) -> None:
+        """
+        Number every transform path on entry and exit of a depth-first DAG traversal.
+
+        The same traversal records the nearest constrained object above every
+        path, the dependency closure of the scene constraints follows.
+        """
+        self.entry.clear()
+        self.exit.clear()
+        self.paths.clear()
+        self._indexed = None
+        self._drivers.clear()
+        self._nearest.clear()
+        self._closure = {}
+        self._dependents.clear()
+        constrained = self._constrained()
+
+        counter = 0
+        stack: List[Tuple[str, int, Optional[str]]] = []
+        iterator = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kTransform)
+        while not iterator.isDone():
+            depth = iterator.depth()
+            while stack and stack[-1][1] >= depth:
+                self.exit[stack.pop()[0]] = counter
+                counter += 1
+
+            path = iterator.getPath()
+            full_path = path.fullPathName()
+            self.entry[full_path] = counter
+            self.paths[path.partialPathName()] = full_path
+            counter += 1
+
+            nearest = full_path if full_path in constrained else (stack[-1][2] if stack else None)
+            if nearest:
+                self._nearest[full_path] = nearest
+            stack.append((full_path, depth, nearest))
+            iterator.next()
+
+        while stack:
+            self.exit[stack.pop()[0]] = counter
+            counter += 1
+
+        self._closure = _closure(self._graph(constrained, self.constraint_drivers, self._nearest.get, set()))
+        for path, paths in self._closure.items():
+            for dependency in paths:
+                self._dependents.setdefault(dependency, []).append(path)
+
+
+    def _path(self, name: str) -> Optional[str]:
+        """
+        Get the indexed full path of a name.
+
+        Args:
+            name (str): A unique short name or a full path.
+
+        Returns:
+            Optional[str]: The full path, None if the object is not indexed.
+        """
+        if name in self.entry:
+            return name
+        return self.paths.get(name)
+
+
+    def __contains__(self, name: str) -> bool:
+        return self._path(name) is not None
+
+
+    def lineage(self, name: str) -> List[str]:
+        """
+        Get the full path of an object followed by the full paths of its ancestors.
+
+        Args:
+            name (str): A unique short name or a full path.
+
+        Returns:
+            List[str]: The object then its ancestors up to the root, empty if the object does not exist.
+        """
+        path = self._path(name) or next(iter(cmds.ls(name, long=True) or []), None)
+        if not path:
+            return []
+        parts = path.split("|")
+        return ["|".join(parts[:count]) for count in range(len(parts), 1, -1)]
+
+
+    def resolve(self, names: Iterable[str]) -> List[str]:
+        """
+        Get the full paths of objects, dropping the missing ones.
+
+        Args:
+            names (Iterable[str]): Unique short names or full paths.
+
+        Returns:
+            List[str]: The full paths.
+        """
+        return [lineage[0] for lineage in map(self.lineage, names) if lineage]
+
+
+    def _constrained(self) -> Set[str]:
+        """Get the full paths of the objects in the scene index, read once."""
+        if self._indexed is None:
+            self._indexed = set(self.resolve(index.list_indexed()))
+        return self._indexed
+
+
+    def constraint_drivers(self, path: str) -> List[str]:
+        """
+        Get the drivers of the existing constraint of an object, read once.
+
+        Args:
+            path (str): The full path of the object.
+
+        Returns:
+            List[str]: The full paths of the drivers, empty if the object is not in the scene index.
+        """
+        if path not in self._constrained():
+            return []
+        if path not in self._drivers:
+            network = net.get_network(path)
+            self._drivers[path] = self.resolve(network.drivers) if network else []
+        return self._drivers[path]
+
+
+    def nearest(self, name: str, batch: Dict[str, List[str]]) -> Optional[str]:
+        """
+        Get the nearest constrained object among an object and its ancestors.
+
+        Args:
+            name (str): A unique short name or a full path.
+            batch (Dict[str, List[str]]): The driver full paths of the batch by driven full path.
+
+        Returns:
+            Optional[str]: The full path of the constrained object, None if no constraint moves the object.
+        """
+        constrained = self._constrained()
+        for path in self.lineage(name):
+            if path in batch or path in constrained:
+                return path
+        return None
+
+
+    def _graph(
+            self,
+            roots: Iterable[str],
+            drivers: Callable[[str], List[str]],
+            nearest: Callable[[str], Optional[str]],
+            stale: Set[str]
+    ) -> Dict[str, Tuple[Set[str], List[str]]]:
+        """
+        Collect the constraint graph reached from constrained objects.
+
+        A constrained object depends on its lineage, the lineages of its
+        drivers and on the constrained objects above its drivers and its
+        parent. Those with a known and up to date closure are folded in
+        instead of being walked.
+
+        Args:
+            roots (Iterable[str]): The full paths of the constrained objects to start from.
+            drivers (Callable[[str], List[str]]): Get the driver full paths of a constrained object.
+            nearest (Callable[[str], Optional[str]]): Get the nearest constrained object among a path and its ancestors.
+            stale (Set[str]): The constrained objects whose known closure must be recomputed.
+
+        Returns:
+            Dict[str, Tuple[Set[str], List[str]]]: The paths each object depends on directly and
+                the objects of the graph it reads, by full path.
+        """
+        graph = {}
+        queue = list(roots)
+        while queue:
+            path = queue.pop()
+            if path in graph:
+                continue
+            paths = set(self.lineage(path))
+            sources = list(drivers(path))
+            for driver in sources:
+                paths.update(self.lineage(driver))
+            parent = path.rpartition("|")[0]
+            if parent:
+                sources.append(parent)
+
+            successors = []
+            for constrained in filter(None, map(nearest, sources)):
+                if constrained in self._closure and constrained not in stale:
+                    paths.update(self._closure[constrained])
+                else:
+                    successors.append(constrained)
+                    queue.append(constrained)
+            graph[path] = (paths, successors)
+        return graph
+
+
+    def closure(self, batch: Dict[str, List[str]]) -> Mapping[str, FrozenSet[str]]:
+        """
+        Get the paths every constrained object depends on once the batch is built.
+
+        The batch pairs replace the existing constraints of their driven. Only
+        the batch and the scene constraints depending on one of its driven are
+        walked, the others are read from the closure of `build`.
+
+        Args:
+            batch (Dict[str, List[str]]): The driver full paths of the batch by driven full path.
+
+        Returns:
+            Mapping[str, FrozenSet[str]]: The paths each constrained object depends on, by full path.
+        """
+        stale = set(batch)
+        for path in batch:
+            stale.update(self._dependents.get(path, ()))
+        graph = self._graph(
+            stale,
+            lambda path: batch[path] if path in batch else self.constraint_drivers(path),
+            lambda name: self.nearest(name, batch),
+            stale
+        )
+        return ChainMap(_closure(graph), self._closure)
+
+
+    def is_ancestor(self, ancestor: str, node: str) -> bool:
+        """
+        Check if an object is an ancestor of another one.
+
+        Objects missing from the index, created after it was built, are
+        checked by walking up the hierarchy.
+
+        Args:
+            ancestor (str): The possible ancestor.
+            node (str): The possible descendant.
+
+        Returns:
+            bool: True if `ancestor` is a strict ancestor of `node`.
+        """
+        ancestor_path, node_path = self._path(ancestor), self._path(node)
+        if ancestor_path is None or node_path is None:
+            return is_below(node, ancestor)
+
+        return (
+            self.entry[ancestor_path] < self.entry[node_path]
+            and self.exit[node_path] < self.exit[ancestor_path]
+        )
+
+
+# ---------- FUNCTIONS ----------
+
+
+
+def is_below(node: str, ancestor: str) -> bool:
+    """
+    Check if an object sits below another one by walking up its hierarchy.
+
+    Args:
+        node (str): The possible descendant.
+        ancestor (str): The possible ancestor.
+
+    Returns:
+        bool: True if `ancestor` is a strict ancestor of `node`.
+    """
+    ancestor_paths = set(cmds.ls(ancestor, long=True) or [])
+    parents = cmds.listRelatives(node, allParents=True, fullPath=True) or []
+    while parents:
+        if ancestor_paths.intersection(parents):
+            return True
+        parents = cmds.listRelatives(parents, allParents=True, fullPath=True) or []
+    return False
+
+
+def _closure(graph: Dict[str, Tuple[Set[str], List[str]]]) -> Dict[str, FrozenSet[str]]:
+    """
+    Fold a dependency graph into the paths each of its objects depends on.
+
+    Strongly connected components are found with an iterative Tarjan walk,
+    which completes them dependencies first, so each component unions the
+    closures of the components it reads once. Objects of a component share it.
+
+    Args:
+        graph (Dict[str, Tuple[Set[str], List[str]]]): The paths each object depends on
+            directly and the objects of the graph it reads, by object.
+
+    Returns:
+        Dict[str, FrozenSet[str]]: The paths each object depends on, directly or not.
+    """
+    closure: Dict[str, FrozenSet[str]] = {}
+    order: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+
+    def visit(node: str) -> None:
+        order[node] = low[node] = len(order)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(graph[node][1])))
+
+    for root in graph:
+        if root in order:
+            continue
+        work: List[Tuple[str, Iterator[str]]] = []
+        visit(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in order:
+                    visit(successor)
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], order[successor])
+            else:
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    low[caller] = min(low[caller], low[node])
+                if low[node] != order[node]:
+                    continue
+
+                component = set()
+                while node not in component:
+                    component.add(stack.pop())
+                on_stack.difference_update(component)
+                paths = set()
+                for member in component:
+                    paths.update(graph[member][0])
+                    for successor in graph[member][1]:
+                        if successor not in component:
+                            paths.update(closure[successor])
+                paths = frozenset(paths)
+                for member in component:
+                    closure[member] = paths
+    return closure
+
+
+def check_pairs(
+        pairs: Iterable[Tuple[str, Sequence[str]]],
+        ancestry: Optional[AncestryIndex] = None
+) -> List[Conflict]:
+    """
+    Find the (driven, drivers) pairs that would create a cycle once constrained.
+
+    Besides self constraints, drivers below their driven and objects constrained
+    to each other, cycles closing through several constraints of the batch or
+    through constraints already in the scene are found.
+
+    Args:
+        pairs (Iterable[Tuple[str, Sequence[str]]]): The (driven, drivers) pairs.
+        ancestry (Optional[AncestryIndex]): A prebuilt index, built from the scene if None.
+
+    Returns:
+        List[Conflict]: The conflicts found, empty if every pair is safe.
+    """
+    pairs = [(driven, list(drivers)) for driven, drivers in pairs]
+    ancestry = AncestryIndex.from_scene() if ancestry is None else ancestry
+    driven_by = {(driven, driver) for driven, drivers in pairs for driver in drivers}
+
+    batch: Dict[str, List[str]] = {}
+    for driven, drivers in pairs:
+        lineage = ancestry.lineage(driven)
+        if lineage:
+            batch.setdefault(lineage[0], []).extend(ancestry.resolve(drivers))
+    closure = ancestry.closure(batch)
+
+    conflicts = []
+    for driven, drivers in pairs:
+        driven_path = next(iter(ancestry.lineage(driven)), driven)
+        for driver in drivers:
+            if driver == driven:
+                conflicts.append(Conflict(driven, driver, "object constrained to itself"))
+            elif ancestry.is_ancestor(driven, driver):
+                conflicts.append(Conflict(driven, driver, "driver is below the driven"))
+            elif (driver, driven) in driven_by:
+                conflicts.append(Conflict(driven, driver, "objects constrained to each other"))
+            elif driven_path in closure.get(ancestry.nearest(driver, batch), ()):
+                conflicts.append(Conflict(driven, driver, "driver depends on the driven through other constraints"))
+    return conflicts
+
+
+def validate_pairs(
+        pairs: Iterable[Tuple[str, Sequence[str]]],
+        ancestry: Optional[AncestryIndex] = None
+) -> None:
+    """
+    Raise before anything is built if a (driven, drivers) pair would create a cycle.
+
+    Args:
+        pairs (Iterable[Tuple[str, Sequence[str]]]): The (driven, drivers) pairs.
+        ancestry (Optional[AncestryIndex]): A prebuilt index, built from the scene if None.
+
+    Raises:
+        ValueError: If any pair conflicts.
+    """
+    conflicts = check_pairs(pairs, ancestry)
+    if conflicts:
+        raise ValueError("Constraint would create a cycle:\n" + "\n".join(str(conflict) for conflict in conflicts))
@@ -24,9 +24,20 @@ limitations under the License.
 
 # ---------- IMPORT ----------
 
+from typing import List
+
+import maya.cmds as cmds
+
 from atlas_matrix.core.utils import verification
 
 
+# ---------- CONSTANTS ----------
+
+
+# Single multi attribute holding every constraint weight, used instead of W0..Wn
+WEIGHT_ARRAY = "atlasWeights"
+
+
 # ---------- FUNCTIONS ----------
 
 
@@ -39,4 +50,23 @@ def get_world_inverse_matrix(obj: str)-> str:
 
 
 def get_offset_parent_matrix(obj: str)-> str:
-    return f"{obj}.offsetParentMatrix"
\ No newline at end of file
+    return f"{obj}.offsetParentMatrix"
+
+
+def get_weight_plugs(obj: str) -> List[str]:
+    """
+    Get the constraint weight plugs of an object, in driver order.
+
+    Args:
+        obj (str): The constrained object.
+
+    Returns:
+        List[str]: The atlasWeights elements, or the W0..Wn attributes.
+    """
+    if cmds.attributeQuery(WEIGHT_ARRAY, node=obj, exists=True):
+        indices = cmds.getAttr(f"{obj}.{WEIGHT_ARRAY}", multiIndices=True) or []
+        return [f"{obj}.{WEIGHT_ARRAY}[{i}]" for i in indices]
+
+    weights = [attr for attr in cmds.listAttr(obj, userDefined=True) or []
+               if attr.startswith("W") and attr[1:].isdigit()]
+    return [f"{obj}.{attr}" for attr in sorted(weights, key=lambda attr: int(attr[1:]))]
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+""" Typed handles on the matrix nodes created by the constraint builders
+
+A handle keeps the `om.MObjectHandle` of its node and names each plug once,
+returning it as a `TrustedPlug` so the builders skip its validation. The node
+name is resolved through the handle, the cached plug names are rebuilt when
+the node was renamed or moved into a namespace during a long build.
+Connections are made by name with `cmds.connectAttr`: an `om.MDGModifier` run
+from a script is not recorded in Maya's undo queue, and the builders rely on
+undo chunks and redo.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Dict, Optional, Tuple
+
+import maya.api.OpenMaya as om
+
+from atlas_matrix.core.utils.plugs import TrustedPlug
+
+
+# ---------- MAIN CLASS ----------
+
+
+class NodeHandle:
+    """
+    Handle on a dependency node created by a builder, naming each of its plugs once.
+    """
+    __slots__ = ("_handle", "_name", "_plugs")
+
+    def __init__(self, node: str) -> None:
+        """
+        Initialize the handle.
+
+        Args:
+            node (str): The node name.
+        """
+        selection = om.MSelectionList()
+        selection.add(node)
+        self._handle = om.MObjectHandle(selection.getDependNode(0))
+        self._name = node
+        self._plugs: Dict[Tuple[str, Optional[int], Optional[str]], TrustedPlug] = {}
+
+
+    @property
+    def name(self) -> str:
+        """Get the current name of the node, the last known one if it was deleted."""
+        if self._handle.isValid():
+            name = om.MFnDependencyNode(self._handle.object()).name()
+            if name != self._name:
+                self._name = name
+                self._plugs.clear()
+        return self._name
+
+
+    def __str__(self) -> str:
+        return self.name
+
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+    def plug(self, attribute: str, index: Optional[int] = None, child: Optional[str] = None) -> TrustedPlug:
+        """
+        Get a plug of the node.
+
+        Args:
+            attribute (str): The attribute name.
+            index (Optional[int]): The logical index, for an array attribute.
+            child (Optional[str]): The child attribute name, for a compound element.
+
+        Returns:
+            TrustedPlug: The plug name, built on first access and again after a rename.
+        """
+        name = self.name
+        key = (attribute, index, child)
+        plug = self._plugs.get(key)
+        if plug is None:
+            path = attribute if index is None else f"{attribute}[{index}]"
+            if child is not None:
+                path = f"{path}.{child}"
+            plug = self._plugs[key] = TrustedPlug(f"{name}.{path}")
+        return plug
+
+
+class HoldMatrixHandle(NodeHandle):
+    """Handle on a holdMatrix node"""
+    __slots__ = ()
+
+    @property
+    def input(self) -> TrustedPlug:
+        return self.plug("inMatrix")
+
+    @property
+    def output(self) -> TrustedPlug:
+        return self.plug("outMatrix")
+
+
+class MultMatrixHandle(NodeHandle):
+    """Handle on a multMatrix node"""
+    __slots__ = ()
+
+    def matrix_in(self, index: int) -> TrustedPlug:
+        return self.plug("matrixIn", index)
+
+    @property
+    def output(self) -> TrustedPlug:
+        return self.plug("matrixSum")
+
+
+class BlendMatrixHandle(NodeHandle):
+    """Handle on a blendMatrix node"""
+    __slots__ = ()
+
+    @property
+    def input(self) -> TrustedPlug:
+        return self.plug("inputMatrix")
+
+    def target(self, index: int) -> TrustedPlug:
+        return self.plug("target", index, "targetMatrix")
+
+    def weight(self, index: int) -> TrustedPlug:
+        return self.plug("target", index, "weight")
+
+    def channel_weight(self, index: int, channel: str) -> TrustedPlug:
+        return self.plug("target", index, f"{channel}Weight")
+
+    @property
+    def output(self) -> TrustedPlug:
+        return self.plug("outputMatrix")
+
+
+class AimMatrixHandle(NodeHandle):
+    """Handle on an aimMatrix node"""
+    __slots__ = ()
+
+    @property
+    def input(self) -> TrustedPlug:
+        return self.plug("inputMatrix")
+
+    @property
+    def primary(self) -> TrustedPlug:
+        return self.plug("primaryTargetMatrix")
+
+    @property
+    def secondary(self) -> TrustedPlug:
+        return self.plug("secondaryTargetMatrix")
+
+    @property
+    def output(self) -> TrustedPlug:
+        return self.plug("outputMatrix")
+
+
+class ComposeMatrixHandle(NodeHandle):
+    """Handle on a composeMatrix node"""
+    __slots__ = ()
+
+    def translate(self, axis: str) -> TrustedPlug:
+        return self.plug(f"inputTranslate{axis.upper()}")
+
+    def rotate(self, axis: str) -> TrustedPlug:
+        return self.plug(f"inputRotate{axis.upper()}")
+
+    def scale(self, axis: str) -> TrustedPlug:
+        return self.plug(f"inputScale{axis.upper()}")
+
+    def shear(self, axis: str) -> TrustedPlug:
+        return self.plug(f"inputShear{axis.upper()}")
+
+    @property
+    def output(self) -> TrustedPlug:
+        return self.plug("outputMatrix")
+
+
+class DecomposeMatrixHandle(NodeHandle):
+    """Handle on a decomposeMatrix node"""
+    __slots__ = ()
+
+    @property
+    def input(self) -> TrustedPlug:
+        return self.plug("inputMatrix")
+
+    def translate(self, axis: str) -> TrustedPlug:
+        return self.plug(f"outputTranslate{axis.upper()}")
+
+    def rotate(self, axis: str) -> TrustedPlug:
+        return self.plug(f"outputRotate{axis.upper()}")
+
+    def scale(self, axis: str) -> TrustedPlug:
+        return self.plug(f"outputScale{axis.upper()}")
+
+    def shear(self, axis: str) -> TrustedPlug:
+        return self.plug(f"outputShear{axis.upper()}")
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+""" Utilities functions for 4x4 matrix math without Maya
+
+Matrices are flat sequences of 16 floats in Maya order (row-major, row
+vectors, translation in the last row), as returned by `cmds.getAttr` on a
+matrix attribute. These functions never touch Maya and are safe to call from
+worker threads or processes.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Sequence
+
+
+# ---------- CONSTANTS ----------
+
+
+IDENTITY = (
+    1.0, 0.0, 0.0, 0.0,
+    0.0, 1.0, 0.0, 0.0,
+    0.0, 0.0, 1.0, 0.0,
+    0.0, 0.0, 0.0, 1.0,
+)
+
+
+# ---------- FUNCTIONS ----------
+
+
+def identity() -> List[float]:
+    """Get a new identity matrix.
+
+    Returns:
+        List[float]: The 16 values of the identity matrix.
+    """
+    return list(IDENTITY)
+
+
+def mult(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    """Multiply two matrices (a * b, a applied first with Maya row vectors).
+
+    Args:
+        a (Sequence[float]): The 16 values of the left matrix.
+        b (Sequence[float]): The 16 values of the right matrix.
+
+    Returns:
+        List[float]: The 16 values of the product.
+    """
+    return [
+        a[row * 4] * b[col] + a[row * 4 + 1] * b[4 + col] + a[row * 4 + 2] * b[8 + col] + a[row * 4 + 3] * b[12 + col]
+        for row in range(4)
+        for col in range(4)
+    ]
+
+
+def inverse(m: Sequence[float]) -> List[float]:
+    """Invert a matrix with Gauss-Jordan elimination and partial pivoting.
+
+    Args:
+        m (Sequence[float]): The 16 values of the matrix.
+
+    Returns:
+        List[float]: The 16 values of the inverse.
+
+    Raises:
+        ValueError: If the matrix is singular.
+    """
+    rows = [list(m[row * 4:row * 4 + 4]) + [1.0 if row == col else 0.0 for col in range(4)] for row in range(4)]
+
+    for col in range(4):
+        pivot = max(range(col, 4), key=lambda row: abs(rows[row][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            raise ValueError("Singular matrix cannot be inverted")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+
+        scale = rows[col][col]
+        rows[col] = [value / scale for value in rows[col]]
+        for row in range(4):
+            if row != col and rows[row][col]:
+                factor = rows[row][col]
+                rows[row] = [value - factor * pivot_value for value, pivot_value in zip(rows[row], rows[col])]
+
+    return [value for row in rows for value in row[4:]]
+
+
+def is_identity(m: Sequence[float], tolerance: float = 1e-9) -> bool:
+    """Check if a matrix is the identity.
+
+    Args:
+        m (Sequence[float]): The 16 values of the matrix.
+        tolerance (float): The tolerance per value.
+
+    Returns:
+        bool: True if every value is within tolerance of the identity.
+    """
+    return all(abs(value - reference) <= tolerance for value, reference in zip(m, IDENTITY))
+
+
+def max_delta(a: Sequence[float], b: Sequence[float]) -> float:
+    """Get the largest absolute difference between two matrices.
+
+    Args:
+        a (Sequence[float]): The 16 values of the first matrix.
+        b (Sequence[float]): The 16 values of the second matrix.
+
+    Returns:
+        float: The largest difference between two matching values.
+    """
+    return max(abs(value_a - value_b) for value_a, value_b in zip(a, b))
+
+
+def layered_weights(weights: Sequence[float]) -> List[float]:
+    """Convert normalized target weights into sequential blendMatrix weights.
+
+    A blendMatrix blends each target over the result of the previous ones, the
+    weighted average of the targets is reached with w_i / (w_0 + ... + w_i).
+    Targets whose running sum is zero get a zero weight.
+
+    Args:
+        weights (Sequence[float]): The target weights, as used by native constraints.
+
+    Returns:
+        List[float]: The blendMatrix target weights.
+    """
+    layered = []
+    total = 0.0
+    for weight in weights:
+        total += weight
+        layered.append(weight / total if total > 0.0 else 0.0)
+    return layered
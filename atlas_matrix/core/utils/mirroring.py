@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+""" Utilities functions to map names and reflect matrices across a mirror plane
+
+Names are mapped through a prefix, suffix or regex rule compiled once.
+Matrices are flat sequences of 16 floats in Maya order, reflected by sign
+flips: a diagonal reflection applied on the left flips rows (local axes), on
+the right it flips columns (world axes). These functions never touch Maya.
+
+Two conventions are supported for the mirrored objects:
+    - "orientation": S * M * S, S being the reflection across the mirror plane.
+      Local axes are reflected like the world, the symmetric pose is reached
+      with the rotation values of the two in-plane axes negated.
+    - "behaviour": A * M * S, A flipping every local axis. The symmetric pose
+      is reached with the same rotation values and negated translations.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import re
+from typing import Dict, Iterable, List, Sequence, Tuple
+from dataclasses import dataclass
+
+
+# ---------- CONSTANTS ----------
+
+
+MIRROR_AXES = {"x": 0, "y": 1, "z": 2}
+
+MIRROR_CONVENTIONS = ("orientation", "behaviour")
+
+# Local flip of the behaviour convention, every axis reversed
+BEHAVIOUR_FLIP = (-1.0, -1.0, -1.0, 1.0)
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class MirrorRule:
+    source: str = "L_"
+    target: str = "R_"
+    mode: str = "prefix"
+
+    def compile(self) -> "re.Pattern":
+        """
+        Compile the rule into a single pattern.
+
+        Prefixes are matched after the namespace, suffixes at the end of the name,
+        a regex rule is used as is with `target` as replacement.
+
+        Returns:
+            re.Pattern: The compiled pattern.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if self.mode == "prefix":
+            return re.compile(rf"^((?:.*:)?){re.escape(self.source)}")
+        if self.mode == "suffix":
+            return re.compile(rf"{re.escape(self.source)}$")
+        if self.mode == "regex":
+            return re.compile(self.source)
+        raise ValueError(f"Unknown mirror rule mode: {self.mode}")
+
+    @property
+    def replacement(self) -> str:
+        """Get the replacement of the compiled pattern"""
+        if self.mode == "prefix":
+            return rf"\g<1>{self.target}"
+        if self.mode == "suffix":
+            return self.target.replace("\\", "\\\\")
+        return self.target
+
+
+# ---------- FUNCTIONS ----------
+
+
+def build_lookup(names: Iterable[str], rule: MirrorRule) -> Dict[str, str]:
+    """
+    Map names to their mirrored counterpart, compiling the rule once.
+
+    Args:
+        names (Iterable[str]): The names to map.
+        rule (MirrorRule): The naming rule.
+
+    Returns:
+        Dict[str, str]: The mirrored name of every name matching the rule.
+    """
+    pattern = rule.compile()
+    replacement = rule.replacement
+    lookup = {}
+    for name in dict.fromkeys(names):
+        mirrored, count = pattern.subn(replacement, name, count=1)
+        if count and mirrored != name:
+            lookup[name] = mirrored
+    return lookup
+
+
+def reflection(axis: str) -> Tuple[float, float, float, float]:
+    """
+    Get the diagonal of the reflection across a mirror plane.
+
+    Args:
+        axis (str): The axis normal to the mirror plane.
+
+    Returns:
+        Tuple[float, float, float, float]: The diagonal values.
+
+    Raises:
+        ValueError: If the axis is invalid.
+    """
+    if axis not in MIRROR_AXES:
+        raise ValueError(f"Invalid mirror axis: {axis}")
+    return tuple(-1.0 if i == MIRROR_AXES[axis] else 1.0 for i in range(4))
+
+
+def reflect(matrix: Sequence[float], left: Sequence[float], right: Sequence[float]) -> List[float]:
+    """
+    Multiply a matrix by diagonal matrices on both sides, L * M * R.
+
+    Args:
+        matrix (Sequence[float]): The matrix (16 values).
+        left (Sequence[float]): The diagonal of L, scaling the rows.
+        right (Sequence[float]): The diagonal of R, scaling the columns.
+
+    Returns:
+        List[float]: The product (16 values).
+    """
+    return [matrix[i] * left[i // 4] * right[i % 4] for i in range(16)]
+
+
+def mirror_matrix(matrix: Sequence[float], axis: str = "x") -> List[float]:
+    """
+    Reflect a matrix across a mirror plane, S * M * S.
+
+    Args:
+        matrix (Sequence[float]): The matrix (16 values).
+        axis (str): The axis normal to the mirror plane.
+
+    Returns:
+        List[float]: The mirrored matrix (16 values).
+    """
+    flip = reflection(axis)
+    return reflect(matrix, flip, flip)
+
+
+def mirror_offset(
+        offset: Sequence[float],
+        axis: str = "x",
+        convention: str = "orientation",
+        center_driver: bool = False
+) -> List[float]:
+    """
+    Mirror the offset of a driven object relative to its driver.
+
+    driven = offset * driver, each side being mirrored as L * M * S:
+    offset' = L_driven * offset * L_driver^-1. A driver without counterpart
+    (spine, world...) is its own mirror and is expected to be symmetric across
+    the plane, its flip is S whatever the convention.
+
+    Args:
+        offset (Sequence[float]): The offset (16 values).
+        axis (str): The axis normal to the mirror plane.
+        convention (str): "orientation" or "behaviour".
+        center_driver (bool): The driver has no mirrored counterpart.
+
+    Returns:
+        List[float]: The mirrored offset (16 values).
+
+    Raises:
+        ValueError: If the axis or the convention is invalid.
+    """
+    if convention not in MIRROR_CONVENTIONS:
+        raise ValueError(f"Invalid mirror convention: {convention}")
+
+    flip = reflection(axis)
+    local = flip if convention == "orientation" else BEHAVIOUR_FLIP
+    return reflect(offset, local, flip if center_driver else local)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+""" Utilities functions that generate and recognize Atlas constraint node names
+
+These functions never touch Maya and are safe to call from worker threads or
+from the offline tools running outside of Maya.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import re
+from typing import List, Union
+
+
+# ---------- CONSTANTS ----------
+
+
+# Nodes of an aim constraint that do not belong to a driver
+AIM_HELPER_TOKENS = ("_aim_rest", "_aim_parent")
+
+ATLAS_NAME_TOKENS = (
+    "_pconstrainedby_",
+    "_aconstrainedby_",
+    "_space_shifter",
+    "_identity_parent",
+    "_fanout_",
+) + AIM_HELPER_TOKENS
+
+CONSTRAINT_TYPES = {
+    "_pconstrainedby_": "parent",
+    "_aconstrainedby_": "aim",
+    **{token: "aim" for token in AIM_HELPER_TOKENS},
+}
+
+# Attributes added on the driven object by the constraint builders
+CONSTRAINT_ATTRIBUTE = re.compile(r"^(W\d+|atlasWeights|initialMatrix|initialTransform)$")
+
+
+# ---------- FUNCTIONS ----------
+
+
+def is_atlas_name(name: str) -> bool:
+    """Check if a node name follows the Atlas constraint naming scheme.
+
+    Args:
+        name (str): The name of the node.
+
+    Returns:
+        bool: True if the name contains an Atlas token, False otherwise.
+    """
+    return any(token in name for token in ATLAS_NAME_TOKENS)
+
+
+def is_aim_name(name: str) -> bool:
+    """Check if a node name belongs to an Atlas aim constraint.
+
+    Args:
+        name (str): The name of the node.
+
+    Returns:
+        bool: True if the name contains an aim constraint token, False otherwise.
+    """
+    return any(token in name for token, constraint_type in CONSTRAINT_TYPES.items() if constraint_type == "aim")
+
+
+
+def driver_name(driver: Union[str, List[str]]) -> str:
+    """Get a formatted driver name for node naming.
+
+    Args:
+        driver (str | list[str]): The driver name or list of name parts.
+
+    Returns:
+        str: A single driver name string.
+    """
+    return driver if isinstance(driver, str) else "_".join(driver)
+
+
+def matrix_node_name(node_type: str, driven: str, constraining_name: str, driver: Union[str, List[str]]) -> str:
+    """Get the name of a matrix node created for a driver.
+
+    Args:
+        node_type (str): The Maya node type (e.g., "multMatrix").
+        driven (str): The name of the driven object.
+        constraining_name (str): The constraint identifier (e.g., "pconstrainedby").
+        driver (str | list[str]): The driver name or list of name parts.
+
+    Returns:
+        str: The node name, e.g. "multmatrix_ctrl_pconstrainedby_space".
+    """
+    return f"{node_type.lower()}_{driven}_{constraining_name}_{driver_name(driver)}"
+
+
+def aim_helper_name(node_type: str, driven: str, role: str) -> str:
+    """Get the name of a node of an aim constraint that does not belong to a driver.
+
+    Args:
+        node_type (str): The Maya node type (e.g., "holdMatrix").
+        driven (str): The name of the driven object.
+        role (str): "rest" for the driven rest matrix, "parent" for the parent space.
+
+    Returns:
+        str: The node name, e.g. "holdmatrix_eye_aim_rest".
+    """
+    return f"{node_type.lower()}_{driven}_aim_{role}"
+
+
+def blend_node_name(driven: str) -> str:
+    """Get the name of the space shifter blendMatrix of a driven object.
+
+    Args:
+        driven (str): The name of the driven object.
+
+    Returns:
+        str: The node name.
+    """
+    return f"blendMatrix_{driven}_space_shifter"
+
+
+def fanout_node_name(driver: str, parent: str) -> str:
+    """Get the name of the multMatrix shared by the fan-out constraints of a parent.
+
+    Args:
+        driver (str): The name of the driver object.
+        parent (str): The name of the parent shared by the driven objects.
+
+    Returns:
+        str: The node name.
+    """
+    return f"multmatrix_{driver}_fanout_{parent}"
+
+
+def identity_node_name(driven: str) -> str:
+    """Get the name of the identity composeMatrix of a driven object.
+
+    Args:
+        driven (str): The name of the driven object.
+
+    Returns:
+        str: The node name.
+    """
+    return f"composematrix_{driven}_identity_parent"
+
+
+def weight_node_name(node_type: str, driven: str, index: int) -> str:
+    """Get the name of a utility node computing the layered weight of a target.
+
+    The constraint token keeps the node in the history collected by RemoveCon.
+
+    Args:
+        node_type (str): The Maya node type (e.g., "multiplyDivide").
+        driven (str): The name of the driven object.
+        index (int): The target index.
+
+    Returns:
+        str: The node name, e.g. "multiplydivide_ctrl_pconstrainedby_weight1".
+    """
+    return f"{node_type.lower()}_{driven}_pconstrainedby_weight{index}"
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+""" Utilities functions that discover Atlas constraint networks inside Maya
+
+A network is every matrix node feeding the offsetParentMatrix of a driven
+object, walked upstream until DAG objects (drivers, parent) are reached.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+import maya.cmds as cmds
+
+from atlas_matrix.core.utils.naming import CONSTRAINT_TYPES, is_atlas_name
+
+
+# ---------- CONSTANTS ----------
+
+
+ATLAS_NODE_TYPES = (
+    "multMatrix",
+    "decomposeMatrix",
+    "composeMatrix",
+    "holdMatrix",
+    "blendMatrix",
+    "aimMatrix",
+    "pickMatrix",
+    "inverseMatrix",
+)
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class Network:
+    driven: str
+    nodes: List[str] = field(default_factory=list)
+    connections: List[Tuple[str, str]] = field(default_factory=list)
+    drivers: List[str] = field(default_factory=list)
+    parent: Optional[str] = None
+    output: Optional[str] = None
+
+    @property
+    def constraint_type(self) -> str:
+        """Get the constraint type ("parent", "aim") read from the node names"""
+        for node in self.nodes:
+            for token, constraint_type in CONSTRAINT_TYPES.items():
+                if token in node:
+                    return constraint_type
+        return "parent" if self.nodes else ""
+
+
+# ---------- FUNCTIONS ----------
+
+
+def is_atlas_node(name: str) -> bool:
+    """Check if a node name follows the Atlas constraint naming scheme.
+
+    Args:
+        name (str): The name of the node.
+
+    Returns:
+        bool: True if the name contains an Atlas token, False otherwise.
+    """
+    return is_atlas_name(name)
+
+
+def list_atlas_nodes() -> List[str]:
+    """List every matrix node of the scene following the Atlas naming scheme.
+
+    Returns:
+        List[str]: The Atlas node names.
+    """
+    return [node for node in cmds.ls(type=list(ATLAS_NODE_TYPES)) or [] if is_atlas_node(node)]
+
+
+def list_constrained() -> List[str]:
+    """List every object whose offsetParentMatrix is fed by an Atlas node.
+
+    Returns:
+        List[str]: The driven object names, without duplicates.
+    """
+    constrained = []
+    for node in list_atlas_nodes():
+        plugs = cmds.listConnections(node, source=False, destination=True, plugs=True) or []
+        for plug in plugs:
+            driven, _, attribute = plug.partition(".")
+            if attribute == "offsetParentMatrix" and driven not in constrained:
+                constrained.append(driven)
+    return constrained
+
+
+def _is_dag(node: str) -> bool:
+    """Check if a node is a DAG node.
+
+    Args:
+        node (str): The name of the node.
+
+    Returns:
+        bool: True if the node is a DAG node, False otherwise.
+    """
+    return cmds.objectType(node, isAType="dagNode")
+
+
+def get_network(driven: str) -> Optional[Network]:
+    """Walk the constraint network feeding the offsetParentMatrix of an object.
+
+    Args:
+        driven (str): The name of the driven object.
+
+    Returns:
+        Optional[Network]: The network, None if offsetParentMatrix is not connected
+            to a matrix node.
+    """
+    sources = cmds.listConnections(
+        f"{driven}.offsetParentMatrix",
+        source=True,
+        destination=False,
+        plugs=True
+    ) or []
+    if not sources:
+        return None
+
+    output = sources[0]
+    start = output.split(".", 1)[0]
+    if cmds.nodeType(start) not in ATLAS_NODE_TYPES:
+        return None
+
+    network = Network(driven=driven, output=output)
+    network.connections.append((output, f"{driven}.offsetParentMatrix"))
+
+    queue = [start]
+    visited = {start}
+    while queue:
+        node = queue.pop(0)
+        network.nodes.append(node)
+
+        pairs = cmds.listConnections(
+            node,
+            source=True,
+            destination=False,
+            connections=True,
+            plugs=True
+        ) or []
+
+        for destination, source in zip(pairs[::2], pairs[1::2]):
+            network.connections.append((source, destination))
+            source_node, _, attribute = source.partition(".")
+
+            if source_node in visited:
+                continue
+
+            if _is_dag(source_node):
+                if source_node == driven:
+                    continue
+                if attribute.startswith("worldInverseMatrix"):
+                    network.parent = source_node
+                elif source_node not in network.drivers:
+                    network.drivers.append(source_node)
+                continue
+
+            if cmds.nodeType(source_node) in ATLAS_NODE_TYPES:
+                visited.add(source_node)
+                queue.append(source_node)
+
+    # The parent world matrix can also feed a rest matrix (AimCon), it is not a driver
+    if network.parent in network.drivers:
+        network.drivers.remove(network.parent)
+
+    return network
+
+
+def get_networks(driven_list: Optional[List[str]] = None) -> Dict[str, Network]:
+    """Walk the constraint networks of many objects.
+
+    Args:
+        driven_list (Optional[List[str]]): The driven objects. If None, every
+            constrained object of the scene is used.
+
+    Returns:
+        Dict[str, Network]: The networks by driven name.
+    """
+    if driven_list is None:
+        driven_list = list_constrained()
+
+    networks = {}
+    for driven in driven_list:
+        network = get_network(driven)
+        if network:
+            networks[driven] = network
+    return networks
+
+
+def upstream_map(network: Network) -> Dict[str, List[str]]:
+    """Map each node of a network to the network nodes directly feeding it.
+
+    Args:
+        network (Network): The network to map.
+
+    Returns:
+        Dict[str, List[str]]: The upstream network nodes by node name.
+    """
+    nodes = set(network.nodes)
+    upstream = {node: [] for node in network.nodes}
+    for source, destination in network.connections:
+        source_node = source.split(".", 1)[0]
+        destination_node = destination.split(".", 1)[0]
+        if source_node in nodes and destination_node in nodes and source_node not in upstream[destination_node]:
+            upstream[destination_node].append(source_node)
+    return upstream
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+""" Utilities functions for plugs already known to be valid
+
+A `TrustedPlug` is a plug name created by the builder itself, or checked once
+when it was first handed in. It is still a plain string for every Maya command
+but lets `Matrix.connect_attr` and `Matrix.connect_matrix` skip their
+existence checks.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- MAIN CLASS ----------
+
+
+class TrustedPlug(str):
+    """
+    Plug name that does not need to be validated again.
+    """
+    __slots__ = ()
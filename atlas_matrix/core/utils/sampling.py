@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+""" Bulk sampling of matrices over a frame range
+
+Matrix plugs are resolved once, then evaluated frame by frame through an
+`om.MDGContext` without changing the current time. Samples are written in a
+preallocated (frames, objects, 4, 4) float64 NumPy array. Without NumPy the
+same layout is returned as nested lists of `om.MMatrix`.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+from typing import List, Sequence, Tuple
+
+import maya.api.OpenMaya as om
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from atlas_matrix.core.utils import attributes
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _selection(names: Sequence[str]) -> Tuple[om.MSelectionList, List[int]]:
+    """
+    Add names to one selection list, once each.
+
+    The selection list merges duplicates, a name given twice would shift the
+    index of every following item.
+
+    Args:
+        names (Sequence[str]): The object or plug names.
+
+    Returns:
+        Tuple[om.MSelectionList, List[int]]: The selection list and the index of each name in it.
+    """
+    unique = {}
+    selection = om.MSelectionList()
+    for name in names:
+        if name not in unique:
+            unique[name] = len(unique)
+            selection.add(name)
+    return selection, [unique[name] for name in names]
+
+
+def _plugs(plugs: Sequence[str]) -> Tuple[List[om.MPlug], List[int]]:
+    """
+    Resolve many matrix plugs in one selection list.
+
+    Args:
+        plugs (Sequence[str]): The plug names, e.g. "ctrl.offsetParentMatrix".
+
+    Returns:
+        Tuple[List[om.MPlug], List[int]]: The unique plugs and the index of each plug name in them.
+    """
+    selection, indices = _selection(plugs)
+    return [selection.getPlug(i) for i in range(selection.length())], indices
+
+
+def current_world(names: Sequence[str]):
+    """
+    Read the world matrix of many objects at the current time.
+
+    Args:
+        names (Sequence[str]): The object names, repeated names included.
+
+    Returns:
+        np.ndarray: A (objects, 4, 4) array, or a list of om.MMatrix without NumPy.
+    """
+    selection, indices = _selection(names)
+    matrices = [selection.getDagPath(i).inclusiveMatrix() for i in range(selection.length())]
+
+    if np is None:
+        return [matrices[i] for i in indices]
+
+    out = np.empty((len(names), 4, 4), dtype=np.float64)
+    flat = out.reshape(len(names), 16)
+    for row, i in enumerate(indices):
+        flat[row] = matrices[i]
+    return out
+
+
+def sample_plugs(plugs: Sequence[str], frames: Sequence[float]):
+    """
+    Sample many matrix plugs over many frames in one pass, without changing the current time.
+
+    Args:
+        plugs (Sequence[str]): The matrix plug names.
+        frames (Sequence[float]): The sampled frames, in UI time unit.
+
+    Returns:
+        np.ndarray: A (frames, plugs, 4, 4) array, or nested lists of om.MMatrix
+            indexed [frame][plug] without NumPy.
+    """
+    mplugs, indices = _plugs(plugs)
+    time_unit = om.MTime.uiUnit()
+
+    if np is None:
+        samples = []
+        for frame in frames:
+            context = om.MDGContext(om.MTime(frame, time_unit))
+            matrices = [om.MFnMatrixData(plug.asMObject(context)).matrix() for plug in mplugs]
+            samples.append([matrices[i] for i in indices])
+        return samples
+
+    data = om.MFnMatrixData()
+    unique = np.empty((len(frames), len(mplugs), 16), dtype=np.float64)
+    for f, frame in enumerate(frames):
+        context = om.MDGContext(om.MTime(frame, time_unit))
+        for p, plug in enumerate(mplugs):
+            data.setObject(plug.asMObject(context))
+            unique[f, p] = data.matrix()
+    return unique[:, indices].reshape(len(frames), len(plugs), 4, 4)
+
+
+def sample_world(names: Sequence[str], frames: Sequence[float]):
+    """
+    Sample the world matrix of many objects over many frames.
+
+    Args:
+        names (Sequence[str]): The object names.
+        frames (Sequence[float]): The sampled frames, in UI time unit.
+
+    Returns:
+        np.ndarray: A (frames, objects, 4, 4) array, or nested lists of om.MMatrix without NumPy.
+
+    Example:
+        worlds = sample_world(["hand_l", "hand_r"], range(1001, 1101))
+        positions = worlds[:, :, 3, :3]
+    """
+    return sample_plugs([attributes.get_world_matrix(name) for name in names], frames)
+
+
+def to_mmatrix(sample) -> om.MMatrix:
+    """
+    Convert one sample to an om.MMatrix.
+
+    Args:
+        sample: A (4, 4) array, 16 values or an om.MMatrix.
+
+    Returns:
+        om.MMatrix: The matrix.
+    """
+    if isinstance(sample, om.MMatrix):
+        return sample
+    if hasattr(sample, "ravel"):
+        sample = sample.ravel().tolist()
+    return om.MMatrix(sample)
@@ -151,6 +151,19 @@ def is_holdmatrix(name: str)-> bool:
     return result == "holdMatrix"
 
 
+def is_aimmatrix(name: str)-> bool:
+    """Check if the given node is an aimMatrix node.
+
+    Args:
+        name (str): The name of the node.
+
+    Returns:
+        bool: True if the node is of type 'aimMatrix', False otherwise.
+    """
+    result = nodes.get_node_type(name)
+    return result == "aimMatrix"
+
+
 def is_pickmatrix(name: str)-> bool:
     """Check if the given node is a pickMatrix node.
 
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+""" Headless multi-process evaluation of Atlas parent constraints
+
+Evaluates the offsetParentMatrix of Atlas parent constraint descriptions over
+a shot, outside of Maya. Frames are split in chunks evaluated by a process
+pool. The input world matrices and the output offsetParentMatrix arrays live
+in `multiprocessing.shared_memory`, workers only receive frame ranges, so no
+large array is ever pickled.
+
+Each constraint evaluates like the Maya network it describes:
+    target = offset * driverWorld * parentInverse   (multMatrix, one per driver)
+    result = blend of the targets by weight          (blendMatrix, from the identity)
+
+Requires NumPy.
+
+Example usage:
+    python -m atlas_matrix.offline.evaluate shot.json drivers.npy --output opm.npy --workers 64
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import os
+import sys
+import json
+import argparse
+from typing import List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ---------- CONSTANTS ----------
+
+
+IDENTITY = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+# Chunks per worker, more chunks balance uneven workers at the cost of scheduling
+CHUNKS_PER_WORKER = 4
+
+
+# ---------- DATA CLASS ----------
+
+
+@dataclass
+class ConstraintDesc:
+    driven: str
+    drivers: List[int]
+    offsets: List[List[float]] = field(default_factory=list)
+    parent: Optional[int] = None
+    weights: List[float] = field(default_factory=list)
+
+
+# ---------- MATRIX FUNCTIONS ----------
+
+
+def _to_quaternions(rotations: "np.ndarray") -> "np.ndarray":
+    """Convert (N, 3, 3) orthonormal rotations to (N, 4) xyzw quaternions."""
+    m = rotations
+    trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+    candidates = np.stack([
+        np.stack([m[:, 1, 2] - m[:, 2, 1], m[:, 2, 0] - m[:, 0, 2], m[:, 0, 1] - m[:, 1, 0], 1.0 + trace], axis=1),
+        np.stack([1.0 + m[:, 0, 0] - m[:, 1, 1] - m[:, 2, 2], m[:, 0, 1] + m[:, 1, 0], m[:, 2, 0] + m[:, 0, 2], m[:, 1, 2] - m[:, 2, 1]], axis=1),
+        np.stack([m[:, 0, 1] + m[:, 1, 0], 1.0 - m[:, 0, 0] + m[:, 1, 1] - m[:, 2, 2], m[:, 1, 2] + m[:, 2, 1], m[:, 2, 0] - m[:, 0, 2]], axis=1),
+        np.stack([m[:, 2, 0] + m[:, 0, 2], m[:, 1, 2] + m[:, 2, 1], 1.0 - m[:, 0, 0] - m[:, 1, 1] + m[:, 2, 2], m[:, 0, 1] - m[:, 1, 0]], axis=1),
+    ], axis=1)
+
+    # Each candidate is exact, the one with the largest norm is the best conditioned
+    norms = np.linalg.norm(candidates, axis=2)
+    best = candidates[np.arange(len(m)), np.argmax(norms, axis=1)]
+    return best / np.linalg.norm(best, axis=1, keepdims=True)
+
+
+def _to_rotations(quaternions: "np.ndarray") -> "np.ndarray":
+    """Convert (N, 4) xyzw quaternions to (N, 3, 3) rotations, inverse of _to_quaternions."""
+    x, y, z, w = quaternions.T
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y + z * w), 2 * (x * z - y * w)], axis=1),
+        np.stack([2 * (x * y - z * w), 1 - 2 * (x * x + z * z), 2 * (y * z + x * w)], axis=1),
+        np.stack([2 * (x * z + y * w), 2 * (y * z - x * w), 1 - 2 * (x * x + y * y)], axis=1),
+    ], axis=1)
+
+
+def _slerp(a: "np.ndarray", b: "np.ndarray", weight: float) -> "np.ndarray":
+    """Spherical interpolation of (N, 4) quaternions along the shortest path."""
+    dot = np.sum(a * b, axis=1, keepdims=True)
+    b = np.where(dot < 0.0, -b, b)
+    dot = np.abs(dot)
+
+    angle = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin = np.sin(angle)
+    close = sin < 1e-6
+    safe = np.where(close, 1.0, sin)
+    wa = np.where(close, 1.0 - weight, np.sin((1.0 - weight) * angle) / safe)
+    wb = np.where(close, weight, np.sin(weight * angle) / safe)
+
+    result = wa * a + wb * b
+    return result / np.linalg.norm(result, axis=1, keepdims=True)
+
+
+def _decompose(matrices: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Split (N, 4, 4) matrices into translations, quaternions and scales."""
+    scales = np.linalg.norm(matrices[:, :3, :3], axis=2)
+    rotations = matrices[:, :3, :3] / scales[:, :, None]
+    return matrices[:, 3, :3], _to_quaternions(rotations), scales
+
+
+def _blend(a: "np.ndarray", b: "np.ndarray", weight: float) -> "np.ndarray":
+    """
+    Blend (N, 4, 4) matrices toward others like a blendMatrix target.
+
+    Translation and scale are linear, rotation is spherical. Shear is not blended.
+    """
+    if weight <= 0.0:
+        return a
+    if weight >= 1.0:
+        return b
+
+    translate_a, rotate_a, scale_a = _decompose(a)
+    translate_b, rotate_b, scale_b = _decompose(b)
+
+    out = np.zeros_like(a)
+    out[:, :3, :3] = _to_rotations(_slerp(rotate_a, rotate_b, weight)) * (scale_a + (scale_b - scale_a) * weight)[:, :, None]
+    out[:, 3, :3] = translate_a + (translate_b - translate_a) * weight
+    out[:, 3, 3] = 1.0
+    return out
+
+
+def evaluate_frames(descriptions: Sequence[ConstraintDesc], inputs: "np.ndarray", out: "np.ndarray") -> None:
+    """
+    Evaluate constraints over frames, in place.
+
+    Args:
+        descriptions (Sequence[ConstraintDesc]): The constraints, one output column each.
+        inputs (np.ndarray): The (frames, inputs, 4, 4) world matrices of drivers and parents.
+        out (np.ndarray): The (frames, constraints, 4, 4) offsetParentMatrix receiving the result.
+    """
+    identity = np.asarray(IDENTITY, dtype=np.float64).reshape(4, 4)
+    for column, desc in enumerate(descriptions):
+        parent_inverse = identity if desc.parent is None else np.linalg.inv(inputs[:, desc.parent])
+
+        targets = []
+        for i, driver in enumerate(desc.drivers):
+            offset = np.asarray(desc.offsets[i] if i < len(desc.offsets) else IDENTITY, dtype=np.float64).reshape(4, 4)
+            targets.append(offset @ inputs[:, driver] @ parent_inverse)
+
+        # Each blendMatrix target blends the previous result, the first one the identity input
+        result = np.broadcast_to(identity, targets[0].shape)
+        for i, target in enumerate(targets):
+            result = _blend(result, target, desc.weights[i] if i < len(desc.weights) else 1.0)
+
+        out[:, column] = result
+
+
+# ---------- SHARED MEMORY ----------
+
+
+_WORKER = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach an existing shared memory block without handing it to the resource tracker."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13, the creating process still owns and unlinks the block
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(
+        input_name: str,
+        input_shape: Tuple[int, ...],
+        output_name: str,
+        output_shape: Tuple[int, ...],
+        descriptions: List[ConstraintDesc]
+) -> None:
+    """Process pool initializer, attaching the shared arrays once per worker."""
+    input_memory = _attach(input_name)
+    output_memory = _attach(output_name)
+    _WORKER.update(
+        memory=(input_memory, output_memory),
+        inputs=np.ndarray(input_shape, dtype=np.float64, buffer=input_memory.buf),
+        out=np.ndarray(output_shape, dtype=np.float64, buffer=output_memory.buf),
+        descriptions=descriptions,
+    )
+
+
+def _evaluate_chunk(frames: Tuple[int, int]) -> int:
+    """Process pool entry point, evaluating a frame range of the shared arrays."""
+    start, stop = frames
+    evaluate_frames(_WORKER["descriptions"], _WORKER["inputs"][start:stop], _WORKER["out"][start:stop])
+    return stop - start
+
+
+def _chunks(frame_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split a frame count into contiguous (start, stop) ranges."""
+    size = max(1, -(-frame_count // (workers * CHUNKS_PER_WORKER)))
+    return [(start, min(start + size, frame_count)) for start in range(0, frame_count, size)]
+
+
+def evaluate(
+        descriptions: Sequence[ConstraintDesc],
+        inputs: "np.ndarray",
+        workers: Optional[int] = None
+) -> "np.ndarray":
+    """
+    Evaluate the offsetParentMatrix of many constraints over a shot with a process pool.
+
+    Args:
+        descriptions (Sequence[ConstraintDesc]): The constraints.
+        inputs (np.ndarray): The (frames, inputs, 4, 4) world matrices of drivers and parents.
+        workers (Optional[int]): The number of processes, defaults to the CPU count.
+
+    Returns:
+        np.ndarray: The (frames, constraints, 4, 4) offsetParentMatrix of each constraint.
+
+    Raises:
+        RuntimeError: If NumPy is not available.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required to evaluate constraints offline.")
+
+    inputs = np.ascontiguousarray(inputs, dtype=np.float64)
+    descriptions = list(descriptions)
+    output_shape = (inputs.shape[0], len(descriptions), 4, 4)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or inputs.shape[0] < 2:
+        out = np.empty(output_shape, dtype=np.float64)
+        evaluate_frames(descriptions, inputs, out)
+        return out
+
+    input_memory = shared_memory.SharedMemory(create=True, size=max(inputs.nbytes, 1))
+    output_memory = shared_memory.SharedMemory(create=True, size=max(int(np.prod(output_shape)) * 8, 1))
+    try:
+        np.ndarray(inputs.shape, dtype=np.float64, buffer=input_memory.buf)[:] = inputs
+        initargs = (input_memory.name, inputs.shape, output_memory.name, output_shape, descriptions)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+            list(executor.map(_evaluate_chunk, _chunks(inputs.shape[0], workers)))
+        return np.ndarray(output_shape, dtype=np.float64, buffer=output_memory.buf).copy()
+    finally:
+        for memory in (input_memory, output_memory):
+            memory.close()
+            memory.unlink()
+
+
+# ---------- FILE FUNCTIONS ----------
+
+
+def load_descriptions(path: str) -> Tuple[List[str], List[ConstraintDesc]]:
+    """Read constraint descriptions from JSON.
+
+    The file holds the ordered input names, matching the columns of the input
+    matrices, and the constraints referencing them by name:
+        {"inputs": ["world_ctrl", "hips"],
+         "constraints": [{"driven": "pelvis_ctrl", "drivers": ["hips"], "parent": "world_ctrl",
+                          "offsets": [[16 values]], "weights": [1.0]}]}
+
+    Args:
+        path (str): The JSON file.
+
+    Returns:
+        Tuple[List[str], List[ConstraintDesc]]: The input names and the constraints.
+    """
+    with open(path) as f:
+        data = json.load(f)
+
+    columns = {name: column for column, name in enumerate(data["inputs"])}
+    descriptions = [
+        ConstraintDesc(
+            driven=entry["driven"],
+            drivers=[columns[driver] for driver in entry["drivers"]],
+            offsets=entry.get("offsets", []),
+            parent=columns[entry["parent"]] if entry.get("parent") else None,
+            weights=entry.get("weights", []),
+        )
+        for entry in data["constraints"]
+    ]
+    return data["inputs"], descriptions
+
+
+# ---------- COMMAND LINE ----------
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point.
+
+    Args:
+        argv (Optional[Sequence[str]]): The arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Evaluate Atlas Matrix parent constraints over a shot.")
+    parser.add_argument("descriptions", help="JSON constraint descriptions")
+    parser.add_argument("inputs", help=".npy (frames, inputs, 4, 4) world matrices, in description input order")
+    parser.add_argument("--output", required=True, help=".npy file receiving the (frames, constraints, 4, 4) result")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        sys.stderr.write("NumPy is required to evaluate constraints offline.\n")
+        return 1
+
+    names, descriptions = load_descriptions(args.descriptions)
+    inputs = np.load(args.inputs, mmap_mode="r")
+    if inputs.ndim != 4 or inputs.shape[1:] != (len(names), 4, 4):
+        sys.stderr.write(f"Expected inputs of shape (frames, {len(names)}, 4, 4), got {inputs.shape}.\n")
+        return 1
+
+    np.save(args.output, evaluate(descriptions, inputs, workers=args.workers))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,592 @@
+# -*- coding: utf-8 -*-
+""" Offline Maya ASCII rewriter stripping Atlas constraints without launching Maya
+
+This module reproduces `RemoveCon` at the file level, in a single streaming
+pass per file:
+    - createNode blocks of Atlas nodes and every connectAttr touching them are removed
+    - initialMatrix is restored into offsetParentMatrix
+    - initialTransform is restored into the translate/rotate/scale/shear setAttr
+    - W#, initialMatrix and initialTransform attributes are dropped
+    - connections feeding the initial attributes are moved back to the original attributes,
+      the ones feeding the weights are removed along with their animCurve
+
+Only the node block being read is buffered (up to BLOCK_BUFFER_LIMIT bytes), so
+memory stays bounded whatever the size of the file. Many files are rewritten in
+parallel with a process pool.
+
+This module does not import maya and can run in any Python 3 interpreter:
+
+    python -m atlas_matrix.offline.ma_rewriter /shows/assets --suffix _clean --workers 16
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import os
+import re
+import sys
+import json
+import mmap
+import argparse
+import tempfile
+from typing import BinaryIO, Iterator, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from atlas_matrix.offline.ma_scanner import (
+    MATRIX_NODE_TYPES,
+    QUOTED,
+    collect_files,
+    is_atlas_name,
+    parse_add_attr,
+    parse_connect_attr,
+    parse_create_node,
+    short_name,
+    split_plug,
+)
+
+
+# ---------- CONSTANTS ----------
+
+
+# Node blocks bigger than this are streamed once known not to be constrained
+BLOCK_BUFFER_LIMIT = 1 << 20
+
+INITIAL_ATTRIBUTE = re.compile(r"^(W\d+|atlasWeights|initial(Matrix|Transform|Translate[XYZ]|Rotate[XYZ]|Scale[XYZ]|Shear(XY|XZ|YZ)))$")
+
+# animCurves keying a constraint weight, named "<driven>_<attribute>" by Maya
+WEIGHT_CURVE = re.compile(r"^(.+)_(W\d+|atlasWeights(?:_\d+_?)?)$")
+
+# Utility nodes computing the layered weights of converted native constraints
+WEIGHT_NODE = re.compile(r"_pconstrainedby_weight\d+$")
+WEIGHT_NODE_TYPES = frozenset(("plusMinusAverage", "condition", "multiplyDivide"))
+
+# Initial attribute -> original attribute, used to move incoming connections back
+RESTORED_ATTRIBUTES = {"initialMatrix": "offsetParentMatrix"}
+for _channel, _axes in (("Translate", "XYZ"), ("Rotate", "XYZ"), ("Scale", "XYZ")):
+    for _axis in _axes:
+        RESTORED_ATTRIBUTES[f"initial{_channel}{_axis}"] = f"{_channel.lower()}{_axis}"
+for _axis in ("XY", "XZ", "YZ"):
+    RESTORED_ATTRIBUTES[f"initialShear{_axis}"] = f"shear{_axis}"
+
+# setAttr short names written by Maya for the attributes being restored
+TRANSFORM_SET_ATTRIBUTES = frozenset((
+    "t", "tx", "ty", "tz", "translate", "translateX", "translateY", "translateZ",
+    "r", "rx", "ry", "rz", "rotate", "rotateX", "rotateY", "rotateZ",
+    "s", "sx", "sy", "sz", "scale", "scaleX", "scaleY", "scaleZ",
+    "sh", "shxy", "shxz", "shyz", "shear", "shearXY", "shearXZ", "shearYZ",
+))
+OPM_SET_ATTRIBUTES = frozenset(("opm", "offsetParentMatrix"))
+
+# Channel -> (short setAttr name, initial children, default value)
+TRANSFORM_CHANNELS = (
+    ("t", ("initialTranslateX", "initialTranslateY", "initialTranslateZ"), 0.0),
+    ("r", ("initialRotateX", "initialRotateY", "initialRotateZ"), 0.0),
+    ("s", ("initialScaleX", "initialScaleY", "initialScaleZ"), 1.0),
+    ("sh", ("initialShearXY", "initialShearXZ", "initialShearYZ"), 0.0),
+)
+
+TYPE_FLAG = re.compile(r'-type\s+"[^"]*"')
+# Lock, keyable and channel box flags of a setAttr statement, kept on restored channels
+STATE_FLAG = re.compile(r"-(l|k|cb|lock|keyable|channelBox)\s+(on|off|true|false|yes|no|1|0)\b")
+NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+# ---------- FUNCTIONS ----------
+
+
+def iter_raw_statements(mm: mmap.mmap) -> Iterator[List[bytes]]:
+    """Iterate over the statements of a Maya ASCII file, keeping their raw lines.
+
+    Args:
+        mm (mmap.mmap): The memory mapped file.
+
+    Yields:
+        List[bytes]: The raw lines of a statement (comments and blank lines are single statements).
+    """
+    lines = []
+    for line in iter(mm.readline, b""):
+        stripped = line.strip()
+        if not lines and (not stripped or stripped.startswith(b"//")):
+            yield [line]
+            continue
+        lines.append(line)
+        if stripped.endswith(b";"):
+            yield lines
+            lines = []
+    if lines:
+        yield lines
+
+
+def _set_attr_target(text: str) -> str:
+    """Get the attribute set by a node block setAttr statement.
+
+    Args:
+        text (str): The statement, e.g. 'setAttr -k on ".initialTranslateX" 1.5;'.
+
+    Returns:
+        str: The attribute name without the leading dot and index.
+    """
+    quoted = QUOTED.search(text)
+    if not quoted:
+        return ""
+    return quoted.group(1).lstrip(".").split("[", 1)[0]
+
+
+def _set_attr_values(text: str) -> List[float]:
+    """Get the numeric values of a setAttr statement.
+
+    Args:
+        text (str): The statement.
+
+    Returns:
+        List[float]: The values written after the attribute name.
+    """
+    quoted = QUOTED.search(text)
+    if not quoted:
+        return []
+    tail = TYPE_FLAG.sub("", text[quoted.end():])
+    return [float(value) for value in NUMBER.findall(tail)]
+
+
+def _set_attr_flags(text: str) -> str:
+    """Get the lock, keyable and channel box flags of a setAttr statement.
+
+    Args:
+        text (str): The statement, e.g. 'setAttr -l on -k off ".sx";'.
+
+    Returns:
+        str: The flags written before the attribute name, e.g. '-l on -k off', empty if none.
+    """
+    quoted = QUOTED.search(text)
+    head = text[:quoted.start()] if quoted else text
+    return " ".join(f"-{flag} {value}" for flag, value in STATE_FLAG.findall(head))
+
+
+def _format(values: Sequence[float]) -> str:
+    """Format values the way Maya ASCII writes them.
+
+    Args:
+        values (Sequence[float]): The values.
+
+    Returns:
+        str: The space separated values.
+    """
+    return " ".join(f"{value:.17g}" for value in values)
+
+
+class _Block:
+    """A node block (createNode or select statement and its indented statements) being buffered."""
+    __slots__ = ("name", "statements", "size", "driven", "passthrough", "selected")
+
+    def __init__(self, name: str, statement: List[bytes]):
+        self.name = name
+        self.statements = [statement]
+        self.size = sum(len(line) for line in statement)
+        self.driven = False
+        self.passthrough = False
+        self.selected = False
+
+
+class MaRewriter:
+    """
+    Class stripping Atlas constraints from a Maya ASCII stream.
+
+    Statements are fed in file order through `feed`, the rewritten stream is
+    written to `out` as soon as each statement (or node block) is complete.
+    """
+    def __init__(self, out: BinaryIO):
+        """
+        Initialize the rewriter.
+
+        Args:
+            out (BinaryIO): The binary stream receiving the rewritten file.
+        """
+        self.out = out
+        self.deleted = set()
+        self.driven = set()
+        self.block = None
+        self.skipping = False
+        self.removed_connections = 0
+        self.moved_connections = 0
+
+
+    def _write(self, statement: List[bytes]) -> None:
+        """Write a statement to the output stream."""
+        self.out.writelines(statement)
+
+
+    def _close_block(self) -> None:
+        """Write the buffered node block, rewritten if it belongs to a driven object."""
+        block, self.block = self.block, None
+        if block is None or block.passthrough:
+            return
+        if block.selected and block.name in self.driven:
+            block.statements = self._strip(block.statements)
+        elif block.driven:
+            self.driven.add(block.name)
+            block.statements = self._restore(block.statements)
+        for statement in block.statements:
+            self._write(statement)
+
+
+    @staticmethod
+    def _strip(statements: List[List[bytes]]) -> List[List[bytes]]:
+        """
+        Drop the constraint attribute statements of an already restored driven object.
+
+        Args:
+            statements (List[List[bytes]]): The raw statements of the block.
+
+        Returns:
+            List[List[bytes]]: The kept statements.
+        """
+        kept = []
+        for statement in statements:
+            text = b"".join(statement).decode("utf-8", "replace").strip()
+            if text.startswith("setAttr") and INITIAL_ATTRIBUTE.match(_set_attr_target(text)):
+                continue
+            kept.append(statement)
+        return kept
+
+
+    def _restore(self, statements: List[List[bytes]]) -> List[List[bytes]]:
+        """
+        Rewrite the block of a driven object the way RemoveCon restores it.
+
+        Args:
+            statements (List[List[bytes]]): The raw statements of the block.
+
+        Returns:
+            List[List[bytes]]: The rewritten statements.
+        """
+        values = {}
+        added = set()
+        kept = []
+        for statement in statements:
+            text = b"".join(statement).decode("utf-8", "replace").strip()
+
+            if text.startswith("addAttr"):
+                attribute = parse_add_attr(text)
+                if attribute and INITIAL_ATTRIBUTE.match(attribute):
+                    added.add(attribute)
+                    continue
+
+            elif text.startswith("setAttr"):
+                attribute = _set_attr_target(text)
+                if INITIAL_ATTRIBUTE.match(attribute):
+                    values[attribute] = _set_attr_values(text)
+                    continue
+
+            kept.append((text, statement))
+
+        restore_matrix = "initialMatrix" in added
+        restore_transform = "initialTransform" in added or any(attribute.startswith("initialTranslate") for attribute in added)
+
+        indent = b"\t"
+        result = []
+        flags = []
+        for text, statement in kept:
+            if text.startswith("setAttr"):
+                attribute = _set_attr_target(text)
+                if restore_matrix and attribute in OPM_SET_ATTRIBUTES:
+                    continue
+                if restore_transform and attribute in TRANSFORM_SET_ATTRIBUTES:
+                    # Values are rewritten below, the channel state is applied after them
+                    state = _set_attr_flags(text)
+                    if state:
+                        target = QUOTED.search(text).group(1)
+                        flags.append([indent + f'setAttr {state} "{target}";\n'.encode()])
+                    continue
+            result.append(statement)
+
+        if restore_matrix:
+            matrix = values.get("initialMatrix") or []
+            if len(matrix) == 16:
+                result.append([indent + f'setAttr ".opm" -type "matrix" {_format(matrix)};\n'.encode()])
+
+        if restore_transform:
+            for short, children, default in TRANSFORM_CHANNELS:
+                channel = [(values.get(child) or [default])[0] for child in children]
+                result.append([indent + f'setAttr ".{short}" -type "double3" {_format(channel)} ;\n'.encode()])
+            result.extend(flags)
+
+        return result
+
+
+    def _is_constraint_node(self, node_type: str, name: str) -> bool:
+        """
+        Check if a created node belongs to an Atlas constraint.
+
+        Weight animCurves are recognized by their default name, their driven
+        object being written before them.
+
+        Args:
+            node_type (str): The node type.
+            name (str): The node name.
+
+        Returns:
+            bool: True if the node block must be removed.
+        """
+        if node_type in MATRIX_NODE_TYPES and is_atlas_name(name):
+            return True
+        if node_type in WEIGHT_NODE_TYPES and WEIGHT_NODE.search(name):
+            return True
+        if node_type.startswith("animCurve"):
+            curve = WEIGHT_CURVE.match(name)
+            return bool(curve) and curve.group(1) in self.driven
+        return False
+
+
+    def _connect_attr(self, statement: List[bytes], text: str) -> None:
+        """Filter or retarget a connectAttr statement."""
+        plugs = parse_connect_attr(text)
+        if not plugs:
+            self._write(statement)
+            return
+
+        source, destination = plugs
+        destination_node, _, destination_attribute = destination.partition(".")
+        source_node, destination_node = short_name(source.partition(".")[0]), short_name(destination_node)
+
+        if source_node in self.deleted or destination_node in self.deleted:
+            self.removed_connections += 1
+            return
+
+        if source_node in self.driven and INITIAL_ATTRIBUTE.match(split_plug(source)[1]):
+            self.removed_connections += 1
+            return
+
+        if destination_node in self.driven and destination_attribute in RESTORED_ATTRIBUTES:
+            restored = f'{destination.rpartition(".")[0]}.{RESTORED_ATTRIBUTES[destination_attribute]}'
+            text = text.replace(f'"{destination}"', f'"{restored}"', 1)
+            self.moved_connections += 1
+            self._write([text.encode() + b"\n"])
+            return
+
+        # Weights and initial attributes without original attribute are dropped with the constraint
+        if destination_node in self.driven and INITIAL_ATTRIBUTE.match(split_plug(destination)[1]):
+            self.removed_connections += 1
+            return
+
+        self._write(statement)
+
+
+    def feed(self, statement: List[bytes]) -> None:
+        """
+        Process the next statement of the file.
+
+        Args:
+            statement (List[bytes]): The raw lines of the statement.
+        """
+        head = statement[0]
+        stripped = head.strip()
+        indented = head[:1] in (b"\t", b" ") or stripped.startswith((b"rename -uid", b"lockNode"))
+
+        if indented and stripped:
+            if self.skipping:
+                return
+            block = self.block
+            if block is None or block.passthrough:
+                self._write(statement)
+                return
+            block.statements.append(statement)
+            block.size += sum(len(line) for line in statement)
+            if stripped.startswith(b"addAttr"):
+                attribute = parse_add_attr(stripped.decode("utf-8", "replace"))
+                if attribute and INITIAL_ATTRIBUTE.match(attribute):
+                    block.driven = True
+            if not block.driven and block.size > BLOCK_BUFFER_LIMIT:
+                for buffered in block.statements:
+                    self._write(buffered)
+                block.statements = []
+                block.passthrough = True
+            return
+
+        if not stripped or stripped.startswith(b"//"):
+            self._write(statement)
+            return
+
+        self._close_block()
+        self.skipping = False
+
+        if stripped.startswith(b"createNode "):
+            node_type, name, _ = parse_create_node(stripped.decode("utf-8", "replace"))
+            if self._is_constraint_node(node_type, name):
+                self.deleted.add(name)
+                self.skipping = True
+                return
+            self.block = _Block(name, statement)
+
+        elif stripped.startswith(b"select "):
+            name = short_name(stripped.decode("utf-8", "replace").split()[-1].strip('";'))
+            if name in self.deleted:
+                self.skipping = True
+                return
+            self.block = _Block(name, statement)
+            self.block.selected = True
+
+        elif stripped.startswith(b"connectAttr "):
+            self._connect_attr(statement, b"".join(statement).decode("utf-8", "replace").strip())
+
+        elif stripped.startswith(b"setAttr "):
+            quoted = QUOTED.search(stripped.decode("utf-8", "replace"))
+            if quoted and short_name(quoted.group(1).partition(".")[0]) in self.deleted:
+                return
+            self._write(statement)
+
+        else:
+            self._write(statement)
+
+
+    def close(self) -> None:
+        """Flush the last buffered block."""
+        self._close_block()
+
+
+def rewrite_file(path: str, output: Optional[str] = None) -> dict:
+    """Strip the Atlas constraints of a single Maya ASCII file.
+
+    The result is written to a temporary file next to the output, then moved
+    over it, so an interrupted run never leaves a half written scene.
+
+    Args:
+        path (str): The .ma file to read.
+        output (Optional[str]): The file to write, defaults to rewriting `path` in place.
+
+    Returns:
+        dict: The report of the file with file, output, removed_nodes, restored,
+            removed_connections, moved_connections and error (only on failure).
+    """
+    output = output or path
+    directory = os.path.dirname(os.path.abspath(output))
+    report = {"file": path, "output": output}
+
+    handle, temporary = tempfile.mkstemp(suffix=".ma", dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as out, open(path, "rb") as f:
+            rewriter = MaRewriter(out)
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for statement in iter_raw_statements(mm):
+                        rewriter.feed(statement)
+            rewriter.close()
+        os.replace(temporary, output)
+    except (OSError, ValueError) as e:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        report["error"] = str(e)
+        return report
+
+    report.update(
+        removed_nodes=sorted(rewriter.deleted),
+        restored=sorted(rewriter.driven),
+        removed_connections=rewriter.removed_connections,
+        moved_connections=rewriter.moved_connections,
+    )
+    return report
+
+
+def _output_path(path: str, suffix: Optional[str], output_dir: Optional[str]) -> str:
+    """Get the output path of a file.
+
+    Args:
+        path (str): The input file.
+        suffix (Optional[str]): Suffix added before the extension.
+        output_dir (Optional[str]): Directory receiving the file.
+
+    Returns:
+        str: The output file path.
+    """
+    directory, name = os.path.split(path)
+    if suffix:
+        stem, extension = os.path.splitext(name)
+        name = f"{stem}{suffix}{extension}"
+    return os.path.join(output_dir or directory, name)
+
+
+def _rewrite_job(job: tuple) -> dict:
+    """Process pool entry point."""
+    return rewrite_file(*job)
+
+
+def rewrite_files(
+        paths: Sequence[str],
+        suffix: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        workers: Optional[int] = None
+) -> List[dict]:
+    """Strip the Atlas constraints of many Maya ASCII files with a process pool.
+
+    Args:
+        paths (Sequence[str]): Files or directories to rewrite.
+        suffix (Optional[str]): Suffix added to the output files, in place if None.
+        output_dir (Optional[str]): Directory receiving the output files.
+        workers (Optional[int]): The number of processes, defaults to the CPU count.
+
+    Returns:
+        List[dict]: The report of each file, in file order.
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    jobs = [(path, _output_path(path, suffix, output_dir)) for path in collect_files(paths)]
+    if workers == 1 or len(jobs) < 2:
+        return [_rewrite_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_rewrite_job, jobs))
+
+
+# ---------- COMMAND LINE ----------
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point.
+
+    Args:
+        argv (Optional[Sequence[str]]): The arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Strip Atlas Matrix constraints from Maya ASCII files.")
+    parser.add_argument("paths", nargs="+", help=".ma files or directories")
+    parser.add_argument("--suffix", default=None, help="suffix of the output files, rewrite in place if omitted")
+    parser.add_argument("--output-dir", default=None, help="directory receiving the output files")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("--report", default=None, help="JSON report to write, stdout if omitted")
+    args = parser.parse_args(argv)
+
+    reports = rewrite_files(args.paths, suffix=args.suffix, output_dir=args.output_dir, workers=args.workers)
+    data = json.dumps(reports, indent=2)
+    if args.report:
+        with open(args.report, "w") as f:
+            f.write(data)
+    else:
+        sys.stdout.write(data + "\n")
+
+    return 1 if any("error" in report for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+""" Headless Maya ASCII scanner indexing Atlas constraints without launching Maya
+
+This module streams `.ma` files through a memory map, line by line, and only
+keeps the matrix nodes and the connections touching them, so memory stays
+bounded by the size of the constraint layer instead of the size of the file.
+Atlas constraint nodes are recognized by their naming scheme
+(`*_pconstrainedby_*`, `*_space_shifter`...) and by their connection to an
+`offsetParentMatrix`. Many files are scanned in parallel with a process pool.
+
+This module does not import maya and can run in any Python 3 interpreter:
+
+    python -m atlas_matrix.offline.ma_scanner /shows/assets --workers 16 --output index.json
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import os
+import re
+import sys
+import json
+import mmap
+import argparse
+from typing import Iterator, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+from atlas_matrix.core.utils.naming import CONSTRAINT_ATTRIBUTE, CONSTRAINT_TYPES, is_atlas_name
+
+
+# ---------- CONSTANTS ----------
+
+
+MATRIX_NODE_TYPES = frozenset((
+    "multMatrix",
+    "decomposeMatrix",
+    "composeMatrix",
+    "holdMatrix",
+    "blendMatrix",
+    "aimMatrix",
+    "pickMatrix",
+    "inverseMatrix",
+))
+
+# Long and short names of the attributes the scanner cares about
+OFFSET_PARENT_MATRIX = ("offsetParentMatrix", "opm")
+WORLD_INVERSE_MATRIX = ("worldInverseMatrix", "wim")
+DRIVER_MATRIX = ("worldMatrix", "wm", "matrix", "m")
+
+QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"')
+FLAG_VALUE = re.compile(r'-(\w+)\s+"((?:[^"\\]|\\.)*)"')
+SELECT_NODE = re.compile(r'^select\s+-ne\s+"?([^";\s]+)"?')
+
+
+# ---------- FUNCTIONS ----------
+
+
+def short_name(name: str) -> str:
+    """Strip the DAG path of a node name.
+
+    Args:
+        name (str): The node name, possibly a "|" separated path.
+
+    Returns:
+        str: The last component of the path.
+    """
+    return name.rsplit("|", 1)[-1]
+
+
+def split_plug(plug: str) -> Tuple[str, str]:
+    """Split a plug into its node short name and its root attribute name.
+
+    Args:
+        plug (str): The plug, e.g. "|grp|ctrl.opm" or "blend.tgt[0].tmat".
+
+    Returns:
+        Tuple[str, str]: The node short name and the first attribute name without index.
+    """
+    node, _, attribute = plug.partition(".")
+    return short_name(node), attribute.split(".", 1)[0].split("[", 1)[0]
+
+
+def iter_statements(path: str) -> Iterator[Tuple[int, bytes]]:
+    """Iterate over the lines of a Maya ASCII file starting a top-level or node statement.
+
+    The file is read through a memory map, lines continuing a multi-line
+    statement (long setAttr values...) are skipped.
+
+    Args:
+        path (str): The .ma file path.
+
+    Yields:
+        Tuple[int, bytes]: The byte offset of the line and the stripped line.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            continuation = False
+            offset = 0
+            for line in iter(mm.readline, b""):
+                start = offset
+                offset += len(line)
+                stripped = line.strip()
+                if not stripped or stripped.startswith(b"//"):
+                    continue
+                if not continuation:
+                    yield start, stripped
+                continuation = not stripped.endswith(b";")
+
+
+def parse_create_node(line: str) -> Tuple[str, str, Optional[str]]:
+    """Parse a createNode statement.
+
+    Args:
+        line (str): The statement, e.g. 'createNode multMatrix -n "mult1";'.
+
+    Returns:
+        Tuple[str, str, Optional[str]]: The node type, name and parent.
+    """
+    node_type = line.split(None, 2)[1].rstrip(";")
+    flags = dict(FLAG_VALUE.findall(line))
+    return node_type, flags.get("n", ""), flags.get("p")
+
+
+def parse_connect_attr(line: str) -> Optional[Tuple[str, str]]:
+    """Parse a connectAttr statement.
+
+    Args:
+        line (str): The statement, e.g. 'connectAttr "a.o" "b.opm";'.
+
+    Returns:
+        Optional[Tuple[str, str]]: The source and destination plugs, None if malformed.
+    """
+    plugs = QUOTED.findall(line)
+    if len(plugs) < 2:
+        return None
+    return plugs[0], plugs[1]
+
+
+def parse_add_attr(line: str) -> Optional[str]:
+    """Parse the long name of an addAttr statement.
+
+    Args:
+        line (str): The statement, e.g. 'addAttr -ci true -sn "W0" -ln "W0" -at "float";'.
+
+    Returns:
+        Optional[str]: The long name of the attribute, None if missing.
+    """
+    flags = dict(FLAG_VALUE.findall(line))
+    return flags.get("ln") or flags.get("longName")
+
+
+def scan_file(path: str) -> dict:
+    """Index the Atlas constraints of a single Maya ASCII file.
+
+    Only matrix nodes, connections touching them or an offsetParentMatrix, and
+    constraint attributes (W#, initialMatrix, initialTransform) are kept in memory.
+
+    Args:
+        path (str): The .ma file path.
+
+    Returns:
+        dict: The index of the file with:
+            - file (str)
+            - constraints (list): driven, drivers, parent, constraint_type, node_count, nodes
+            - dangling (list): Atlas nodes with no path to any offsetParentMatrix
+            - orphan_attributes (dict): constraint attributes by node without network
+            - atlas_node_count (int)
+            - error (str, only if the file could not be read)
+    """
+    matrix_nodes = {}
+    upstream = {}
+    opm_sources = {}
+    attributes = {}
+    current = None
+
+    try:
+        for _, raw in iter_statements(path):
+            if raw.startswith(b"createNode "):
+                node_type, name, _ = parse_create_node(raw.decode("utf-8", "replace"))
+                current = name
+                if node_type in MATRIX_NODE_TYPES:
+                    matrix_nodes[name] = node_type
+
+            elif raw.startswith(b"addAttr "):
+                attribute = parse_add_attr(raw.decode("utf-8", "replace"))
+                if current and attribute and CONSTRAINT_ATTRIBUTE.match(attribute):
+                    attributes.setdefault(current, []).append(attribute)
+
+            elif raw.startswith(b"select "):
+                match = SELECT_NODE.match(raw.decode("utf-8", "replace"))
+                current = short_name(match.group(1)) if match else None
+
+            elif raw.startswith(b"connectAttr "):
+                plugs = parse_connect_attr(raw.decode("utf-8", "replace"))
+                if not plugs:
+                    continue
+                source_node, source_attribute = split_plug(plugs[0])
+                destination_node, destination_attribute = split_plug(plugs[1])
+
+                if destination_attribute in OFFSET_PARENT_MATRIX:
+                    opm_sources[destination_node] = source_node
+                elif destination_node in matrix_nodes:
+                    upstream.setdefault(destination_node, []).append((source_node, source_attribute))
+
+            elif not raw.startswith((b"setAttr", b"rename", b"parent", b"lockNode")):
+                current = None
+    except (OSError, ValueError) as e:
+        return {"file": path, "constraints": [], "dangling": [], "orphan_attributes": {},
+                "atlas_node_count": 0, "error": str(e)}
+
+    constraints = []
+    reached = set()
+    for driven, output in opm_sources.items():
+        if output not in matrix_nodes:
+            continue
+
+        nodes, drivers, parent = [], [], None
+        queue, visited = [output], {output}
+        while queue:
+            node = queue.pop(0)
+            nodes.append(node)
+            for source_node, source_attribute in upstream.get(node, []):
+                if source_node in visited or source_node == driven:
+                    continue
+                if source_node in matrix_nodes:
+                    visited.add(source_node)
+                    queue.append(source_node)
+                elif source_attribute in WORLD_INVERSE_MATRIX:
+                    parent = source_node
+                elif source_attribute in DRIVER_MATRIX and source_node not in drivers:
+                    drivers.append(source_node)
+
+        if parent in drivers:
+            drivers.remove(parent)
+
+        if not any(is_atlas_name(node) for node in nodes) and driven not in attributes:
+            continue
+
+        reached.update(nodes)
+        constraint_type = next((value for token, value in CONSTRAINT_TYPES.items()
+                                if any(token in node for node in nodes)), "parent")
+        constraints.append({
+            "driven": driven,
+            "drivers": drivers,
+            "parent": parent,
+            "constraint_type": constraint_type,
+            "node_count": len(nodes),
+            "nodes": nodes,
+        })
+
+    atlas_nodes = [node for node in matrix_nodes if is_atlas_name(node)]
+    constrained = {constraint["driven"] for constraint in constraints}
+
+    return {
+        "file": path,
+        "constraints": constraints,
+        "dangling": [node for node in atlas_nodes if node not in reached],
+        "orphan_attributes": {node: attrs for node, attrs in attributes.items() if node not in constrained},
+        "atlas_node_count": len(set(atlas_nodes) | reached),
+    }
+
+
+def collect_files(paths: Sequence[str], extension: str = ".ma") -> List[str]:
+    """Expand directories into the Maya ASCII files they contain.
+
+    Args:
+        paths (Sequence[str]): Files or directories.
+        extension (str): The file extension to collect in directories.
+
+    Returns:
+        List[str]: The file paths, sorted for stable output.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in names if name.lower().endswith(extension))
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def scan_files(paths: Sequence[str], workers: Optional[int] = None) -> List[dict]:
+    """Index many Maya ASCII files in parallel with a process pool.
+
+    Args:
+        paths (Sequence[str]): Files or directories to scan.
+        workers (Optional[int]): The number of processes, defaults to the CPU count.
+
+    Returns:
+        List[dict]: The index of each file, in file order.
+    """
+    files = collect_files(paths)
+    if workers == 1 or len(files) < 2:
+        return [scan_file(path) for path in files]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(scan_file, files))
+
+
+# ---------- COMMAND LINE ----------
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point.
+
+    Args:
+        argv (Optional[Sequence[str]]): The arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Index Atlas Matrix constraints of Maya ASCII files.")
+    parser.add_argument("paths", nargs="+", help=".ma files or directories")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("--output", default=None, help="JSON file to write, stdout if omitted")
+    args = parser.parse_args(argv)
+
+    index = scan_files(args.paths, workers=args.workers)
+    data = json.dumps(index, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(data)
+    else:
+        sys.stdout.write(data + "\n")
+
+    return 1 if any("error" in entry for entry in index) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
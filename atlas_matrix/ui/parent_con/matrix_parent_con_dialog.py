@@ -28,7 +28,7 @@ limitations under the License.
 # ---------- IMPORT ----------
 
 from atlas_matrix.ui.pyside_compat import (
-    QtWidgets, QtCore, QtGui,
+    QtWidgets,
     QDoubleValidator,
     get_maya_main_window,
     PYSIDE_VERSION
@@ -37,6 +37,7 @@ from atlas_matrix.ui.pyside_compat import (
 import maya.cmds as cmds
 
 from atlas_matrix.core.parent_con import ParentCon, AxisFilter, AxisWeights
+from atlas_matrix.core.build_queue import BuildQueue
 from atlas_matrix.ui.parent_con.matrix_parent_con_ui import AtlasMatrixParentUi
 
 
@@ -267,30 +268,106 @@ class AtlasMatrixParentDlg(QtWidgets.QDialog):
         self.ui.checkbox_parent_offset.toggled.connect(self.ui.checkbox_parent_hold.setEnabled)
         self.ui.checkbox_parent_hold.setEnabled(self.ui.checkbox_parent_offset.isChecked())
 
+        # One driver to many driven, one queued job per driven
+        self.checkbox_parent_many_driven = QtWidgets.QCheckBox("One driver, many driven", self)
+        self.checkbox_parent_many_driven.setObjectName("checkbox_parent_many_driven")
+        self.checkbox_parent_many_driven.setToolTip(
+            "First selected object is the driver, every other selected object is constrained to it."
+        )
+        self.ui.verticalLayout.addWidget(self.checkbox_parent_many_driven)
+
+        # Deferred build progress
+        self.queue = None
+        self.close_when_finished = False
+        self.progressbar_parent_build = QtWidgets.QProgressBar(self)
+        self.progressbar_parent_build.setObjectName("progressbar_parent_build")
+        self.button_parent_cancel = QtWidgets.QPushButton("Cancel", self)
+        self.button_parent_cancel.setObjectName("button_parent_cancel")
+        horizontallayout_parent_progress = QtWidgets.QHBoxLayout()
+        horizontallayout_parent_progress.addWidget(self.progressbar_parent_build)
+        horizontallayout_parent_progress.addWidget(self.button_parent_cancel)
+        self.ui.verticalLayout.addLayout(horizontallayout_parent_progress)
+        self._set_building(False)
+
         self.ui.button_parent_apply.clicked.connect(self._on_build)
         self.ui.button_parent_add.clicked.connect(self._add_button)
         self.ui.button_parent_close.clicked.connect(self.close)
+        self.button_parent_cancel.clicked.connect(self._on_cancel)
+
+    def _set_building(self, building: bool):
+        """Toggle the widgets between the idle and the building state."""
+        self.progressbar_parent_build.setVisible(building)
+        self.button_parent_cancel.setVisible(building)
+        self.ui.button_parent_apply.setEnabled(not building)
+        self.ui.button_parent_add.setEnabled(not building)
+
+    def _on_progress(self, done: int, total: int):
+        """Update the progress bar from the build queue."""
+        self.progressbar_parent_build.setMaximum(max(total, 1))
+        self.progressbar_parent_build.setValue(done)
+
+    def _on_finished(self, queue: BuildQueue):
+        """Report the end of the build queue, closing the dialog if it was requested and every job succeeded."""
+        self._set_building(False)
+        close, self.close_when_finished = self.close_when_finished, False
+        if queue.cancelled:
+            cmds.inViewMessage(amg="<hl>Matrix Parent Constraint cancelled</hl>", pos="midCenter", fade=True)
+        elif queue.errors:
+            for job, error in queue.errors:
+                cmds.warning(f"ParentCon failed: {error}")
+        else:
+            cmds.inViewMessage(amg="<hl>Matrix Parent Constraint created</hl>", pos="midCenter", fade=True)
+            if close:
+                self.close()
 
-    def _on_build(self):
-        """Build the constraint using the current selection and UI options."""
+    def _on_cancel(self):
+        """Cancel the running build queue and roll back the constraints already built."""
+        if self.queue and self.queue.running:
+            self.queue.cancel()
+
+    def _selection_specs(self):
+        """
+        Split the selection into (driven, drivers) pairs.
+
+        Drivers then driven (last selected) by default. With many driven, the
+        first selected object drives every other one.
+
+        Returns:
+            list: The (driven, drivers) pairs, empty if the selection is too short.
+        """
         sel = cmds.ls(sl=True) or []
         if len(sel) < 2:
+            return []
+        if self.checkbox_parent_many_driven.isChecked():
+            return [(driven, sel[:1]) for driven in sel[1:]]
+        return [(sel[-1], sel[:-1])]
+
+    def _on_build(self) -> bool:
+        """
+        Queue one constraint build per driven object of the current selection.
+
+        Returns:
+            bool: True if at least one build was queued.
+        """
+        specs = self._selection_specs()
+        if not specs:
             cmds.warning("Select at least one driver and a driven (last selected).")
-            return
-        driven, drivers = sel[-1], sel[:-1]
+            return False
+        drivens = [driven for driven, _ in specs]
+        drivers = specs[0][1]
 
         print("=" * 60)
-        print(f"Building constraint:")
-        print(f"  Driven: {driven}")
+        print("Building constraint:")
+        print(f"  Driven: {drivens}")
         print(f"  Drivers: {drivers}")
 
         # Check if objects actually exist
-        for obj in [driven] + drivers:
+        for obj in drivens + drivers:
             exists = cmds.objExists(obj)
             print(f"  Object '{obj}' exists: {exists}")
             if not exists:
                 cmds.warning(f"Object does not exist in scene: {obj}")
-                return
+                return False
 
         kwargs = _ui_to_parentcon_kwargs(self.ui)
         print(f"  Offset: {kwargs['offset']}")
@@ -298,15 +375,20 @@ class AtlasMatrixParentDlg(QtWidgets.QDialog):
         print("=" * 60)
 
         try:
-            print("Creating ParentCon object...")
-            con = ParentCon(driven=driven, drivers=drivers, **kwargs)
-            print("✓ ParentCon object created")
-
-            print("Calling mount_system()...")
-            con.mount_system()
-            print("✓ mount_system() completed")
-
-            cmds.inViewMessage(amg="<hl>Matrix Parent Constraint created</hl>", pos="midCenter", fade=True)
+            print("Creating ParentCon objects...")
+            cons = [ParentCon(driven=driven, drivers=drivers, **kwargs) for driven, drivers in specs]
+            print(f"✓ {len(cons)} ParentCon objects created")
+
+            print("Queuing mount_system()...")
+            if self.queue is None or not self.queue.running:
+                self.queue = BuildQueue(on_progress=self._on_progress, on_finished=self._on_finished)
+            for con in cons:
+                self.queue.add_build(con)
+            self._on_progress(self.queue.total - len(self.queue.jobs), self.queue.total)
+            self._set_building(True)
+            self.queue.start()
+            print("✓ mount_system() queued")
+            return True
         except Exception as e:
             cmds.warning(f"ParentCon failed: {e}")
             import traceback
@@ -315,11 +397,13 @@ class AtlasMatrixParentDlg(QtWidgets.QDialog):
             print("=" * 60)
             traceback.print_exc()
             print("=" * 60)
+            return False
 
 
     def _add_button(self):
-        self._on_build()
-        self.close()
+        """Queue the builds and close the dialog once they are all done."""
+        if self._on_build():
+            self.close_when_finished = True
 
 
 DIALOG_ATTR = "_atlasMatrixParentDlg"
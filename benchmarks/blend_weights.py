@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+""" Benchmark of per-channel constraint weights
+
+Compares the native per-channel weights of the blendMatrix targets, used by
+ParentCon, with a node-based channel blend (decomposeMatrix, one blendColors
+per channel and composeMatrix) appended to a plain constraint.
+
+Run inside Maya or with mayapy:
+    mayapy -m benchmarks.blend_weights --count 500
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import argparse
+from typing import List, Optional
+
+import maya.cmds as cmds
+
+from atlas_matrix.core import bulk
+from atlas_matrix.core.parent_con import AxisWeights
+from benchmarks import common
+
+
+# ---------- CONSTANTS ----------
+
+
+WEIGHTS = AxisWeights(translate=0.5, rotate=0.25, scale=1.0, shear=1.0)
+
+MATRIX_NODE_TYPES = ("multMatrix", "blendMatrix", "decomposeMatrix", "composeMatrix", "blendColors")
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _node_channel_blend(driven: str, weights: AxisWeights) -> None:
+    """
+    Blend the channels of a constraint output toward identity with utility nodes.
+
+    Args:
+        driven (str): The constrained object.
+        weights (AxisWeights): The channel weights.
+    """
+    source = cmds.listConnections(f"{driven}.offsetParentMatrix", source=True, destination=False, plugs=True)[0]
+    decompose = cmds.createNode("decomposeMatrix", name=f"bench_decompose_{driven}")
+    compose = cmds.createNode("composeMatrix", name=f"bench_compose_{driven}")
+    cmds.connectAttr(source, f"{decompose}.inputMatrix")
+
+    for channel, rest, weight in (
+            ("Translate", 0.0, weights.translate),
+            ("Rotate", 0.0, weights.rotate),
+            ("Scale", 1.0, weights.scale),
+    ):
+        blend = cmds.createNode("blendColors", name=f"bench_blend{channel}_{driven}")
+        cmds.setAttr(f"{blend}.blender", weight)
+        cmds.setAttr(f"{blend}.color2", rest, rest, rest)
+        cmds.connectAttr(f"{decompose}.output{channel}", f"{blend}.color1")
+        cmds.connectAttr(f"{blend}.output", f"{compose}.input{channel}")
+
+    cmds.connectAttr(f"{compose}.outputMatrix", f"{driven}.offsetParentMatrix", force=True)
+
+
+def native(count: int) -> dict:
+    """
+    Build constraints with native per-channel weights and measure them.
+
+    Args:
+        count (int): The number of constraints.
+
+    Returns:
+        dict: The build time, node count and playback rate.
+    """
+    pairs = common.make_pairs(count)
+    results = {}
+    with common.timed(results, "build_s"):
+        bulk.parent_constraints(pairs, weights=WEIGHTS)
+    results["nodes"] = common.node_count(MATRIX_NODE_TYPES)
+    results["fps"] = common.playback([driven for driven, _ in pairs], mode="parallel")
+    return results
+
+
+def node_based(count: int) -> dict:
+    """
+    Build plain constraints followed by a node-based channel blend and measure them.
+
+    Args:
+        count (int): The number of constraints.
+
+    Returns:
+        dict: The build time, node count and playback rate.
+    """
+    pairs = common.make_pairs(count)
+    results = {}
+    with common.timed(results, "build_s"):
+        bulk.parent_constraints(pairs)
+        for driven, _ in pairs:
+            _node_channel_blend(driven, WEIGHTS)
+    results["nodes"] = common.node_count(MATRIX_NODE_TYPES)
+    results["fps"] = common.playback([driven for driven, _ in pairs], mode="parallel")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark per-channel constraint weights.")
+    parser.add_argument("--count", type=int, default=500, help="Number of constraints.")
+    args = parser.parse_args(argv)
+
+    rows = common.run_variants([
+        ("native target weights", lambda: native(args.count)),
+        ("node channel blend", lambda: node_based(args.count)),
+    ])
+    common.report(f"Per-channel weights, {args.count} constraints", rows, ("build_s", "nodes", "fps"))
+
+
+if __name__ == "__main__":
+    try:
+        import maya.standalone
+        maya.standalone.initialize()
+    except ImportError:
+        pass
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+""" Benchmark of bulk parent constraint builds with maintained offsets
+
+Compares `bulk.parent_constraints`, where every builder measures its offsets
+with a temporary multMatrix per driver, with `bulk.parent_constraints_planned`,
+where every offset is computed from one snapshot of the world matrices.
+
+Run inside Maya or with mayapy:
+    mayapy -m benchmarks.bulk_build --count 1000 --drivers 2
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import argparse
+from typing import Callable, List, Optional
+
+from atlas_matrix.core import bulk
+from benchmarks import common
+
+
+# ---------- FUNCTIONS ----------
+
+
+def measure(build: Callable, count: int, drivers: int) -> dict:
+    """
+    Build constraints with maintained offsets and time the build.
+
+    Args:
+        build (Callable): The bulk build function.
+        count (int): The number of constraints.
+        drivers (int): The number of drivers per constraint.
+
+    Returns:
+        dict: The build time and the time per constraint.
+    """
+    pairs = common.make_pairs(count, drivers=drivers)
+    results = {}
+    with common.timed(results, "build_s"):
+        build(pairs, offset=True)
+    results["ms_per_con"] = results["build_s"] * 1000.0 / count
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark bulk parent constraint builds with offsets.")
+    parser.add_argument("--count", type=int, default=1000, help="Number of constraints.")
+    parser.add_argument("--drivers", type=int, default=2, help="Number of drivers per constraint.")
+    args = parser.parse_args(argv)
+
+    rows = common.run_variants([
+        ("per-driver offsets", lambda: measure(bulk.parent_constraints, args.count, args.drivers)),
+        ("planned offsets", lambda: measure(bulk.parent_constraints_planned, args.count, args.drivers)),
+    ])
+    common.report(f"Bulk parent build, {args.count} constraints, {args.drivers} drivers", rows, ("build_s", "ms_per_con"))
+
+
+if __name__ == "__main__":
+    try:
+        import maya.standalone
+        maya.standalone.initialize()
+    except ImportError:
+        pass
+    main()
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+""" Shared helpers of the Atlas Matrix benchmarks
+
+Benchmarks run inside Maya or mayapy, on a new scene they build themselves.
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import json
+import math
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+from contextlib import contextmanager, nullcontext
+
+import maya.cmds as cmds
+
+
+# ---------- FUNCTIONS ----------
+
+
+@contextmanager
+def timed(results: dict, key: str):
+    """Context manager storing the elapsed time of its block in results[key], in seconds"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        results[key] = time.perf_counter() - start
+
+
+def new_scene() -> None:
+    """Open an empty scene without prompting."""
+    cmds.file(new=True, force=True)
+
+
+def animate(node: str, start: int = 1, end: int = 100) -> None:
+    """
+    Key a simple translate and rotate motion on a node.
+
+    Args:
+        node (str): The node to animate.
+        start (int): The first frame.
+        end (int): The last frame.
+    """
+    cmds.setKeyframe(node, attribute=["translateX", "rotateY"], time=start, value=0.0)
+    cmds.setKeyframe(node, attribute="translateX", time=end, value=10.0)
+    cmds.setKeyframe(node, attribute="rotateY", time=end, value=180.0)
+
+
+def make_pairs(count: int, drivers: int = 1) -> List[Tuple[str, List[str]]]:
+    """
+    Create locators to constrain, each driven with its own drivers.
+
+    Args:
+        count (int): The number of driven objects.
+        drivers (int): The number of drivers per driven.
+
+    Returns:
+        List[Tuple[str, List[str]]]: The (driven, drivers) pairs.
+    """
+    pairs = []
+    for i in range(count):
+        driven = cmds.spaceLocator(name=f"bench_driven_{i}")[0]
+        driver_list = []
+        for j in range(drivers):
+            driver = cmds.spaceLocator(name=f"bench_driver_{i}_{j}")[0]
+            cmds.setAttr(f"{driver}.translate", j, i * 0.1, 0)
+            animate(driver)
+            driver_list.append(driver)
+        pairs.append((driven, driver_list))
+    return pairs
+
+
+def make_rig(count: int, depth: int = 1, drivers: int = 1) -> List[Tuple[str, List[str]]]:
+    """
+    Create a synthetic rig of controls to constrain, nested in chains, each driven with its own drivers.
+
+    Args:
+        count (int): The number of controls.
+        depth (int): The number of controls per chain, each parented under the previous one.
+        drivers (int): The number of animated drivers per control.
+
+    Returns:
+        List[Tuple[str, List[str]]]: The (control, drivers) pairs, parents first.
+    """
+    root = cmds.createNode("transform", name="bench_rig")
+    pairs = []
+    parent = root
+    for i in range(count):
+        if i % max(depth, 1) == 0:
+            parent = root
+        control = cmds.createNode("transform", name=f"bench_ctrl_{i}", parent=parent)
+        cmds.setAttr(f"{control}.translate", 0, 1, 0)
+        driver_list = []
+        for j in range(drivers):
+            driver = cmds.spaceLocator(name=f"bench_space_{i}_{j}")[0]
+            cmds.setAttr(f"{driver}.translate", j, i * 0.1, 0)
+            animate(driver)
+            driver_list.append(driver)
+        pairs.append((control, driver_list))
+        parent = control
+    return pairs
+
+
+@contextmanager
+def evaluation_mode(mode: str):
+    """
+    Context manager running its block in an evaluation mode, restoring the previous one after.
+
+    Args:
+        mode (str): "dg", "serial", "parallel" or "cached". The cached mode is the
+            parallel evaluation with the cache evaluator enabled.
+    """
+    previous = cmds.evaluationManager(query=True, mode=True)[0]
+    cache_enabled = cmds.evaluator(name="cache", query=True, enable=True)
+    cmds.evaluationManager(mode="off" if mode == "dg" else "serial" if mode == "serial" else "parallel")
+    cmds.evaluator(name="cache", enable=mode == "cached")
+    try:
+        yield
+    finally:
+        cmds.evaluator(name="cache", enable=bool(cache_enabled))
+        cmds.evaluationManager(mode=previous)
+
+
+def playback(nodes: Sequence[str], start: int = 1, end: int = 100, mode: Optional[str] = None) -> float:
+    """
+    Measure the playback rate of a frame range, the way an animator plays it.
+
+    The range is played once with `cmds.play`, every frame evaluated as fast as
+    possible. mayapy cannot play, there every frame is set with `cmds.currentTime`
+    instead. The world matrices of the nodes are read once at the end, out of
+    the timing, to check the rig evaluated.
+
+    Args:
+        nodes (Sequence[str]): The nodes whose world matrix is checked.
+        start (int): The first frame.
+        end (int): The last frame.
+        mode (Optional[str]): The evaluation mode of `evaluation_mode`, the current one if None.
+
+    Returns:
+        float: The frames played per second after the first one.
+
+    Raises:
+        RuntimeError: If the playback did not reach the last frame or a world matrix is not finite.
+    """
+    options = {
+        flag: cmds.playbackOptions(query=True, **{flag: True})
+        for flag in ("minTime", "maxTime", "loop", "playbackSpeed", "maxPlaybackSpeed")
+    }
+    cmds.playbackOptions(minTime=start, maxTime=end, loop="once", playbackSpeed=0, maxPlaybackSpeed=0)
+    cmds.currentTime(start, update=True)
+    try:
+        with evaluation_mode(mode) if mode else nullcontext():
+            begin = time.perf_counter()
+            if cmds.about(batch=True):
+                for frame in range(start + 1, end + 1):
+                    cmds.currentTime(frame, update=True)
+            else:
+                cmds.play(forward=True, wait=True)
+            elapsed = time.perf_counter() - begin
+    finally:
+        cmds.playbackOptions(**options)
+
+    frame = cmds.currentTime(query=True)
+    if frame != end:
+        raise RuntimeError(f"Playback stopped at frame {frame} instead of {end}.")
+    for node in nodes:
+        if not all(math.isfinite(value) for value in cmds.getAttr(f"{node}.worldMatrix[0]")):
+            raise RuntimeError(f"{node}.worldMatrix[0] is not finite after playback.")
+    return (end - start) / elapsed
+
+
+def node_count(node_types: Sequence[str] = ()) -> int:
+    """
+    Count the dependency nodes of the scene.
+
+    Args:
+        node_types (Sequence[str]): Only count these node types, every node if empty.
+
+    Returns:
+        int: The node count.
+    """
+    return len(cmds.ls(type=list(node_types)) if node_types else cmds.ls(dependencyNodes=True))
+
+
+def report(title: str, rows: Sequence[Tuple[str, dict]], columns: Sequence[str]) -> None:
+    """
+    Print benchmark results as a table.
+
+    Args:
+        title (str): The benchmark name.
+        rows (Sequence[Tuple[str, dict]]): The label and results of each variant.
+        columns (Sequence[str]): The result keys to print.
+    """
+    print(f"\n{title}")
+    print(f"{'variant':<24}" + "".join(f"{column:>16}" for column in columns))
+    for label, results in rows:
+        print(f"{label:<24}" + "".join(f"{results.get(column, float('nan')):>16.3f}" for column in columns))
+
+
+def run_variants(variants: Sequence[Tuple[str, Callable[[], dict]]]) -> List[Tuple[str, dict]]:
+    """
+    Run each variant on a new scene.
+
+    Args:
+        variants (Sequence[Tuple[str, Callable[[], dict]]]): The label and function of each variant.
+
+    Returns:
+        List[Tuple[str, dict]]: The label and results of each variant.
+    """
+    rows = []
+    for label, function in variants:
+        new_scene()
+        rows.append((label, function()))
+    return rows
+
+
+def write_json(path: Optional[str], data: dict) -> str:
+    """
+    Dump benchmark results as JSON.
+
+    Args:
+        path (Optional[str]): The file to write, nothing is written if None.
+        data (dict): The results.
+
+    Returns:
+        str: The JSON string.
+    """
+    text = json.dumps(data, indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+""" Benchmark of the playback throughput of constrained rigs
+
+Builds a synthetic rig of controls constrained with ParentCon, then with the
+equivalent native parentConstraint, and measures the playback rate of each in
+DG, serial, parallel and cached evaluation.
+
+Run inside Maya or with mayapy:
+    mayapy -m benchmarks.playback --count 500 --depth 4 --drivers 2 --output playback.json
+
+Author: Clement Daures
+Company: The Rigging Atlas
+Website: theriggingatlas.com
+Created: 2025
+
+# ---------- LICENSE ----------
+
+Copyright 2025 Clement Daures - The Rigging Atlas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---------- IMPORT ----------
+
+import argparse
+from typing import List, Optional, Sequence, Tuple
+
+import maya.cmds as cmds
+
+from atlas_matrix.core import bulk
+from atlas_matrix.core.parent_con import AxisFilter
+from benchmarks import common
+
+
+# ---------- CONSTANTS ----------
+
+
+MODES = ("dg", "serial", "parallel", "cached")
+
+MATRIX_NODE_TYPES = ("multMatrix", "blendMatrix", "decomposeMatrix", "composeMatrix", "holdMatrix", "parentConstraint")
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _axis_filter(axes: str) -> AxisFilter:
+    """Get the AxisFilter enabling the given axes, e.g. "xz" """
+    return AxisFilter(*(axis in axes for axis in "xyz"))
+
+
+def _skip(axes: str) -> List[str]:
+    """Get the native skip flag value disabling the axes missing from axes"""
+    return [axis for axis in "xyz" if axis not in axes] or ["none"]
+
+
+def build_atlas(pairs: Sequence[Tuple[str, List[str]]], args: argparse.Namespace) -> None:
+    """
+    Constrain the rig with ParentCon.
+
+    Args:
+        pairs (Sequence[Tuple[str, List[str]]]): The (control, drivers) pairs.
+        args (argparse.Namespace): The rig options.
+    """
+    bulk.parent_constraints(
+        pairs,
+        offset=args.offset,
+        keep_hold=args.keep_hold,
+        translate_filter=_axis_filter(args.translate),
+        rotate_filter=_axis_filter(args.rotate),
+    )
+
+
+def build_native(pairs: Sequence[Tuple[str, List[str]]], args: argparse.Namespace) -> None:
+    """
+    Constrain the rig with native parentConstraint nodes.
+
+    Args:
+        pairs (Sequence[Tuple[str, List[str]]]): The (control, drivers) pairs.
+        args (argparse.Namespace): The rig options.
+    """
+    for control, drivers in pairs:
+        cmds.parentConstraint(
+            drivers,
+            control,
+            maintainOffset=args.offset,
+            skipTranslate=_skip(args.translate),
+            skipRotate=_skip(args.rotate),
+        )
+
+
+def measure(kind: str, args: argparse.Namespace) -> dict:
+    """
+    Build the rig with a constraint kind and measure its playback rate in every mode.
+
+    Args:
+        kind (str): "atlas" or "native".
+        args (argparse.Namespace): The rig options.
+
+    Returns:
+        dict: The build time, node count and playback rate by mode.
+    """
+    pairs = common.make_rig(args.count, depth=args.depth, drivers=args.drivers)
+    results = {}
+    with common.timed(results, "build_s"):
+        (build_atlas if kind == "atlas" else build_native)(pairs, args)
+    results["nodes"] = common.node_count(MATRIX_NODE_TYPES)
+
+    controls = [control for control, _ in pairs]
+    for mode in args.modes:
+        with common.evaluation_mode(mode):
+            # First pass builds the evaluation graph, and fills the cache in cached mode
+            common.playback(controls, end=args.frames)
+            results[f"fps_{mode}"] = common.playback(controls, end=args.frames)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the playback throughput of constrained rigs.")
+    parser.add_argument("--count", type=int, default=500, help="Number of controls.")
+    parser.add_argument("--depth", type=int, default=1, help="Controls per nested chain.")
+    parser.add_argument("--drivers", type=int, default=1, help="Drivers per control.")
+    parser.add_argument("--translate", default="xyz", help="Constrained translate axes.")
+    parser.add_argument("--rotate", default="xyz", help="Constrained rotate axes.")
+    parser.add_argument("--offset", action="store_true", help="Maintain the offsets.")
+    parser.add_argument("--keep-hold", action="store_true", help="Keep the offsets in holdMatrix nodes.")
+    parser.add_argument("--frames", type=int, default=100, help="Number of frames played.")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Evaluation modes.")
+    parser.add_argument("--output", help="JSON file receiving the results.")
+    args = parser.parse_args(argv)
+
+    rows = common.run_variants([
+        ("atlas", lambda: measure("atlas", args)),
+        ("native", lambda: measure("native", args)),
+    ])
+    columns = ["build_s", "nodes"] + [f"fps_{mode}" for mode in args.modes]
+    common.report(f"Playback, {args.count} controls, depth {args.depth}, {args.drivers} drivers", rows, columns)
+
+    common.write_json(args.output, {"options": vars(args), "results": dict(rows)})
+
+
+if __name__ == "__main__":
+    try:
+        import maya.standalone
+        maya.standalone.initialize()
+    except ImportError:
+        pass
+    main()
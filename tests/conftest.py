@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+""" Shared test setup, the Maya stub is used when Maya is not installed """
+
+# ---------- IMPORT ----------
+
+import os
+import sys
+
+import pytest
+
+try:
+    import maya.cmds  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "maya_stub"))
+    for module in [name for name in sys.modules if name == "maya" or name.startswith("maya.")]:
+        del sys.modules[module]
+
+
+# ---------- FIXTURES ----------
+
+
+@pytest.fixture
+def scene():
+    """Start from an empty scene and give the cmds module."""
+    import maya.cmds as cmds
+
+    cmds.file(new=True, force=True)
+    return cmds
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+""" In-memory stand-in for the Maya modules used by the tests, loaded when Maya is missing """
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+""" In-memory stand-in for maya.api.OpenMaya, reading the scene of the maya.cmds stub """
+
+# ---------- IMPORT ----------
+
+import math
+from typing import List
+
+from maya import cmds
+from atlas_matrix.core.utils import matrix_math
+
+
+# ---------- MATRIX ----------
+
+
+class MMatrix:
+    def __init__(self, values=None) -> None:
+        self._values = [float(value) for value in (matrix_math.IDENTITY if values is None else values)]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return 16
+
+    def __getitem__(self, i):
+        return self._values[i]
+
+    def __mul__(self, other: "MMatrix") -> "MMatrix":
+        return MMatrix(matrix_math.mult(self._values, list(other)))
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def inverse(self) -> "MMatrix":
+        return MMatrix(matrix_math.inverse(self._values))
+
+    def isEquivalent(self, other: "MMatrix", tolerance: float = 1e-10) -> bool:
+        return matrix_math.max_delta(self._values, list(other)) <= tolerance
+
+
+MMatrix.kIdentity = MMatrix()
+
+
+class MVector:
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        self.x, self.y, self.z = x, y, z
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+
+class MSpace:
+    kTransform = 1
+    kWorld = 4
+
+
+class MEulerRotation:
+    kXYZ, kYZX, kZXY, kXZY, kYXZ, kZYX = range(6)
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, order: int = 0) -> None:
+        self.x, self.y, self.z, self.order = x, y, z, order
+
+    def asMatrix(self) -> MMatrix:
+        if self.order != self.kXYZ and any((self.x, self.y, self.z)):
+            raise NotImplementedError("Only the XYZ rotate order is supported")
+        cx, sx = math.cos(self.x), math.sin(self.x)
+        cy, sy = math.cos(self.y), math.sin(self.y)
+        cz, sz = math.cos(self.z), math.sin(self.z)
+        rx = MMatrix([1, 0, 0, 0, 0, cx, sx, 0, 0, -sx, cx, 0, 0, 0, 0, 1])
+        ry = MMatrix([cy, 0, -sy, 0, 0, 1, 0, 0, sy, 0, cy, 0, 0, 0, 0, 1])
+        rz = MMatrix([cz, sz, 0, 0, -sz, cz, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1])
+        return rx * ry * rz
+
+
+class MTransformationMatrix:
+    def __init__(self) -> None:
+        self._scale = MVector(1.0, 1.0, 1.0)
+        self._rotation = MEulerRotation()
+        self._translation = MVector()
+
+    def setScale(self, scale: MVector, space: int) -> "MTransformationMatrix":
+        self._scale = scale
+        return self
+
+    def setRotation(self, rotation: MEulerRotation) -> "MTransformationMatrix":
+        self._rotation = rotation
+        return self
+
+    def setTranslation(self, translation: MVector, space: int) -> "MTransformationMatrix":
+        self._translation = translation
+        return self
+
+    def asMatrix(self) -> MMatrix:
+        sx, sy, sz = self._scale
+        matrix = MMatrix([sx, 0, 0, 0, 0, sy, 0, 0, 0, 0, sz, 0, 0, 0, 0, 1]) * self._rotation.asMatrix()
+        values = list(matrix)
+        values[12:15] = list(self._translation)
+        return MMatrix(values)
+
+
+# ---------- DEPENDENCY NODES ----------
+
+
+class MObject:
+    def __init__(self, node=None) -> None:
+        self._node = node
+
+    def isNull(self) -> bool:
+        return self._node is None
+
+
+class MObjectHandle:
+    def __init__(self, obj: MObject) -> None:
+        self._obj = obj
+
+    def isValid(self) -> bool:
+        return self._obj._node is not None and self._obj._node.alive
+
+    def isAlive(self) -> bool:
+        return self.isValid()
+
+    def object(self) -> MObject:
+        return self._obj
+
+
+class MFnDependencyNode:
+    def __init__(self, obj: MObject) -> None:
+        self._node = obj._node
+
+    @property
+    def typeName(self) -> str:
+        return self._node.type
+
+    def name(self) -> str:
+        return self._node.name
+
+
+class MDagPath:
+    def __init__(self, node) -> None:
+        self._node = node
+
+    def fullPathName(self) -> str:
+        return self._node.path
+
+    def partialPathName(self) -> str:
+        return self._node.name
+
+    def inclusiveMatrix(self) -> MMatrix:
+        return MMatrix(cmds.getAttr(f"{self._node.name}.worldMatrix[0]"))
+
+
+class MPlug:
+    def __init__(self, node, attribute: str) -> None:
+        self._node = node
+        self._attribute = attribute
+
+    @property
+    def isValid(self) -> bool:
+        return self._node.alive
+
+    def name(self) -> str:
+        return f"{self._node.name}.{self._attribute}"
+
+
+class MSelectionList:
+    def __init__(self) -> None:
+        self._items: List[tuple] = []
+
+    def add(self, name: str) -> "MSelectionList":
+        name = str(name)
+        if not cmds.objExists(name):
+            raise RuntimeError(f"(kInvalidParameter): Object does not exist: {name}")
+        if "." in name:
+            node, attribute = cmds._split(name)
+        else:
+            node, attribute = cmds._node(name), None
+        if (node, attribute) not in self._items:
+            self._items.append((node, attribute))
+        return self
+
+    def length(self) -> int:
+        return len(self._items)
+
+    def getDependNode(self, i: int) -> MObject:
+        return MObject(self._items[i][0])
+
+    def getDagPath(self, i: int) -> MDagPath:
+        return MDagPath(self._items[i][0])
+
+    def getPlug(self, i: int) -> MPlug:
+        return MPlug(*self._items[i])
+
+
+# ---------- DAG ITERATION ----------
+
+
+class MFn:
+    kTransform = "transform"
+
+
+class MItDag:
+    kDepthFirst = 0
+
+    def __init__(self, traversal: int = 0, filter_type: str = MFn.kTransform) -> None:
+        self._items = []
+        roots = [node for node in cmds._nodes.values() if node.is_dag and node.parent is None]
+        stack = [(node, 0) for node in reversed(roots)]
+        while stack:
+            node, depth = stack.pop()
+            if node.inherits(filter_type):
+                self._items.append((node, depth))
+            children = [child for child in cmds._nodes.values() if child.parent is node]
+            stack.extend((child, depth + 1) for child in reversed(children))
+        self._position = 0
+
+    def isDone(self) -> bool:
+        return self._position >= len(self._items)
+
+    def next(self) -> None:
+        self._position += 1
+
+    def depth(self) -> int:
+        return self._items[self._position][1]
+
+    def getPath(self) -> MDagPath:
+        return MDagPath(self._items[self._position][0])
+
+
+# ---------- PLACEHOLDERS ----------
+
+
+def __getattr__(name: str):
+    # Types only used in annotations or by code paths the tests do not reach
+    placeholder = type(name, (), {})
+    globals()[name] = placeholder
+    return placeholder
@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+""" In-memory stand-in for maya.cmds
+
+Nodes, attributes, DAG parenting and connections are recorded, nothing is
+evaluated: matrices read back their stored value or the identity. Only the
+flags used by atlas_matrix are supported, anything else raises so a test never
+passes on a silently ignored flag.
+"""
+
+# ---------- IMPORT ----------
+
+import fnmatch
+import re
+from typing import Dict, List, Optional
+
+
+# ---------- CONSTANTS ----------
+
+
+IDENTITY = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+DAG_TYPES = {"transform": None, "joint": "transform"}
+
+COMMON_ATTRIBUTES = {"message", "nodeState", "frozen", "caching"}
+
+COMPOUNDS = {
+    "translate": ("translateX", "translateY", "translateZ"),
+    "rotate": ("rotateX", "rotateY", "rotateZ"),
+    "scale": ("scaleX", "scaleY", "scaleZ"),
+    "shear": ("shearXY", "shearXZ", "shearYZ"),
+    "jointOrient": ("jointOrientX", "jointOrientY", "jointOrientZ"),
+}
+
+SHORT_NAMES = {
+    "t": "translate", "tx": "translateX", "ty": "translateY", "tz": "translateZ",
+    "r": "rotate", "rx": "rotateX", "ry": "rotateY", "rz": "rotateZ",
+    "s": "scale", "sx": "scaleX", "sy": "scaleY", "sz": "scaleZ",
+    "wm": "worldMatrix", "wim": "worldInverseMatrix", "opm": "offsetParentMatrix", "m": "matrix",
+}
+
+TRANSFORM_ATTRIBUTES = {
+    "matrix", "worldMatrix", "worldInverseMatrix", "parentMatrix", "parentInverseMatrix",
+    "inverseMatrix", "offsetParentMatrix", "rotateOrder", "visibility",
+}.union(COMPOUNDS, *(children for name, children in COMPOUNDS.items() if name != "jointOrient"))
+
+JOINT_ATTRIBUTES = TRANSFORM_ATTRIBUTES | {"jointOrient", *COMPOUNDS["jointOrient"]}
+
+INDEX = re.compile(r"\[(\d+)(?::(\d+))?\]$")
+
+
+# ---------- SCENE ----------
+
+
+class _Node:
+    def __init__(self, name: str, node_type: str, parent: Optional["_Node"] = None) -> None:
+        self.name = name
+        self.type = node_type
+        self.parent = parent
+        self.values: Dict[str, object] = {}
+        self.locked: Dict[str, bool] = {}
+        self.user: Dict[str, dict] = {}
+        self.alive = True
+
+    @property
+    def is_dag(self) -> bool:
+        return self.type in DAG_TYPES
+
+    def inherits(self, node_type: str) -> bool:
+        current = self.type
+        while current:
+            if current == node_type:
+                return True
+            current = DAG_TYPES.get(current)
+        return False
+
+    @property
+    def path(self) -> str:
+        names, node = [], self
+        while node:
+            names.append(node.name)
+            node = node.parent
+        return "|" + "|".join(reversed(names))
+
+
+_nodes: Dict[str, _Node] = {}
+_connections: List[list] = []
+_selection: List[str] = []
+warnings: List[str] = []
+undo_depth = 0
+
+
+def _reset() -> None:
+    global undo_depth
+    _nodes.clear()
+    del _connections[:]
+    del _selection[:]
+    del warnings[:]
+    undo_depth = 0
+
+
+def _listify(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [item for entry in value for item in _listify(entry)]
+
+
+def _node(name: str) -> Optional[_Node]:
+    return _nodes.get(str(name).rsplit("|", 1)[-1])
+
+
+def _require(name: str) -> _Node:
+    node = _node(name)
+    if node is None:
+        raise ValueError(f"No object matches name: {name}")
+    return node
+
+
+def _split(plug: str):
+    name, _, attribute = str(plug).partition(".")
+    node = _require(name)
+    parts = attribute.split(".")
+    head = parts[0]
+    index = INDEX.search(head)
+    root = head[:index.start()] if index else head
+    parts[0] = SHORT_NAMES.get(root, root) + (head[index.start():] if index else "")
+    return node, ".".join(parts)
+
+
+def _root(attribute: str) -> str:
+    return attribute.split(".")[0].split("[")[0]
+
+
+def _leaf(attribute: str) -> str:
+    return attribute.rsplit(".", 1)[-1].split("[")[0]
+
+
+def _has_attribute(node: _Node, attribute: str) -> bool:
+    root = _root(attribute)
+    root = SHORT_NAMES.get(root, root)
+    if root in COMMON_ATTRIBUTES or root in node.user:
+        return True
+    if node.inherits("joint"):
+        return root in JOINT_ATTRIBUTES
+    if node.inherits("transform"):
+        return root in TRANSFORM_ATTRIBUTES
+    return True
+
+
+def _is_matrix(node: _Node, attribute: str) -> bool:
+    leaf = _leaf(attribute)
+    if leaf in node.user:
+        return node.user[leaf]["type"] == "matrix"
+    return leaf.lower().endswith("matrix") or leaf in ("matrixIn", "matrixSum")
+
+
+def _default(node: _Node, attribute: str):
+    leaf = _leaf(attribute)
+    if leaf in node.user:
+        return node.user[leaf].get("default", 0.0)
+    if _is_matrix(node, attribute):
+        return list(IDENTITY)
+    if leaf.startswith("scale"):
+        return 1.0
+    return 0.0
+
+
+def _plug_name(node: _Node, attribute: str) -> str:
+    return f"{node.name}.{attribute}"
+
+
+def _matches(attribute: str, query: str) -> bool:
+    return attribute == query or attribute.startswith(query + "[") or attribute.startswith(query + ".")
+
+
+def _unique_name(name: str) -> str:
+    if name not in _nodes:
+        return name
+    base = name.rstrip("0123456789")
+    count = 1
+    while f"{base}{count}" in _nodes:
+        count += 1
+    return f"{base}{count}"
+
+
+def _elements(attribute: str) -> List[str]:
+    match = INDEX.search(attribute)
+    if not match or match.group(2) is None:
+        return [attribute]
+    base = attribute[:match.start()]
+    return [f"{base}[{i}]" for i in range(int(match.group(1)), int(match.group(2)) + 1)]
+
+
+# ---------- SCENE COMMANDS ----------
+
+
+def file(*args, new: bool = False, force: bool = False, **kwargs):
+    if not new or args or kwargs:
+        raise NotImplementedError("Only file(new=True) is supported")
+    _reset()
+
+
+def createNode(node_type: str, name: Optional[str] = None, parent: Optional[str] = None,
+               skipSelect: bool = False, **kwargs) -> str:
+    if kwargs:
+        raise NotImplementedError(f"Unsupported createNode flags: {sorted(kwargs)}")
+    name = _unique_name(name or f"{node_type}1")
+    parent_node = _require(parent) if parent else None
+    _nodes[name] = _Node(name, node_type, parent_node)
+    return name
+
+
+def objExists(name: str) -> bool:
+    name = str(name)
+    node = _node(name.partition(".")[0])
+    if node is None:
+        return False
+    if "." not in name:
+        return True
+    return _has_attribute(node, name.partition(".")[2])
+
+
+def nodeType(name: str, **kwargs) -> str:
+    return _require(name).type
+
+
+def objectType(name: str, **kwargs) -> str:
+    return _require(name).type
+
+
+def rename(old: str, new: str) -> str:
+    node = _require(old)
+    if new in _nodes:
+        new = _unique_name(new)
+    del _nodes[node.name]
+    node.name = new
+    _nodes[new] = node
+    return new
+
+
+def delete(*names, **kwargs) -> None:
+    doomed = [_require(name) for name in _listify(names)]
+    queue = list(doomed)
+    while queue:
+        node = queue.pop()
+        children = [child for child in _nodes.values() if child.parent is node]
+        doomed.extend(children)
+        queue.extend(children)
+    for node in doomed:
+        if node.alive:
+            node.alive = False
+            del _nodes[node.name]
+    _connections[:] = [c for c in _connections if c[0].alive and c[2].alive]
+
+
+def select(*names, clear: bool = False, **kwargs) -> None:
+    del _selection[:]
+    if not clear:
+        _selection.extend(_require(name).name for name in _listify(names))
+
+
+def ls(*names, long: bool = False, selection: bool = False, type=None,
+       dependencyNodes: bool = False, **kwargs) -> List[str]:
+    if kwargs:
+        raise NotImplementedError(f"Unsupported ls flags: {sorted(kwargs)}")
+    if selection:
+        found = [_nodes[name] for name in _selection if name in _nodes]
+    elif names:
+        found = []
+        for pattern in _listify(names):
+            short = pattern.rsplit("|", 1)[-1]
+            if any(char in short for char in "*?"):
+                found.extend(node for node in _nodes.values() if fnmatch.fnmatchcase(node.name, short))
+            elif short in _nodes:
+                found.append(_nodes[short])
+    else:
+        found = list(_nodes.values())
+    if type:
+        types = _listify(type)
+        found = [node for node in found if any(node.inherits(node_type) for node_type in types)]
+    return [node.path if long and node.is_dag else node.name for node in found]
+
+
+def listRelatives(*names, parent: bool = False, allParents: bool = False, children: bool = False,
+                  allDescendents: bool = False, fullPath: bool = False, type=None, **kwargs):
+    if kwargs:
+        raise NotImplementedError(f"Unsupported listRelatives flags: {sorted(kwargs)}")
+    found = []
+    for node in map(_require, _listify(names)):
+        if parent or allParents:
+            found.extend([node.parent] if node.parent else [])
+        elif children or allDescendents:
+            queue = [node]
+            while queue:
+                current = queue.pop(0)
+                direct = [child for child in _nodes.values() if child.parent is current]
+                found.extend(direct)
+                if allDescendents:
+                    queue.extend(direct)
+    if type:
+        found = [node for node in found if node.inherits(type)]
+    return [node.path if fullPath else node.name for node in found] or None
+
+
+# ---------- ATTRIBUTE COMMANDS ----------
+
+
+def attributeQuery(attribute: str, node: str, exists: bool = False, **kwargs) -> bool:
+    if not exists or kwargs:
+        raise NotImplementedError("Only attributeQuery(exists=True) is supported")
+    found = _node(node)
+    return bool(found) and _has_attribute(found, attribute)
+
+
+def addAttr(node: str, longName: Optional[str] = None, ln: Optional[str] = None, shortName=None, sn=None,
+            attributeType=None, at=None, dataType=None, dt=None, multi: bool = False, m: bool = False,
+            parent=None, p=None, defaultValue=None, dv=None, **kwargs) -> None:
+    target = _require(node)
+    name = longName or ln
+    if name in target.user:
+        raise RuntimeError(f"Found more than one attribute named {name} on {target.name}")
+    default = defaultValue if defaultValue is not None else dv
+    target.user[name] = {
+        "type": attributeType or at or dataType or dt,
+        "multi": multi or m,
+        "parent": parent or p,
+        "default": 0.0 if default is None else default,
+    }
+
+
+def deleteAttr(plug: str = None, attribute: Optional[str] = None, **kwargs) -> None:
+    if attribute:
+        node, name = _require(plug), attribute
+    else:
+        node, name = _split(plug)
+    doomed = {name} | {child for child, info in node.user.items() if info["parent"] == name}
+    for attr in doomed:
+        node.user.pop(attr, None)
+    node.values = {key: value for key, value in node.values.items() if _root(key) not in doomed}
+    _connections[:] = [c for c in _connections
+                       if not ((c[0] is node and _root(c[1]) in doomed) or (c[2] is node and _root(c[3]) in doomed))]
+
+
+def listAttr(node: str, userDefined: bool = False, **kwargs) -> Optional[List[str]]:
+    if not userDefined or kwargs:
+        raise NotImplementedError("Only listAttr(userDefined=True) is supported")
+    return list(_require(node).user) or None
+
+
+def getAttr(plug: str, type: bool = False, multiIndices: bool = False, lock: bool = False, **kwargs):
+    if kwargs:
+        raise NotImplementedError(f"Unsupported getAttr flags: {sorted(kwargs)}")
+    node, attribute = _split(plug)
+    if lock:
+        return node.locked.get(attribute, False)
+    if multiIndices:
+        indices = set()
+        pattern = re.compile(re.escape(attribute) + r"\[(\d+)\]")
+        keys = list(node.values) + [c[3] for c in _connections if c[2] is node] + [c[1] for c in _connections if c[0] is node]
+        for key in keys:
+            match = pattern.match(key)
+            if match:
+                indices.add(int(match.group(1)))
+        return sorted(indices) or None
+    if attribute in COMPOUNDS:
+        if type:
+            return "double3"
+        return [tuple(getAttr(_plug_name(node, child)) for child in COMPOUNDS[attribute])]
+    if type:
+        return "matrix" if _is_matrix(node, attribute) else "double"
+    value = node.values.get(attribute)
+    if value is None:
+        value = _default(node, attribute)
+    if isinstance(value, tuple):
+        return [value]
+    return list(value) if isinstance(value, list) else value
+
+
+def setAttr(plug: str, *values, type: Optional[str] = None, lock=None, keyable=None, channelBox=None,
+            l=None, k=None, cb=None, **kwargs) -> None:
+    if kwargs:
+        raise NotImplementedError(f"Unsupported setAttr flags: {sorted(kwargs)}")
+    node, attribute = _split(plug)
+    if lock is not None or l is not None:
+        node.locked[attribute] = bool(lock if lock is not None else l)
+    if not values:
+        return
+    if attribute in COMPOUNDS:
+        for child, value in zip(COMPOUNDS[attribute], values):
+            node.values[child] = float(value)
+        return
+    if type == "matrix" or (len(values) == 16 and _is_matrix(node, attribute)):
+        node.values[attribute] = [float(value) for value in values]
+        return
+    elements = _elements(attribute)
+    if len(elements) == 1 and len(values) > 1:
+        node.values[attribute] = tuple(float(value) for value in values)
+        return
+    for element, value in zip(elements, values):
+        node.values[element] = value
+
+
+def removeMultiInstance(plug: str, b: bool = False, **kwargs) -> None:
+    node, attribute = _split(plug)
+    node.values = {key: value for key, value in node.values.items() if not _matches(key, attribute)}
+    _connections[:] = [c for c in _connections
+                       if not ((c[0] is node and _matches(c[1], attribute)) or (c[2] is node and _matches(c[3], attribute)))]
+
+
+# ---------- CONNECTION COMMANDS ----------
+
+
+def connectAttr(source: str, destination: str, force: bool = False, nextAvailable: bool = False, **kwargs) -> None:
+    if kwargs:
+        raise NotImplementedError(f"Unsupported connectAttr flags: {sorted(kwargs)}")
+    source_node, source_attribute = _split(source)
+    destination_node, destination_attribute = _split(destination)
+    for node, attribute in ((source_node, source_attribute), (destination_node, destination_attribute)):
+        if not _has_attribute(node, attribute):
+            raise RuntimeError(f"The attribute '{_plug_name(node, attribute)}' does not exist")
+    if nextAvailable:
+        used = getAttr(_plug_name(destination_node, destination_attribute), multiIndices=True) or []
+        destination_attribute = f"{destination_attribute}[{max(used) + 1 if used else 0}]"
+
+    existing = [c for c in _connections if c[2] is destination_node and c[3] == destination_attribute]
+    if existing:
+        if existing[0][0] is source_node and existing[0][1] == source_attribute:
+            raise RuntimeError(f"{source} is already connected to {destination}")
+        if not force:
+            raise RuntimeError(f"{destination} already has an incoming connection")
+        _connections.remove(existing[0])
+    _connections.append([source_node, source_attribute, destination_node, destination_attribute])
+
+
+def disconnectAttr(source: str, destination: str, **kwargs) -> None:
+    source_node, source_attribute = _split(source)
+    destination_node, destination_attribute = _split(destination)
+    for connection in _connections:
+        if connection == [source_node, source_attribute, destination_node, destination_attribute]:
+            _connections.remove(connection)
+            return
+    raise RuntimeError(f"No connection from {source} to {destination}")
+
+
+def listConnections(*names, source: bool = True, destination: bool = True, plugs: bool = False,
+                    connections: bool = False, type: Optional[str] = None, skipConversionNodes: bool = False,
+                    **kwargs) -> List[str]:
+    if kwargs:
+        raise NotImplementedError(f"Unsupported listConnections flags: {sorted(kwargs)}")
+    found = []
+    for name in _listify(names):
+        if "." in name:
+            node, attribute = _split(name)
+        else:
+            node, attribute = _require(name), None
+        for src, src_attr, dst, dst_attr in list(_connections):
+            if source and dst is node and (attribute is None or _matches(dst_attr, attribute)):
+                local, other = _plug_name(dst, dst_attr), (src, src_attr)
+            elif destination and src is node and (attribute is None or _matches(src_attr, attribute)):
+                local, other = _plug_name(src, src_attr), (dst, dst_attr)
+            else:
+                continue
+            if type and not other[0].inherits(type) and not (type == "animCurve" and other[0].type.startswith("animCurve")):
+                continue
+            if connections:
+                found.append(local)
+            found.append(_plug_name(*other) if plugs else other[0].name)
+    return found
+
+
+def connectionInfo(plug: str, isDestination: bool = False, sourceFromDestination: bool = False, **kwargs):
+    node, attribute = _split(plug)
+    sources = [_plug_name(c[0], c[1]) for c in _connections if c[2] is node and c[3] == attribute]
+    if isDestination:
+        return bool(sources)
+    if sourceFromDestination:
+        return sources[0] if sources else ""
+    raise NotImplementedError(f"Unsupported connectionInfo flags: {sorted(kwargs)}")
+
+
+def listHistory(*names, pruneDagObjects: bool = False, **kwargs) -> List[str]:
+    if kwargs:
+        raise NotImplementedError(f"Unsupported listHistory flags: {sorted(kwargs)}")
+    start = [_require(name) for name in _listify(names)]
+    found, queue = [], list(start)
+    while queue:
+        node = queue.pop(0)
+        if node in found:
+            continue
+        found.append(node)
+        queue.extend(c[0] for c in _connections if c[2] is node)
+    if pruneDagObjects:
+        found = [node for node in found if node in start or not node.is_dag]
+    return [node.name for node in found]
+
+
+# ---------- MISC COMMANDS ----------
+
+
+def undoInfo(openChunk: bool = False, closeChunk: bool = False, cancelChunk: bool = False,
+             chunkName: Optional[str] = None, **kwargs):
+    global undo_depth
+    if openChunk:
+        undo_depth += 1
+    if closeChunk:
+        undo_depth -= 1
+    return True
+
+
+def warning(message: str) -> None:
+    warnings.append(message)
+
+
+def currentTime(*args, query: bool = False, **kwargs):
+    return 1.0
+
+
+def keyframe(*args, **kwargs):
+    return None
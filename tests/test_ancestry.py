@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+""" Tests of the hierarchy cycle detection against the Maya stub """
+
+# ---------- IMPORT ----------
+
+from atlas_matrix.core.parent_con import ParentCon
+from atlas_matrix.core.utils import ancestry as anc
+from atlas_matrix.core.utils import network as net
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _rig(cmds):
+    for name in ("a", "b", "c"):
+        cmds.createNode("transform", name=name)
+    cmds.createNode("transform", name="a_child", parent="a")
+    cmds.createNode("transform", name="b_child", parent="b")
+    # a follows b
+    ParentCon("a", ["b"]).mount_system()
+
+
+def _reasons(pairs, ancestry):
+    return [(conflict.driven, conflict.driver, conflict.reason) for conflict in anc.check_pairs(pairs, ancestry)]
+
+
+# ---------- TESTS ----------
+
+
+def test_hierarchy_conflicts(scene):
+    _rig(scene)
+    ancestry = anc.AncestryIndex.from_scene()
+
+    assert ancestry.is_ancestor("a", "a_child")
+    assert not ancestry.is_ancestor("a_child", "a")
+    assert _reasons([("c", ["c"]), ("a", ["a_child"])], ancestry) == [
+        ("c", "c", "object constrained to itself"),
+        ("a", "a_child", "driver is below the driven"),
+    ]
+
+
+def test_cycle_through_scene_constraint(scene):
+    _rig(scene)
+
+    # a_child follows a, which follows b
+    for ancestry in (anc.AncestryIndex.from_scene(), anc.AncestryIndex()):
+        assert _reasons([("b", ["a_child"])], ancestry) == [
+            ("b", "a_child", "driver depends on the driven through other constraints"),
+        ]
+        assert _reasons([("c", ["a_child"])], ancestry) == []
+
+
+def test_cycle_through_batch(scene):
+    _rig(scene)
+    ancestry = anc.AncestryIndex.from_scene()
+
+    conflicts = _reasons([("c", ["b_child"]), ("b", ["a_child"])], ancestry)
+    assert ("b", "a_child", "driver depends on the driven through other constraints") in conflicts
+    # c -> a_child -> a -> b -> c closes through the batch and the scene constraint
+    assert _reasons([("c", ["a_child"]), ("b", ["c"])], ancestry) == [
+        ("c", "a_child", "driver depends on the driven through other constraints"),
+        ("b", "c", "driver depends on the driven through other constraints"),
+    ]
+
+
+def test_batch_replaces_scene_constraint(scene):
+    _rig(scene)
+    ancestry = anc.AncestryIndex.from_scene()
+
+    # a is moved to c, a_child no longer depends on b
+    assert _reasons([("a", ["c"]), ("b", ["a_child"])], ancestry) == []
+    assert _reasons([("a", ["c"]), ("c", ["b_child"]), ("b", ["a_child"])], ancestry) != []
+
+
+def test_built_index_reads_networks_once(scene, monkeypatch):
+    _rig(scene)
+    ancestry = anc.AncestryIndex.from_scene()
+
+    calls = []
+    get_network = net.get_network
+    monkeypatch.setattr(net, "get_network", lambda driven: calls.append(driven) or get_network(driven))
+    for _ in range(3):
+        anc.check_pairs([("b", ["a_child"]), ("c", ["a_child"])], ancestry)
+
+    assert calls == []
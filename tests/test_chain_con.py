@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+""" Tests of the ChainCon builder against the Maya stub """
+
+# ---------- IMPORT ----------
+
+from atlas_matrix.core import index
+from atlas_matrix.core.chain_con import chain_constraint
+from atlas_matrix.core.utils import naming
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _chain(cmds, prefix, parent=None):
+    names = []
+    for i in range(1, 4):
+        names.append(cmds.createNode("joint", name=f"{prefix}_0{i}", parent=names[-1] if names else parent))
+    return names
+
+
+def _mult(driven, driver):
+    return naming.matrix_node_name("multMatrix", driven, "pconstrainedby", driver)
+
+
+# ---------- TESTS ----------
+
+
+def test_root_link_uses_world_space_and_children_local_space(scene):
+    scene.createNode("transform", name="rig")
+    bind = _chain(scene, "bind", parent="rig")
+    fk = _chain(scene, "fk")
+
+    chain_constraint(list(reversed(bind)), list(reversed(fk)))
+
+    # Root link goes through the regular ParentCon network
+    root = _mult("bind_01", "fk_01")
+    assert scene.listConnections(f"{root}.matrixIn[1]", source=True, plugs=True) == ["fk_01.worldMatrix[0]"]
+    assert scene.listConnections(f"{root}.matrixIn[2]", source=True, plugs=True) == ["rig.worldInverseMatrix[0]"]
+
+    # Corresponding parents, the driver local matrix is read
+    for driven, driver in zip(bind[1:], fk[1:]):
+        mult = _mult(driven, driver)
+        assert scene.listConnections(f"{mult}.matrixIn[1]", source=True, plugs=True) == [f"{driver}.matrix"]
+        assert scene.listConnections(f"{driven}.offsetParentMatrix", source=True, destination=False) == [mult]
+
+    assert sorted(index.list_indexed()) == bind
+    assert scene.undo_depth == 0
+
+
+def test_chain_at_world_root_uses_identity_parent(scene):
+    bind = _chain(scene, "bind")
+    fk = _chain(scene, "fk")
+
+    con = chain_constraint(bind, fk)
+
+    identity = naming.identity_node_name("bind_01")
+    assert scene.listConnections(f"{_mult('bind_01', 'fk_01')}.matrixIn[2]", source=True) == [identity]
+    assert (con.driven, con.drivers) == ("bind_01", ["fk_01"])
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+""" Tests of the native parentConstraint conversion against the Maya stub """
+
+# ---------- IMPORT ----------
+
+import pytest
+
+from atlas_matrix.core import index
+from atlas_matrix.core.convert import convert
+from atlas_matrix.core.parent_con import ParentCon
+
+
+# ---------- CONSTANTS ----------
+
+
+CONSTRAINT = "ctrl_parentConstraint1"
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _native(cmds):
+    cmds.createNode("transform", name="space_a")
+    cmds.createNode("transform", name="ctrl")
+    cmds.setAttr("ctrl.scale", 2.0, 2.0, 2.0)
+    cmds.createNode("parentConstraint", name=CONSTRAINT)
+    cmds.addAttr(CONSTRAINT, longName="space_aW0", attributeType="double", defaultValue=1.0)
+    cmds.connectAttr("space_a.worldMatrix[0]", f"{CONSTRAINT}.target[0].targetParentMatrix")
+    cmds.connectAttr(f"{CONSTRAINT}.space_aW0", f"{CONSTRAINT}.target[0].targetWeight")
+    cmds.setAttr(f"{CONSTRAINT}.target[0].targetWeight", 1.0)
+    cmds.setAttr(f"{CONSTRAINT}.target[0].targetOffsetTranslate", 0.0, 0.0, 0.0)
+    cmds.setAttr(f"{CONSTRAINT}.target[0].targetOffsetRotate", 0.0, 0.0, 0.0)
+    cmds.setAttr(f"{CONSTRAINT}.constraintRotateOrder", 0)
+    for channel in ("Translate", "Rotate"):
+        for axis in "XYZ":
+            cmds.connectAttr(f"{CONSTRAINT}.constraint{channel}{axis}", f"ctrl.{channel.lower()}{axis}")
+
+
+def _native_links(cmds):
+    return cmds.listConnections(CONSTRAINT, source=False, destination=True, plugs=True)
+
+
+# ---------- TESTS ----------
+
+
+def test_native_constraint_is_replaced(scene):
+    _native(scene)
+
+    report = convert(measure=False)
+
+    assert report.converted == [CONSTRAINT]
+    assert not scene.objExists(CONSTRAINT)
+    assert scene.listConnections("ctrl.offsetParentMatrix", source=True, destination=False)
+    assert not scene.listConnections("ctrl.translateX", source=True, destination=False)
+    assert index.list_indexed() == ["ctrl"]
+
+
+def test_failed_build_restores_the_native_constraint(scene, monkeypatch):
+    _native(scene)
+    links = _native_links(scene)
+    nodes = scene.ls()
+
+    def mount_then_fail(builder):
+        builder.preserve_initial_transform()
+        builder.con_mult_matrix(builder.drivers[0])
+        scene.setAttr("ctrl.scale", 1.0, 1.0, 1.0)
+        index.register(builder.driven)
+        raise RuntimeError("build failed")
+
+    monkeypatch.setattr(ParentCon, "mount_system", mount_then_fail)
+    with pytest.raises(RuntimeError):
+        convert(measure=False)
+
+    assert scene.ls() == nodes
+    assert _native_links(scene) == links
+    assert not scene.attributeQuery("initialTransform", node="ctrl", exists=True)
+    assert scene.getAttr("ctrl.scale") == [(2.0, 2.0, 2.0)]
+    assert index.list_indexed() == []
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+""" Tests of the offline constraint evaluation """
+
+# ---------- IMPORT ----------
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from atlas_matrix.offline.evaluate import (
+    ConstraintDesc,
+    _blend,
+    _to_quaternions,
+    _to_rotations,
+    evaluate,
+)
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _rotation_z(angle):
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def _random_rotations(count, seed=0):
+    # Orthonormalized random matrices, determinant forced to +1
+    q, r = np.linalg.qr(np.random.default_rng(seed).normal(size=(count, 3, 3)))
+    q = q * np.sign(np.diagonal(r, axis1=1, axis2=2))[:, None, :]
+    q[np.linalg.det(q) < 0, :, 0] *= -1.0
+    return q
+
+
+def _transforms(rotations, translations):
+    out = np.zeros((len(rotations), 4, 4))
+    out[:, :3, :3] = rotations
+    out[:, 3, :3] = translations
+    out[:, 3, 3] = 1.0
+    return out
+
+
+# ---------- TESTS ----------
+
+
+def test_quaternion_round_trip():
+    # Half turns exercise the candidates other than the trace one
+    half_turns = np.array([np.diag([1.0, -1.0, -1.0]), np.diag([-1.0, 1.0, -1.0]), np.diag([-1.0, -1.0, 1.0])])
+    rotations = np.concatenate([_random_rotations(64), half_turns])
+
+    quaternions = _to_quaternions(rotations)
+
+    assert np.allclose(np.linalg.norm(quaternions, axis=1), 1.0)
+    assert np.allclose(_to_rotations(quaternions), rotations)
+
+
+def test_blend_ends_return_inputs():
+    a = _transforms(_random_rotations(4, seed=1), np.ones((4, 3)))
+    b = _transforms(_random_rotations(4, seed=2), np.zeros((4, 3)))
+
+    assert _blend(a, b, 0.0) is a
+    assert _blend(a, b, 1.0) is b
+
+
+def test_blend_halfway():
+    a = _transforms(np.array([_rotation_z(0.0)]), np.array([[0.0, 0.0, 0.0]]))
+    b = _transforms(np.array([_rotation_z(np.pi / 2) * 3.0]), np.array([[2.0, 4.0, 6.0]]))
+
+    blended = _blend(a, b, 0.5)
+
+    assert np.allclose(blended[0, :3, :3], _rotation_z(np.pi / 4) * 2.0)
+    assert np.allclose(blended[0, 3], [1.0, 2.0, 3.0, 1.0])
+
+
+def test_single_driver_is_offset_driver_parent_inverse():
+    inputs = _transforms(_random_rotations(6, seed=3), np.arange(18.0).reshape(6, 3)).reshape(3, 2, 4, 4)
+    offset = _transforms(_random_rotations(1, seed=4), [[1.0, 2.0, 3.0]])[0]
+    desc = ConstraintDesc(driven="ctrl", drivers=[0], offsets=[offset.ravel().tolist()], parent=1)
+
+    out = evaluate([desc], inputs, workers=1)
+
+    assert np.allclose(out[:, 0], offset @ inputs[:, 0] @ np.linalg.inv(inputs[:, 1]))
+
+
+def test_serial_and_process_pool_match():
+    frames, columns = 24, 4
+    rng = np.random.default_rng(5)
+    inputs = _transforms(
+        _random_rotations(frames * columns, seed=6),
+        rng.normal(size=(frames * columns, 3)),
+    ).reshape(frames, columns, 4, 4)
+    offset = _transforms(_random_rotations(1, seed=7), [[0.5, 0.0, -1.0]])[0].ravel().tolist()
+    descriptions = [
+        ConstraintDesc(driven="a", drivers=[0, 1], offsets=[offset], parent=3, weights=[1.0, 0.3]),
+        ConstraintDesc(driven="b", drivers=[2], weights=[0.6]),
+        ConstraintDesc(driven="c", drivers=[1, 2, 0], parent=0, weights=[1.0, 0.5, 0.25]),
+    ]
+
+    serial = evaluate(descriptions, inputs, workers=1)
+    pooled = evaluate(descriptions, inputs, workers=2)
+
+    assert serial.shape == (frames, len(descriptions), 4, 4)
+    assert np.allclose(serial, pooled)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+""" Tests of the typed node handles against the Maya stub """
+
+# ---------- IMPORT ----------
+
+from atlas_matrix.core.utils.handles import BlendMatrixHandle
+
+
+# ---------- TESTS ----------
+
+
+def test_plugs_are_named_once(scene):
+    blend = BlendMatrixHandle(scene.createNode("blendMatrix", name="blend1"))
+
+    assert blend.weight(0) == "blend1.target[0].weight"
+    assert blend.weight(0) is blend.weight(0)
+
+
+def test_plugs_follow_renames_and_namespaces(scene):
+    blend = BlendMatrixHandle(scene.createNode("blendMatrix", name="blend1"))
+    blend.output
+
+    scene.rename("blend1", "rig:blend1")
+
+    assert blend.name == "rig:blend1"
+    assert blend.output == "rig:blend1.outputMatrix"
+    assert blend.target(1) == "rig:blend1.target[1].targetMatrix"
+
+
+def test_deleted_node_keeps_its_last_name(scene):
+    blend = BlendMatrixHandle(scene.createNode("blendMatrix", name="blend1"))
+    scene.rename("blend1", "blend2")
+    blend.output
+    scene.delete("blend2")
+
+    assert blend.name == "blend2"
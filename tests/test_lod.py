@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+""" Tests of the constraint layer freeze against the Maya stub """
+
+# ---------- IMPORT ----------
+
+from atlas_matrix.core import lod
+from atlas_matrix.core.fanout_con import FanoutCon
+from atlas_matrix.core.utils import naming
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _rig(cmds):
+    cmds.createNode("transform", name="head")
+    cmds.createNode("transform", name="grp")
+    for name in ("hat", "glasses"):
+        cmds.createNode("transform", name=name, parent="grp")
+    FanoutCon("head", ["hat", "glasses"]).mount_system()
+    return naming.fanout_node_name("head", "grp")
+
+
+def _mult(cmds, driven):
+    return cmds.listConnections(f"{driven}.offsetParentMatrix", source=True, destination=False)
+
+
+# ---------- TESTS ----------
+
+
+def test_freeze_keeps_shared_nodes_of_live_constraints(scene):
+    shared = _rig(scene)
+    hat, glasses = _mult(scene, "hat")[0], _mult(scene, "glasses")[0]
+
+    assert lod.freeze(["hat"]) == ["hat"]
+
+    assert not _mult(scene, "hat")
+    assert scene.getAttr(f"{hat}.frozen")
+    assert scene.getAttr(f"{shared}.frozen") == 0
+    assert scene.getAttr(f"{glasses}.frozen") == 0
+    assert any(shared in warning for warning in scene.warnings)
+
+
+def test_freeze_everything_freezes_shared_nodes(scene):
+    shared = _rig(scene)
+
+    lod.freeze()
+
+    assert scene.getAttr(f"{shared}.frozen")
+    assert lod.is_frozen()
+    assert lod.unfreeze() == ["hat", "glasses"]
+    assert not scene.getAttr(f"{shared}.frozen")
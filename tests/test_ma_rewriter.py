@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+""" Tests of the offline Maya ASCII rewriter """
+
+# ---------- IMPORT ----------
+
+import os
+import shutil
+
+from atlas_matrix.offline.ma_rewriter import rewrite_file
+from atlas_matrix.offline.ma_scanner import scan_file
+
+
+# ---------- CONSTANTS ----------
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "constrained.ma")
+
+
+# ---------- TESTS ----------
+
+
+def _rewrite(tmp_path):
+    path = str(tmp_path / "constrained.ma")
+    shutil.copy(FIXTURE, path)
+    report = rewrite_file(path)
+    with open(path) as f:
+        return report, f.read()
+
+
+def test_removes_constraint_nodes(tmp_path):
+    report, text = _rewrite(tmp_path)
+
+    assert "error" not in report
+    assert report["restored"] == ["ctrl", "hand"]
+    assert "multmatrix_ctrl_pconstrainedby_space_a" in report["removed_nodes"]
+    assert "blendMatrix_ctrl_space_shifter" in report["removed_nodes"]
+    assert "pconstrainedby" not in text
+    assert "space_shifter" not in text
+
+
+def test_restores_offset_parent_matrix(tmp_path):
+    _, text = _rewrite(tmp_path)
+
+    assert 'setAttr ".opm" -type "matrix" 1 0 0 0 0 1 0 0 0 0 1 0 3 4 5 1;' in text
+    assert "0.5 1 0 1" not in text
+    assert "initialMatrix" not in text
+
+
+def test_restores_transform_and_keeps_channel_state(tmp_path):
+    _, text = _rewrite(tmp_path)
+    hand = text.split('createNode transform -n "hand";', 1)[1].split("createNode", 1)[0]
+
+    assert "initialTransform" not in hand
+    assert 'setAttr ".t" -type "double3" 2.5 0 0 ;' in hand
+    assert 'setAttr ".s" -type "double3" 3 1 1 ;' in hand
+    assert '".tx" 9' not in hand
+    assert 'setAttr -k off ".v";' in hand
+    # Channel state is applied once the values are written, a locked channel would refuse them
+    lines = [line.strip() for line in hand.splitlines()]
+    assert lines.index('setAttr -l on -k off ".sx";') > lines.index('setAttr ".s" -type "double3" 3 1 1 ;')
+    assert 'setAttr -l on ".sy";' in lines
+    assert 'setAttr -k on ".tx";' in lines
+
+
+def test_drops_weight_attributes_and_animation(tmp_path):
+    report, text = _rewrite(tmp_path)
+
+    assert '"ctrl.W0"' not in text
+    assert ".W1" not in text
+    assert "ctrl_W0" in report["removed_nodes"]
+    assert 'createNode animCurveTU -n "ctrl_W0"' not in text
+    # ctrl_W0.o -> ctrl.W0 and the 9 connections of the two constraint networks
+    assert report["removed_connections"] == 10
+
+
+def test_keeps_unrelated_weights(tmp_path):
+    _, text = _rewrite(tmp_path)
+
+    assert 'createNode animCurveTU -n "keep_W0"' in text
+    assert 'connectAttr "keep_W0.o" "keep.blendW";' in text
+    assert "space_a.t" not in text
+    assert 'createNode transform -n "space_a"' in text
+
+
+def test_rewritten_file_has_no_constraint(tmp_path):
+    _rewrite(tmp_path)
+    index = scan_file(str(tmp_path / "constrained.ma"))
+
+    assert index["constraints"] == []
+    assert index["atlas_node_count"] == 0
+    assert index["orphan_attributes"] == {}
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+""" Tests of the headless Maya ASCII scanner """
+
+# ---------- IMPORT ----------
+
+import os
+import shutil
+
+from atlas_matrix.offline.ma_scanner import (
+    collect_files,
+    parse_add_attr,
+    parse_connect_attr,
+    parse_create_node,
+    scan_file,
+    split_plug,
+)
+
+
+# ---------- CONSTANTS ----------
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "constrained.ma")
+
+
+# ---------- TESTS ----------
+
+
+def test_parse_statements():
+    assert parse_create_node('createNode multMatrix -n "mult1" -p "grp";') == ("multMatrix", "mult1", "grp")
+    assert parse_connect_attr('connectAttr "a.o" "b.opm";') == ("a.o", "b.opm")
+    assert parse_connect_attr('connectAttr "a.o";') is None
+    assert parse_add_attr('addAttr -ci true -sn "W0" -ln "W0" -at "float";') == "W0"
+    assert split_plug("|grp|ctrl.tgt[0].tmat") == ("ctrl", "tgt")
+
+
+def test_scan_indexes_constraint():
+    report = scan_file(FIXTURE)
+
+    assert "error" not in report
+    assert [constraint["driven"] for constraint in report["constraints"]] == ["ctrl", "hand"]
+    constraint = report["constraints"][0]
+    assert constraint["driven"] == "ctrl"
+    assert constraint["drivers"] == ["space_a", "space_b"]
+    assert constraint["parent"] is None
+    assert constraint["constraint_type"] == "parent"
+    assert constraint["node_count"] == 3
+    assert report["dangling"] == []
+    assert report["orphan_attributes"] == {}
+    assert report["constraints"][1]["drivers"] == ["space_b"]
+    assert report["atlas_node_count"] == 4
+
+
+def test_scan_reports_dangling_nodes(tmp_path):
+    path = tmp_path / "dangling.ma"
+    path.write_text(
+        'createNode multMatrix -n "multmatrix_ctrl_pconstrainedby_space_a";\n'
+        'createNode transform -n "ctrl";\n'
+        '\taddAttr -ci true -sn "W0" -ln "W0" -at "double";\n'
+    )
+    report = scan_file(str(path))
+
+    assert report["constraints"] == []
+    assert report["dangling"] == ["multmatrix_ctrl_pconstrainedby_space_a"]
+    assert report["orphan_attributes"] == {"ctrl": ["W0"]}
+
+
+def test_scan_missing_file_reports_error(tmp_path):
+    report = scan_file(str(tmp_path / "missing.ma"))
+
+    assert report["constraints"] == []
+    assert "error" in report
+
+
+def test_collect_files_walks_directories(tmp_path):
+    (tmp_path / "shots").mkdir()
+    shutil.copy(FIXTURE, str(tmp_path / "shots" / "a.ma"))
+    (tmp_path / "shots" / "notes.txt").write_text("")
+
+    assert collect_files([str(tmp_path)]) == [str(tmp_path / "shots" / "a.ma")]
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+""" Tests of the Maya-free matrix helpers """
+
+# ---------- IMPORT ----------
+
+import pytest
+
+from atlas_matrix.core.utils import matrix_math
+
+
+# ---------- CONSTANTS ----------
+
+
+# Rotation of 90 degrees about Z followed by a translation, row vectors
+ROTATE_TRANSLATE = [
+    0.0, 1.0, 0.0, 0.0,
+    -1.0, 0.0, 0.0, 0.0,
+    0.0, 0.0, 1.0, 0.0,
+    1.0, 2.0, 3.0, 1.0,
+]
+
+SCALE = [
+    2.0, 0.0, 0.0, 0.0,
+    0.0, 4.0, 0.0, 0.0,
+    0.0, 0.0, 0.5, 0.0,
+    0.0, 0.0, 0.0, 1.0,
+]
+
+
+# ---------- TESTS ----------
+
+
+def test_identity_is_a_new_list():
+    matrix = matrix_math.identity()
+    matrix[0] = 5.0
+
+    assert matrix_math.identity()[0] == 1.0
+    assert matrix_math.is_identity(matrix_math.identity())
+
+
+def test_mult_applies_left_matrix_first():
+    # Scale then move: the translation row is not scaled
+    product = matrix_math.mult(SCALE, ROTATE_TRANSLATE)
+
+    assert product[12:15] == [1.0, 2.0, 3.0]
+    assert product[0:3] == [0.0, 2.0, 0.0]
+    assert matrix_math.mult(ROTATE_TRANSLATE, matrix_math.IDENTITY) == ROTATE_TRANSLATE
+
+
+def test_inverse_round_trip():
+    matrix = matrix_math.mult(SCALE, ROTATE_TRANSLATE)
+
+    assert matrix_math.is_identity(matrix_math.mult(matrix, matrix_math.inverse(matrix)), 1e-12)
+    assert matrix_math.is_identity(matrix_math.mult(matrix_math.inverse(matrix), matrix), 1e-12)
+
+
+def test_inverse_of_singular_matrix_raises():
+    with pytest.raises(ValueError):
+        matrix_math.inverse([0.0] * 16)
+
+
+def test_is_identity_tolerance():
+    matrix = matrix_math.identity()
+    matrix[13] = 1e-6
+
+    assert not matrix_math.is_identity(matrix)
+    assert matrix_math.is_identity(matrix, tolerance=1e-5)
+
+
+def test_max_delta():
+    assert matrix_math.max_delta(ROTATE_TRANSLATE, ROTATE_TRANSLATE) == 0.0
+    assert matrix_math.max_delta(matrix_math.IDENTITY, ROTATE_TRANSLATE) == 3.0
+
+
+@pytest.mark.parametrize("weights, expected", [
+    ([1.0], [1.0]),
+    ([1.0, 1.0], [1.0, 0.5]),
+    ([1.0, 1.0, 1.0, 1.0], [1.0, 0.5, 1.0 / 3.0, 0.25]),
+    ([0.0, 2.0, 2.0], [0.0, 1.0, 0.5]),
+    ([0.0, 0.0], [0.0, 0.0]),
+])
+def test_layered_weights(weights, expected):
+    assert matrix_math.layered_weights(weights) == pytest.approx(expected)
+
+
+def test_layered_weights_reach_weighted_average():
+    # Blending each target over the previous result gives the normalized average
+    weights = [0.2, 0.5, 0.3]
+    values = [1.0, 4.0, 10.0]
+
+    result = 0.0
+    for value, weight in zip(values, matrix_math.layered_weights(weights)):
+        result += (value - result) * weight
+
+    assert result == pytest.approx(sum(v * w for v, w in zip(values, weights)) / sum(weights))
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+""" Tests of the Maya-free mirroring helpers """
+
+# ---------- IMPORT ----------
+
+import math
+
+import pytest
+
+from atlas_matrix.core.utils import matrix_math
+from atlas_matrix.core.utils.mirroring import (
+    MirrorRule,
+    build_lookup,
+    mirror_matrix,
+    mirror_offset,
+    reflect,
+    reflection,
+)
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _transform(angle_x, angle_y, angle_z, translation):
+    """Build a rotation X then Y then Z followed by a translation, row vectors."""
+    cx, sx = math.cos(angle_x), math.sin(angle_x)
+    cy, sy = math.cos(angle_y), math.sin(angle_y)
+    cz, sz = math.cos(angle_z), math.sin(angle_z)
+    rx = [1, 0, 0, 0, 0, cx, sx, 0, 0, -sx, cx, 0, 0, 0, 0, 1]
+    ry = [cy, 0, -sy, 0, 0, 1, 0, 0, sy, 0, cy, 0, 0, 0, 0, 1]
+    rz = [cz, sz, 0, 0, -sz, cz, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+    matrix = matrix_math.mult(matrix_math.mult(rx, ry), rz)
+    matrix[12:15] = translation
+    return matrix
+
+
+def _mirrored_world(world, axis, convention):
+    flip = reflection(axis)
+    local = flip if convention == "orientation" else (-1.0, -1.0, -1.0, 1.0)
+    return reflect(world, local, flip)
+
+
+# ---------- TESTS ----------
+
+
+def test_prefix_lookup_keeps_namespace():
+    lookup = build_lookup(["rig:L_hand", "L_arm", "spine", "L_arm"], MirrorRule())
+
+    assert lookup == {"rig:L_hand": "rig:R_hand", "L_arm": "R_arm"}
+
+
+def test_suffix_and_regex_lookup():
+    assert build_lookup(["hand_l", "l_hand"], MirrorRule("_l", "_r", mode="suffix")) == {"hand_l": "hand_r"}
+    assert build_lookup(["LeftHand"], MirrorRule("Left", "Right", mode="regex")) == {"LeftHand": "RightHand"}
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        MirrorRule(mode="infix").compile()
+
+
+def test_mirror_matrix_is_an_involution():
+    matrix = _transform(0.3, -0.7, 1.1, [1.0, 2.0, 3.0])
+
+    assert mirror_matrix(mirror_matrix(matrix, "y"), "y") == pytest.approx(matrix)
+    assert mirror_matrix(matrix, "x")[12:15] == pytest.approx([-1.0, 2.0, 3.0])
+
+
+def test_invalid_axis_and_convention_raise():
+    with pytest.raises(ValueError):
+        mirror_matrix(matrix_math.identity(), "w")
+    with pytest.raises(ValueError):
+        mirror_offset(matrix_math.identity(), "x", convention="world")
+
+
+@pytest.mark.parametrize("convention", ["orientation", "behaviour"])
+def test_mirrored_offset_matches_mirrored_pose(convention):
+    driven = _transform(0.4, 0.2, -0.9, [2.0, 1.0, -1.0])
+    driver = _transform(-0.3, 0.8, 0.1, [3.0, 0.5, 0.2])
+    offset = matrix_math.mult(driven, matrix_math.inverse(driver))
+
+    mirrored = mirror_offset(offset, "x", convention)
+    expected = matrix_math.mult(
+        _mirrored_world(driven, "x", convention),
+        matrix_math.inverse(_mirrored_world(driver, "x", convention)),
+    )
+    assert mirrored == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("convention", ["orientation", "behaviour"])
+def test_mirrored_offset_of_center_driver(convention):
+    # Rotating about the mirror axis at x=0 keeps the driver symmetric
+    driver = _transform(0.6, 0.0, 0.0, [0.0, 4.0, 1.0])
+    driven = _transform(0.4, 0.2, -0.9, [2.0, 1.0, -1.0])
+    offset = matrix_math.mult(driven, matrix_math.inverse(driver))
+
+    mirrored = mirror_offset(offset, "x", convention, center_driver=True)
+    expected = matrix_math.mult(_mirrored_world(driven, "x", convention), matrix_math.inverse(driver))
+    assert mirrored == pytest.approx(expected)
+
+
+def test_behaviour_keeps_rotation_and_negates_translation():
+    offset = _transform(0.4, 0.2, -0.9, [2.0, 1.0, -1.0])
+    mirrored = mirror_offset(offset, "x", "behaviour")
+
+    assert mirrored[:12] == pytest.approx(offset[:12])
+    assert mirrored[12:15] == pytest.approx([-2.0, -1.0, 1.0])
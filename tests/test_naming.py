@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+""" Tests of the node naming scheme """
+
+# ---------- IMPORT ----------
+
+from atlas_matrix.core.utils import naming
+from atlas_matrix.offline.ma_scanner import is_atlas_name
+
+
+# ---------- TESTS ----------
+
+
+def test_driver_name_joins_parts():
+    assert naming.driver_name("space") == "space"
+    assert naming.driver_name(["space", "chest"]) == "space_chest"
+
+
+def test_node_names():
+    assert naming.matrix_node_name("multMatrix", "ctrl", "pconstrainedby", "space") == "multmatrix_ctrl_pconstrainedby_space"
+    assert naming.matrix_node_name("aimMatrix", "eye", "aconstrainedby", ["look", "at"]) == "aimmatrix_eye_aconstrainedby_look_at"
+    assert naming.blend_node_name("ctrl") == "blendMatrix_ctrl_space_shifter"
+    assert naming.fanout_node_name("chest", "grp") == "multmatrix_chest_fanout_grp"
+    assert naming.identity_node_name("ctrl") == "composematrix_ctrl_identity_parent"
+    assert naming.weight_node_name("plusMinusAverage", "ctrl", 1) == "plusminusaverage_ctrl_pconstrainedby_weight1"
+    assert naming.aim_helper_name("holdMatrix", "eye", "rest") == "holdmatrix_eye_aim_rest"
+
+
+def test_node_names_are_found_by_the_scanner():
+    names = [
+        naming.matrix_node_name("multMatrix", "ctrl", "pconstrainedby", "space"),
+        naming.matrix_node_name("aimMatrix", "eye", "aconstrainedby", "target"),
+        naming.blend_node_name("ctrl"),
+        naming.fanout_node_name("chest", "grp"),
+        naming.identity_node_name("ctrl"),
+        naming.weight_node_name("condition", "ctrl", 0),
+        naming.aim_helper_name("holdMatrix", "eye", "rest"),
+        naming.aim_helper_name("multMatrix", "eye", "parent"),
+    ]
+
+    assert all(is_atlas_name(name) for name in names)
+
+
+def test_aim_helpers_are_not_named_after_a_driver():
+    for role in ("rest", "parent"):
+        name = naming.aim_helper_name("multMatrix", "eye", role)
+        assert "constrainedby" not in name
+        assert naming.is_aim_name(name)
+    assert not naming.is_aim_name(naming.matrix_node_name("multMatrix", "ctrl", "pconstrainedby", "rest"))
+
+
+def test_constraint_attributes():
+    assert all(naming.CONSTRAINT_ATTRIBUTE.match(name) for name in ("W0", "W12", "atlasWeights", "initialMatrix", "initialTransform"))
+    assert not any(naming.CONSTRAINT_ATTRIBUTE.match(name) for name in ("W", "Weight", "initialTranslateX", "blendW"))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+""" Tests of the ParentCon builder against the Maya stub """
+
+# ---------- IMPORT ----------
+
+import inspect
+
+from atlas_matrix.core import aim_con, chain_con, convert, fanout_con, index, parent_con
+from atlas_matrix.core.parent_con import ParentCon
+from atlas_matrix.core.utils import naming
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _rig(cmds):
+    for name in ("space_a", "space_b", "grp"):
+        cmds.createNode("transform", name=name)
+    cmds.createNode("transform", name="ctrl", parent="grp")
+
+
+# ---------- TESTS ----------
+
+
+def test_single_driver_connects_and_registers(scene):
+    _rig(scene)
+
+    ParentCon("ctrl", ["space_a"]).mount_system()
+
+    mult = naming.matrix_node_name("multMatrix", "ctrl", "pconstrainedby", "space_a")
+    assert scene.listConnections("ctrl.offsetParentMatrix", source=True, destination=False) == [mult]
+    assert scene.listConnections(f"{mult}.matrixIn[1]", source=True, plugs=True) == ["space_a.worldMatrix[0]"]
+    assert scene.listConnections(f"{mult}.matrixIn[2]", source=True, plugs=True) == ["grp.worldInverseMatrix[0]"]
+    assert index.list_indexed() == ["ctrl"]
+    assert scene.undo_depth == 0
+
+
+def test_many_drivers_build_the_space_shifter(scene):
+    _rig(scene)
+
+    ParentCon("ctrl", ["space_a", "space_b"]).mount_system()
+
+    blend = naming.blend_node_name("ctrl")
+    assert scene.listConnections("ctrl.offsetParentMatrix", source=True, destination=False) == [blend]
+    assert scene.getAttr(f"{blend}.target", multiIndices=True) == [0, 1]
+    assert scene.listConnections("ctrl.W1", source=False, plugs=True) == [f"{blend}.target[1].weight"]
+    assert index.list_indexed() == ["ctrl"]
+
+
+def test_cycle_is_rejected_before_any_node(scene):
+    _rig(scene)
+    before = scene.ls()
+
+    try:
+        ParentCon("grp", ["ctrl"]).mount_system()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("A driver below its driven must be rejected")
+    assert scene.ls() == before
+
+
+def test_builders_do_not_shadow_the_index_module():
+    for module in (parent_con, chain_con, aim_con, fanout_con, convert):
+        functions = [function for _, function in inspect.getmembers(module, inspect.isfunction)]
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            functions.extend(function for _, function in inspect.getmembers(cls, inspect.isfunction))
+        for function in functions:
+            if function.__module__ != module.__name__:
+                continue
+            assert "index" not in function.__code__.co_varnames, function.__qualname__
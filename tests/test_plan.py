@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+""" Tests of the pure-Python parent constraint planning """
+
+# ---------- IMPORT ----------
+
+import pytest
+
+from atlas_matrix.core.plan import Snapshot, plan_parent
+from atlas_matrix.core.utils import matrix_math
+
+
+# ---------- FUNCTIONS ----------
+
+
+def _translation(x, y, z):
+    matrix = matrix_math.identity()
+    matrix[12:15] = [x, y, z]
+    return matrix
+
+
+# ---------- TESTS ----------
+
+
+def test_plan_without_offset():
+    plan = plan_parent(Snapshot("ctrl", ["space"], _translation(1, 2, 3), [_translation(4, 5, 6)]))
+
+    assert plan.driven == "ctrl"
+    assert plan.drivers == ["space"]
+    assert plan.offset_matrices is None
+
+
+def test_plan_offset_keeps_world_pose():
+    driven_world = _translation(1, 2, 3)
+    driver_worlds = [_translation(4, 5, 6), _translation(-1, 0, 2)]
+    plan = plan_parent(Snapshot("ctrl", ["space_a", "space_b"], driven_world, driver_worlds), offset=True)
+
+    assert len(plan.offset_matrices) == 2
+    for offset, driver_world in zip(plan.offset_matrices, driver_worlds):
+        assert matrix_math.mult(offset, driver_world) == pytest.approx(driven_world)